@@ -1,51 +1,376 @@
-import platform
+import sys
 import time
+import importlib
 import threading
-from typing import List, Tuple, Union, Optional, Any
+import functools
+from collections import OrderedDict, deque
+from typing import List, Tuple, Union, Optional, Any, Callable, Generator
 
 
-class __Cache(dict):
-    '''class to cache data with a short shelf life'''
-    def __init__(self):
+class __Metrics:
+    '''
+    Collects cache, subprocess and latency statistics.
+    Disabled by default. While disabled, recording anything is a single attribute check
+    '''
+    def __init__(self, samples: int = 1024):
+        self.enabled = False
+        '''whether statistics are being recorded'''
+        self.samples = samples
+        '''how many of the most recent latencies to keep per backend method for calculating percentiles'''
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        '''discards all recorded statistics'''
+        with self._lock:
+            self._cache = {}
+            self._spawns = {}
+            self._latency = {}
+
+    def cache_event(self, namespace: str, event: str):
+        '''records a cache event ('hits', 'misses', 'stale' or 'evictions') for a namespace'''
+        with self._lock:
+            counts = self._cache.setdefault(namespace, {'hits': 0, 'misses': 0, 'stale': 0, 'evictions': 0})
+            counts[event] += 1
+
+    def spawn(self, executable: str):
+        '''records that a subprocess was spawned'''
+        with self._lock:
+            self._spawns[executable] = self._spawns.get(executable, 0) + 1
+
+    def timed(self, name: str) -> Callable:
+        '''
+        Returns a decorator that records how long each call to a function takes
+
+        Args:
+            name (str): the name the latencies are recorded under. EG: 'DDCUtil.get_brightness'
+        '''
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    with self._lock:
+                        latency = self._latency.get(name)
+                        if latency is None:
+                            latency = self._latency[name] = {
+                                'count': 0, 'total': 0.0, 'samples': deque(maxlen=self.samples)
+                            }
+                        latency['count'] += 1
+                        latency['total'] += elapsed
+                        latency['samples'].append(elapsed)
+            return wrapper
+        return decorator
+
+    def stats(self) -> dict:
+        '''returns a snapshot of all recorded statistics. See `stats`'''
+        with self._lock:
+            latency = {}
+            for name, data in self._latency.items():
+                samples = sorted(data['samples'])
+                latency[name] = {
+                    'count': data['count'],
+                    'total': data['total'],
+                    'mean': data['total'] / data['count']
+                }
+                for percentile in (50, 90, 99):
+                    # nearest-rank percentile over the most recent samples
+                    index = max(0, -(-percentile * len(samples) // 100) - 1)
+                    latency[name][f'p{percentile}'] = samples[index]
+            return {
+                'cache': {ns: dict(counts) for ns, counts in self._cache.items()},
+                'subprocess': dict(self._spawns),
+                'latency': latency
+            }
+
+
+class __Cache:
+    '''
+    Thread-safe, size-bounded cache for data with a short shelf life.
+
+    Every entry belongs to a namespace (eg: 'discovery', 'brightness', 'capabilities')
+    which decides how long the entry lives for unless told otherwise. Whole namespaces
+    can be invalidated at once and the least recently used entries are evicted
+    once `max_size` is reached.
+
+    Values are stored per key AND per set of args/kwargs, so variants of the same
+    key (eg: the same call with different kwargs) can be cached side by side.
+    '''
+    def __init__(self, max_size: int = 256):
         self.enabled = True
-        super().__init__()
+        '''whether cached values are returned at all'''
+        self.max_size = max_size
+        '''the maximum number of entries held before the least recently used are evicted'''
+        self.ttl = {
+            'default': 1,
+            'discovery': 1,
+            'brightness': 0.5,
+            'capabilities': 60
+        }
+        '''how long (in seconds) entries in each namespace live for'''
+        self._lock = threading.RLock()
+        # maps (key, args, kwargs) to entries, in least to most recently used order
+        self._data = OrderedDict()
+        # maps each key to all of its (key, args, kwargs) variants
+        self._variants = {}
+        # bumping a namespace's generation invalidates all of its entries in one step.
+        # Stale entries are dropped lazily when they are next accessed or evicted
+        self._generations = {}
+        # maps the (key, args, kwargs) of values currently being computed to the details of that call.
+        # Concurrent callers asking for the same value wait for that call instead of starting their own
+        self._inflight = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        try:
+            self.get(key)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _make_key(key: str, args: tuple, kwargs: dict) -> tuple:
+        '''internal function to combine a key and its args/kwargs into one hashable key'''
+        full_key = (key, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(full_key)
+        except TypeError:
+            full_key = (key, repr(args), repr(sorted(kwargs.items())))
+        return full_key
+
+    def _remove(self, full_key: tuple):
+        '''internal function to remove an entry. Must be called while holding the lock'''
+        if self._data.pop(full_key, None) is not None:
+            variants = self._variants[full_key[0]]
+            variants.discard(full_key)
+            if not variants:
+                del self._variants[full_key[0]]
+
+    def configure(self, namespace: str, ttl: float):
+        '''
+        Sets how long entries in a namespace live for
+
+        Args:
+            namespace (str): the namespace to configure
+            ttl (float): the time to live, in seconds
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            # keep DDC/CI monitor information for 5 minutes
+            sbc.__cache__.configure('capabilities', 300)
+            ```
+        '''
+        with self._lock:
+            self.ttl[namespace] = ttl
+
+    def get(self, key: str, *args, **kwargs) -> Any:
+        '''
+        Returns the value stored under `key` with the same `args` and `kwargs`
+
+        Raises:
+            Exception: if the cache is disabled
+            KeyError: if no matching value is present or it has expired
+        '''
+        if not self.enabled:
+            raise Exception('cache is disabled')
+        full_key = self._make_key(key, args, kwargs)
+        with self._lock:
+            value, expires, stored, namespace, generation = self._data[full_key]
+            if generation != self._generations.get(namespace, 0):
+                self._remove(full_key)
+                raise KeyError(key)
+            if time.time() >= expires:
+                # kept so that `fetch` can still serve it within `max_stale`
+                raise KeyError(key)
+            self._data.move_to_end(full_key)
+            return value
 
-    def __setitem__(self, key, value, *args, expires=1, **kwargs):
-        expires += time.time()
-        super().__setitem__(key, (value, expires, args, kwargs))
+    def peek(self, key: str, *args, **kwargs) -> Any:
+        '''
+        Returns the value stored under `key` with the same `args` and `kwargs`, even if it has expired.
+        Unlike `get`, this does not change the cache at all
 
-    def __getitem__(self, key, *args, **kwargs):
+        Raises:
+            Exception: if the cache is disabled
+            KeyError: if no matching value is present or it has been invalidated by `expire`
+        '''
         if not self.enabled:
-            raise Exception
-        value, expires, orig_args, orig_kwargs = super().__getitem__(key)
-        if time.time() < expires and orig_args == args and orig_kwargs == kwargs:
+            raise Exception('cache is disabled')
+        full_key = self._make_key(key, args, kwargs)
+        with self._lock:
+            value, expires, stored, namespace, generation = self._data[full_key]
+            if generation != self._generations.get(namespace, 0):
+                raise KeyError(key)
             return value
-        raise KeyError
 
-    def get(self, *args, **kwargs):
-        return self.__getitem__(*args, **kwargs)
+    def fetch(
+        self, key: str, func: Callable[[], Any], *args,
+        namespace: str = 'default', expires: float = None, max_stale: float = 0, **kwargs
+    ) -> Tuple[Any, float]:
+        '''
+        Returns the value stored under `key`, calling `func` to (re)compute it if needed.
+
+        If the stored value has expired but is no more than `max_stale` seconds old it is
+        returned straight away and `func` is called in a background thread to refresh it
+        (stale-while-revalidate). Beyond that age, `func` is called and waited for.
+
+        Only one call to `func` is made at a time for each key/args/kwargs combination.
+        Any concurrent callers wait for that call and share its result (or exception)
+
+        Args:
+            key (str): the key the value is stored under
+            func (callable): takes no arguments and returns a fresh value
+            args (tuple): identify this variant of the key. See `store`
+            namespace (str): the namespace the entry belongs to
+            expires (float): how long (in seconds) a fresh value lives for.
+                Defaults to the TTL of the namespace
+            max_stale (float): the maximum age (in seconds) of a value that may be returned
+                while it is being refreshed
+            kwargs (dict): identify this variant of the key. See `store`
+
+        Returns:
+            tuple: the value and its age in seconds
 
-    def store(self, *args, **kwargs):
-        return self.__setitem__(*args, **kwargs)
+        Example:
+            ```python
+            import screen_brightness_control as sbc
 
-    def expire(self, key=None, startswith=None, endswith=None):
-        if key is not None:
+            value, age = sbc.__cache__.fetch('my_key', lambda: 'my_value', expires=5)
+            ```
+        '''
+        if not self.enabled:
+            return func(), 0
+        full_key = self._make_key(key, args, kwargs)
+        with self._lock:
             try:
-                del(self[key])
-            except Exception:
+                value, expires_at, stored, ns, generation = self._data[full_key]
+            except KeyError:
                 pass
-        else:
-            for i in list(self.keys()):
-                cond1 = startswith is not None and i.startswith(startswith)
-                cond2 = endswith is not None and i.endswith(endswith)
-                if cond1 and cond2:
-                    del(self[i])
-                elif cond1:
-                    del(self[i])
-                elif cond2:
-                    del(self[i])
-                else:
-                    pass
+            else:
+                now = time.time()
+                if generation == self._generations.get(ns, 0):
+                    if now < expires_at:
+                        self._data.move_to_end(full_key)
+                        if __metrics__.enabled:
+                            __metrics__.cache_event(namespace, 'hits')
+                        return value, now - stored
+                    if now - stored <= max_stale:
+                        if __metrics__.enabled:
+                            __metrics__.cache_event(namespace, 'stale')
+                        flight, leader = self._join(full_key)
+                        if leader:
+                            threading.Thread(
+                                target=self._complete,
+                                args=(full_key, flight, func, args, namespace, expires, kwargs),
+                                daemon=True
+                            ).start()
+                        return value, now - stored
+            if __metrics__.enabled:
+                __metrics__.cache_event(namespace, 'misses')
+            flight, leader = self._join(full_key)
+
+        if leader:
+            self._complete(full_key, flight, func, args, namespace, expires, kwargs)
+        flight['done'].wait()
+        if 'error' in flight:
+            raise flight['error']
+        return flight['value'], 0
+
+    def _join(self, full_key: tuple) -> Tuple[dict, bool]:
+        '''
+        Internal function to join the in-flight computation of a value, or start a new one.
+        Must be called while holding the lock. Returns the call details and whether the caller
+        is the one responsible for completing it
+        '''
+        try:
+            return self._inflight[full_key], False
+        except KeyError:
+            flight = self._inflight[full_key] = {'done': threading.Event()}
+            return flight, True
+
+    def _complete(
+        self, full_key: tuple, flight: dict, func: Callable[[], Any],
+        args: tuple, namespace: str, expires: float, kwargs: dict
+    ):
+        '''internal function to compute and store a value for everyone waiting on it, see `fetch`'''
+        try:
+            flight['value'] = func()
+            self.store(full_key[0], flight['value'], *args, namespace=namespace, expires=expires, **kwargs)
+        except BaseException as e:
+            flight['error'] = e
+        finally:
+            with self._lock:
+                self._inflight.pop(full_key, None)
+            flight['done'].set()
+
+    def store(self, key: str, value: Any, *args, namespace: str = 'default', expires: float = None, **kwargs):
+        '''
+        Stores a value in the cache
+
+        Args:
+            key (str): the key to store the value under
+            value: the value to be stored
+            args (tuple): identify this variant of the key. `get` must be called with the same args
+            namespace (str): the namespace this entry belongs to
+            expires (float): how long (in seconds) this entry lives for.
+                Defaults to the TTL of the namespace
+            kwargs (dict): identify this variant of the key. `get` must be called with the same kwargs
+        '''
+        full_key = self._make_key(key, args, kwargs)
+        with self._lock:
+            if expires is None:
+                expires = self.ttl.get(namespace, self.ttl['default'])
+            now = time.time()
+            self._data[full_key] = (
+                value, now + expires, now, namespace, self._generations.get(namespace, 0)
+            )
+            self._data.move_to_end(full_key)
+            self._variants.setdefault(key, set()).add(full_key)
+            while len(self._data) > self.max_size:
+                oldest = next(iter(self._data))
+                if __metrics__.enabled:
+                    __metrics__.cache_event(self._data[oldest][3], 'evictions')
+                self._remove(oldest)
+
+    def expire(self, key: str = None, startswith: str = None, endswith: str = None, namespace: str = None):
+        '''
+        Removes entries from the cache
+
+        Args:
+            key (str): remove all variants of the entry stored under this key
+            startswith (str): remove all entries whose key starts with this
+            endswith (str): remove all entries whose key ends with this
+            namespace (str): remove all entries in this namespace
+        '''
+        with self._lock:
+            if key is not None:
+                for full_key in list(self._variants.get(key, ())):
+                    self._remove(full_key)
+            if namespace is not None:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            if startswith is not None or endswith is not None:
+                for i in list(self._variants.keys()):
+                    if (
+                        (startswith is None or i.startswith(startswith))
+                        and (endswith is None or i.endswith(endswith))
+                    ):
+                        for full_key in list(self._variants[i]):
+                            self._remove(full_key)
+
+    def clear(self):
+        '''removes every entry from the cache'''
+        with self._lock:
+            self._data.clear()
+            self._variants.clear()
 
 
 MONITOR_MANUFACTURER_CODES = {
@@ -116,21 +441,46 @@ MONITOR_MANUFACTURER_CODES = {
 }
 
 
+def _load_manufacturer_index() -> Tuple[dict, dict]:
+    '''
+    Internal function to build the manufacturer lookup tables, mapping lowercase codes and
+    lowercase names to `(code, name)` tuples.
+
+    The full PNP ID registry is read from the `pnp.ids.gz` file shipped with this package,
+    with `MONITOR_MANUFACTURER_CODES` taking precedence over it. Only called on the first lookup
+    '''
+    import gzip
+    import os
+
+    registry = {}
+    try:
+        with gzip.open(os.path.join(os.path.dirname(__file__), 'pnp.ids.gz'), 'rt', encoding='utf-8') as f:
+            for line in f:
+                code, name = line.rstrip('\n').split('\t', 1)
+                registry[code] = name
+    except Exception:
+        # fall back to the built in table
+        pass
+
+    codes, names = {}, {}
+    for table in (MONITOR_MANUFACTURER_CODES, registry):
+        for code, name in table.items():
+            # the first entry for each code/name wins, so the built in table overrides the registry
+            codes.setdefault(code.lower(), (code, name))
+            names.setdefault(name.lower(), codes[code.lower()])
+    return codes, names
+
+
 def _monitor_brand_lookup(search: str) -> Union[Tuple[str, str], None]:
-    '''internal function to search the monitor manufacturer codes dict'''
-    keys = list(MONITOR_MANUFACTURER_CODES.keys())
-    keys_lower = [i.lower() for i in keys]
-    values = list(MONITOR_MANUFACTURER_CODES.values())
-    values_lower = [i.lower() for i in values]
+    '''internal function to look up a monitor manufacturer by its 3 letter code or its name (case insensitive)'''
+    global _manufacturer_index
+    if _manufacturer_index is None:
+        with _manufacturer_index_lock:
+            if _manufacturer_index is None:
+                _manufacturer_index = _load_manufacturer_index()
+    codes, names = _manufacturer_index
     search_lower = search.lower()
-
-    if search_lower in keys_lower:
-        index = keys_lower.index(search_lower)
-    elif search_lower in values_lower:
-        index = values_lower.index(search_lower)
-    else:
-        return None
-    return keys[index], values[index]
+    return codes.get(search_lower) or names.get(search_lower)
 
 
 class ScreenBrightnessError(Exception):
@@ -154,15 +504,18 @@ class ScreenBrightnessError(Exception):
 
 class Monitor():
     '''A class to manage a single monitor and its relevant information'''
+    _info_keys = ('serial', 'name', 'method', 'manufacturer', 'manufacturer_id', 'model', 'index', 'edid')
+
     def __init__(self, display: Union[int, str, dict]):
         '''
         Args:
-            display (int or str): the index/name/model name/serial/edid of the display you wish to control.
-                Is passed to `filter_monitors` to decide which display to use
+            display (int, str or dict): the index/name/model name/serial/edid of the display you wish to control.
+                Is passed to `filter_monitors` to decide which display to use.
+                A complete info dict (eg: from `list_monitors_info`) is used as-is, without running discovery
 
         Raises:
             LookupError: if a matching display could not be found
-            TypeError: if the given display type is not int or str
+            TypeError: if the given display type is not int, str or dict
 
         Example:
             ```python
@@ -183,17 +536,24 @@ class Monitor():
             print(benq_monitor['name'])
             ```
         '''
-        monitors_info = list_monitors_info(allow_duplicates=True)
-        if isinstance(display, dict):
-            if display in monitors_info:
-                info = display
-            else:
-                info = filter_monitors(
-                    display=self.get_identifier(display),
-                    haystack=monitors_info
-                )[0]
+        # the discovery result that this monitor was found in. See `Monitor._call`
+        self._source = None
+        if isinstance(display, dict) and all(key in display for key in self._info_keys):
+            # a complete info dict (eg: from `list_monitors_info`) is used as-is, without running discovery
+            info = display
         else:
-            info = filter_monitors(display=display, haystack=monitors_info)[0]
+            monitors_info = self._source = list_monitors_info(allow_duplicates=True)
+            if isinstance(display, dict):
+                if display in monitors_info:
+                    info = display
+                else:
+                    info = filter_monitors(
+                        display=self.get_identifier(display)[1],
+                        haystack=monitors_info
+                    )[0]
+            else:
+                info = filter_monitors(display=display, haystack=monitors_info)[0]
+        self._info = info
 
         self.serial: str = info['serial']
         '''the serial number of the display or (if serial is not available) an ID assigned by the OS'''
@@ -224,6 +584,65 @@ class Monitor():
     def __getitem__(self, item: Any) -> Any:
         return getattr(self, item)
 
+    def _resolve(self, monitors: Optional[List[dict]] = None):
+        '''
+        Internal function to find this monitor again in a discovery result and
+        update the information (and therefore the address) held for it
+
+        Args:
+            monitors (list): the discovery result to search. If not given, discovery is run again
+
+        Raises:
+            LookupError: if the monitor cannot be found
+        '''
+        if monitors is None:
+            __cache__.expire(namespace='discovery')
+            # some methods keep their discovery results for longer (eg: `ddcutil_monitors_info` is a capability)
+            __cache__.expire(endswith='_monitors_info')
+            monitors = list_monitors_info(allow_duplicates=True)
+        key, value = self.get_identifier()
+        matches = [i for i in monitors if i[key] == value]
+        if key == 'index':
+            # indexes are method specific
+            matches = [i for i in matches if i['method'] == self.method]
+        if not matches:
+            raise LookupError('monitor could not be found')
+        # prefer the same method, but follow the monitor if it is now only addressable by another one
+        info = next((i for i in matches if i['method'] == self.method), matches[0])
+
+        self._source = monitors
+        self._info = info
+        for key, value in info.items():
+            if value is not None and key != 'brightness':
+                setattr(self, key, value)
+
+    def _call(self, meta_method: str, *args, **kwargs) -> Any:
+        '''
+        Internal function to call `get_brightness` or `set_brightness` on this monitor's method,
+        addressing the monitor by its info dict so the method does not have to run discovery.
+
+        The monitor is re-resolved if discovery has been re-run since it was last resolved
+        (the topology may have changed) or, once, if the call fails
+        '''
+        latest = _get_method()._cached_monitors_info()
+        if latest is not None and latest is not self._source:
+            try:
+                self._resolve(latest)
+            except LookupError:
+                self._source = latest
+
+        try:
+            result = getattr(self.method, meta_method)(*args, **kwargs, display=self._info)
+            if result == []:
+                raise LookupError('no value was returned for the monitor')
+            return result
+        except Exception as e:
+            try:
+                self._resolve()
+            except LookupError:
+                raise e
+            return getattr(self.method, meta_method)(*args, **kwargs, display=self._info)
+
     def get_identifier(self, monitor: dict = None) -> Tuple[str, Any]:
         '''
         Returns the piece of information used to identify this monitor.
@@ -265,8 +684,8 @@ class Monitor():
             primary.set_brightness(50)
             ```
         '''
-        kwargs['display'] = self.get_identifier()[1]
-        b = self.method.set_brightness(*args, **kwargs)
+        kwargs.pop('display', None)
+        b = self._call('set_brightness', *args, **kwargs)
         if b is not None:
             return b[0]
         return b
@@ -291,8 +710,8 @@ class Monitor():
             primary_brightness = primary.get_brightness()
             ```
         '''
-        kwargs['display'] = self.get_identifier()[1]
-        return self.method.get_brightness(**kwargs)[0]
+        kwargs.pop('display', None)
+        return self._call('get_brightness', **kwargs)[0]
 
     def fade_brightness(self, *args, **kwargs) -> Union[threading.Thread, int]:
         '''
@@ -349,7 +768,7 @@ class Monitor():
             info = primary.get_info()
             ```
         '''
-        return vars(self)
+        return {key: value for key, value in vars(self).items() if not key.startswith('_')}
 
     def is_active(self) -> bool:
         '''
@@ -416,12 +835,31 @@ def list_monitors_info(**kwargs) -> List[dict]:
             print('EDID:', monitor['edid'])
         ```
     '''
-    try:
-        return __cache__.get('monitors_info', **kwargs)
-    except Exception:
-        info = method.list_monitors_info(**kwargs)
-        __cache__.store('monitors_info', info, **kwargs)
-        return info
+    # the OS specific function caches the discovery result and derives any filtered views from it
+    return _get_method().list_monitors_info(**kwargs)
+
+
+def iter_monitors_info(**kwargs) -> Generator[dict, None, None]:
+    '''
+    Yields detailed information about each monitor as soon as it has been discovered,
+    instead of waiting for every method to finish like `list_monitors_info`
+
+    Args:
+        kwargs (dict): passed directly to OS relevant monitor iteration function
+
+    Yields:
+        dict: the same information as the dictionaries returned by `list_monitors_info`
+
+    Example:
+        ```python
+        import screen_brightness_control as sbc
+
+        for monitor in sbc.iter_monitors_info():
+            # each monitor can be used as soon as it is yielded
+            print(monitor['name'], sbc.get_brightness(display=monitor['name']))
+        ```
+    '''
+    yield from _get_method().iter_monitors_info(**kwargs)
 
 
 def list_monitors(**kwargs) -> List[str]:
@@ -444,6 +882,58 @@ def list_monitors(**kwargs) -> List[str]:
     return [i['name'] for i in list_monitors_info(**kwargs)]
 
 
+class _MonitorIndex:
+    '''
+    Internal class. An index of a list of monitors that lets `filter_monitors` find monitors in constant time.
+    Built once per list of monitors (and method) and reused until that list is replaced
+    '''
+
+    def __init__(self, monitors: List[dict], identifiers: List[str], method: Optional[str] = None):
+        '''
+        Args:
+            monitors (list): the monitors to index (EG: the return of `list_monitors_info`)
+            identifiers (list): the fields that monitors can be identified by, in order of preference
+            method (str): only index the monitors that use this method
+        '''
+        self.monitors = monitors
+        '''the list of monitors that was indexed'''
+        self.length = len(monitors)
+        '''the length of the list when it was indexed, used to detect if it has been modified since'''
+        self.unique = []
+        '''the monitors with duplicates removed. Monitors are duplicates if their first identifier is the same'''
+        self.lookup = {}
+        '''maps every identifier value to the first monitor that has it'''
+        seen = set()
+        for monitor in monitors:
+            if method is not None and method != monitor['method'].__name__.lower():
+                continue
+            values = [monitor.get(i) for i in identifiers]
+            values = [i for i in values if i is not None]
+            if not values:
+                continue
+            if values[0] not in seen:
+                seen.add(values[0])
+                self.unique.append(monitor)
+            for value in values:
+                self.lookup.setdefault(value, monitor)
+
+
+def _monitor_index(monitors: List[dict], identifiers: List[str], method: Optional[str] = None) -> _MonitorIndex:
+    '''internal function, returns the (cached) `_MonitorIndex` of a list of monitors or of those using a method'''
+    if method is not None:
+        method = method.lower()
+    key = (id(monitors), tuple(identifiers), method)
+    with _monitor_indexes_lock:
+        index = _monitor_indexes.get(key)
+        if index is None or index.monitors is not monitors or index.length != len(monitors):
+            index = _monitor_indexes[key] = _MonitorIndex(monitors, identifiers, method)
+        _monitor_indexes.move_to_end(key)
+        # the indexes hold references to their lists, so only keep the most recent few
+        while len(_monitor_indexes) > 16:
+            _monitor_indexes.popitem(last=False)
+        return index
+
+
 def filter_monitors(
     display: Optional[Union[int, str]] = None,
     haystack: Optional[list] = None,
@@ -482,44 +972,33 @@ def filter_monitors(
     '''
     # if we have been provided with a list of monitors to sift through then use that
     # otherwise, get the info ourselves
-    if haystack:
-        monitors_with_duplicates = haystack
-        if method is not None:
-            monitors_with_duplicates = [i for i in haystack if method.lower() == i['method'].__name__.lower()]
-    else:
-        monitors_with_duplicates = list_monitors_info(method=method, allow_duplicates=True)
-
     if display is not None and type(display) not in (str, int):
         raise TypeError(f'display kwarg must be int or str, not {type(display)}')
 
-    # This loop does two things: 1. Filters out duplicate monitors and 2. Matches the display kwarg (if applicable)
-    unique_identifiers = []
-    monitors = []
-    for monitor in monitors_with_duplicates:
-        # find a valid identifier for a monitor, excluding any which are equal to None
-        added = False
-        for identifier in ['edid', 'serial', 'name', 'model'] + include:
-            if monitor[identifier] is not None:
-                # check we haven't already added the monitor
-                if monitor[identifier] not in unique_identifiers:
-                    # check if the display kwarg (if str) matches this monitor
-                    if type(display) != str or (type(display) == str and monitor[identifier] == display):
-                        # if valid and monitor[identifier] not in unique_identifiers:
-                        if not added:
-                            monitors.append(monitor)
-                            unique_identifiers.append(monitor[identifier])
-                            added = True
-
-                        # if the display kwarg is an integer and we are currently at that index
-                        if type(display) is int and len(monitors) - 1 == display:
-                            return [monitor]
-                        if added:
-                            break
-                else:
-                    # if we have already added a monitor with the same identifier
-                    # then any info matching this monitor will match the other one
-                    # so exit the checking now
-                    break
+    # the index de-duplicates the monitors and maps each identifier to a monitor, so matching
+    # the display kwarg is a single lookup. It is only rebuilt when the list of monitors changes.
+    # Filtering by method happens inside the index, because a freshly filtered list would never be indexed already
+    identifiers = ['edid', 'serial', 'name', 'model'] + include
+    if haystack:
+        index = _monitor_index(haystack, identifiers, method)
+    else:
+        index = None
+        if method is not None:
+            # index the method's share of the cached discovery result rather than running discovery
+            cached = _get_method()._cached_monitors_info()
+            if cached is not None:
+                index = _monitor_index(cached, identifiers, method)
+        if index is None or not index.unique:
+            # nothing is cached or no monitors use the method (it could be invalid, which raises a ValueError)
+            index = _monitor_index(list_monitors_info(method=method, allow_duplicates=True), identifiers, method)
+    if type(display) is str:
+        monitors = [index.lookup[display]] if display in index.lookup else []
+    elif type(display) is int:
+        if 0 <= display < len(index.unique):
+            return [index.unique[display]]
+        monitors = []
+    else:
+        monitors = list(index.unique)
 
     # if no monitors matched the query OR if display kwarg was an int
     # if the latter and we made it this far then the int was out of range
@@ -561,6 +1040,46 @@ def flatten_list(thick_list: List[Any]) -> List[Any]:
     return flat_list
 
 
+def stats() -> dict:
+    '''
+    Returns the statistics recorded since they were enabled or last reset.
+    Statistics are only recorded after calling `enable_stats`
+
+    Returns:
+        dict: with the keys 'cache' (hits, misses, stale hits and evictions per cache namespace),
+            'subprocess' (the number of times each executable was spawned) and
+            'latency' (call count plus cumulative, mean and percentile latency in seconds per backend method)
+
+    Example:
+        ```python
+        import screen_brightness_control as sbc
+
+        sbc.enable_stats()
+        sbc.get_brightness()
+        print(sbc.stats()['subprocess'])
+        # EG output: {'xrandr': 2, 'ddcutil': 3, 'light': 1}
+        ```
+    '''
+    return __metrics__.stats()
+
+
+def enable_stats(enabled: bool = True):
+    '''
+    Turns the recording of statistics on or off. See `stats`
+
+    Args:
+        enabled (bool): whether statistics should be recorded
+    '''
+    __metrics__.enabled = enabled
+
+
+def reset_stats():
+    '''
+    Discards all recorded statistics. See `stats`
+    '''
+    __metrics__.reset()
+
+
 def set_brightness(
     value: Union[int, float, str],
     force: bool = False,
@@ -628,14 +1147,14 @@ def set_brightness(
 
     value = min(100, value)
 
-    if platform.system() == 'Linux':
+    if _system == 'Linux':
         if not force:
             value = max(1, value)
     else:
         value = max(0, value)
 
     try:
-        out = method.set_brightness(value, **kwargs)
+        out = _get_method().set_brightness(value, **kwargs)
         return out[0] if (isinstance(out, list) and len(out) == 1) else out
     except Exception as e:
         if verbose_error:
@@ -720,14 +1239,14 @@ def fade_brightness(
     except (IndexError, LookupError) as e:
         raise ScreenBrightnessError(f'{type(e).__name__} -> {e}')
     except ValueError as e:
-        if platform.system() == 'Linux' and ('method' in kwargs and kwargs['method'].lower() == 'xbacklight'):
-            available_monitors = [method.XBacklight]
+        if _system == 'Linux' and ('method' in kwargs and kwargs['method'].lower() == 'xbacklight'):
+            available_monitors = [_get_method().XBacklight]
         else:
             raise e
 
     for i in available_monitors:
         try:
-            if platform.system() == 'Linux' and ('method' in kwargs and kwargs['method'].lower() == 'xbacklight'):
+            if _system == 'Linux' and ('method' in kwargs and kwargs['method'].lower() == 'xbacklight'):
                 monitor = i
             else:
                 monitor = Monitor(i)
@@ -789,7 +1308,7 @@ def get_brightness(verbose_error: bool = False, **kwargs) -> Union[List[int], in
         ```
     '''
     try:
-        out = method.get_brightness(**kwargs)
+        out = _get_method().get_brightness(**kwargs)
         return out[0] if (type(out) == list and len(out) == 1) else out
     except Exception as e:
         if verbose_error:
@@ -800,19 +1319,46 @@ def get_brightness(verbose_error: bool = False, **kwargs) -> Union[List[int], in
     raise ScreenBrightnessError(f'Cannot get screen brightness: {error}')
 
 
+__metrics__ = __Metrics()
+_monitor_indexes = OrderedDict()
+_monitor_indexes_lock = threading.Lock()
+_manufacturer_index = None
+_manufacturer_index_lock = threading.Lock()
 __cache__ = __Cache()
-plat = platform.system()
-if plat == 'Windows':
-    from . import windows
-    method = windows
-elif plat == 'Linux':
-    from . import linux
-    method = linux
-elif plat == 'Darwin':
+if sys.platform.startswith('win'):
+    _system = 'Windows'
+elif sys.platform.startswith('linux'):
+    _system = 'Linux'
+elif sys.platform == 'darwin':
     raise NotImplementedError('MAC is not yet supported')
 else:
-    raise NotImplementedError(f'{plat} is not yet supported')
-del(plat)
+    raise NotImplementedError(f'{sys.platform} is not yet supported')
+
+
+def _get_method():
+    '''
+    Internal function to return the module for the current platform (`windows` or `linux`).
+    The module (and everything it depends on) is only imported on first use
+    '''
+    global method
+    try:
+        return method
+    except NameError:
+        method = importlib.import_module('.' + _system.lower(), __name__)
+        return method
+
+
+def __getattr__(name: str) -> Any:
+    # module level `__getattr__` (Python 3.7+) lets `sbc.method`, `sbc.linux` and `sbc.windows`
+    # import the platform module when they are first accessed
+    if name in ('method', _system.lower()):
+        return _get_method()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+if sys.version_info < (3, 7):
+    # module level `__getattr__` is not supported, so the platform module is imported straight away
+    _get_method()
 
 __version__ = '0.8.0'
 __author__ = 'Crozzers'
@@ -19,13 +19,20 @@ if __name__ == '__main__':
     if platform.system() == 'Windows':
         mthd = ('wmi', 'vcp')
     elif platform.system() == 'Linux':
-        mthd = ('xrandr', 'ddcutil', 'light', 'xbacklight')
+        mthd = ('xrandr', 'ddcutil', 'sysfs', 'light', 'xbacklight')
     parser.add_argument('-m', '--method', type=str, help=f'specify which method to use ({" or ".join(mthd)})')
     parser.add_argument('-l', '--list', action='store_true', help='list all monitors')
     parser.add_argument('-v', '--verbose', action='store_true', help='some messages will be more detailed')
     parser.add_argument('-V', '--version', action='store_true', help='print the current version')
+    if platform.system() == 'Linux':
+        parser.add_argument(
+            '-c', '--cache', action='store_true',
+            help='store monitor information on disk and reuse it until the display topology changes'
+        )
 
     args = parser.parse_args()
+    if platform.system() == 'Linux' and args.cache:
+        SBC.linux.TopologyCache.enabled = True
     if args.display is not None:
         if type(args.display) not in (str, int):
             raise TypeError('display arg must be str or int')
@@ -1,8 +1,14 @@
-import subprocess
 import os
 import struct
-from . import flatten_list, _monitor_brand_lookup, filter_monitors, __cache__
-from typing import List, Tuple, Union, Optional
+import contextlib
+import glob
+import threading
+import time
+from . import flatten_list, _monitor_brand_lookup, filter_monitors, __cache__, __metrics__
+from typing import List, Tuple, Union, Optional, Generator, Any, Dict, NamedTuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import subprocess
 
 
 class _EDID:
@@ -90,6 +96,233 @@ class _EDID:
         return name, serial
 
 
+class TopologyCache:
+    '''
+    An opt-in, on-disk cache of monitor information that is shared between processes.
+
+    Monitors are stored keyed by their EDID alongside a fingerprint of the display topology
+    (the connectors in `/sys/class/drm` and their DDC buses, the devices in `/sys/class/backlight`
+    and the I2C buses in `/dev`).
+    Stored information is only used while that fingerprint still matches, so discovery is only
+    re-run when monitors are actually plugged in, unplugged or swapped.
+
+    Example:
+        ```python
+        import screen_brightness_control as sbc
+
+        sbc.linux.TopologyCache.enabled = True
+        # the first call runs discovery as normal. Later calls (even from other processes)
+        # will skip it until the display topology changes
+        print(sbc.list_monitors())
+        ```
+    '''
+
+    enabled = False
+    '''whether monitor information should be read from and written to disk'''
+    path = os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+        'screen_brightness_control', 'topology.json'
+    )
+    '''the file that the cache is stored in'''
+    drm_dir = '/sys/class/drm'
+    '''the directory that DRM connectors are read from when fingerprinting the topology'''
+
+    @staticmethod
+    def fingerprint() -> Union[str, None]:
+        '''
+        Returns a hash of the current display topology.
+        This only involves reading a few small files from sysfs
+
+        Returns:
+            str: the hash
+            None: if `/sys/class/drm` is not available
+        '''
+        import hashlib
+
+        drm_dir = TopologyCache.drm_dir
+        if not os.path.isdir(drm_dir):
+            return None
+        fingerprint = hashlib.sha1()
+        for connector in sorted(os.listdir(drm_dir)):
+            try:
+                with open(os.path.join(drm_dir, connector, 'status'), 'rb') as f:
+                    status = f.read().strip()
+            except OSError:
+                # not a connector (eg: 'card0' or 'version')
+                continue
+            fingerprint.update(connector.encode() + b':' + status + b';')
+            # I2C buses are numbered in the order their drivers load, so the same
+            # connector can end up on a different bus after a reboot or driver reload
+            try:
+                fingerprint.update(os.readlink(os.path.join(drm_dir, connector, 'ddc')).encode() + b';')
+            except OSError:
+                pass
+            if status == b'connected':
+                try:
+                    with open(os.path.join(drm_dir, connector, 'edid'), 'rb') as f:
+                        fingerprint.update(f.read())
+                except OSError:
+                    pass
+        if os.path.isdir('/sys/class/backlight'):
+            fingerprint.update(','.join(sorted(os.listdir('/sys/class/backlight'))).encode())
+        fingerprint.update(','.join(sorted(glob.glob('/dev/i2c-*'))).encode())
+        return fingerprint.hexdigest()
+
+    @staticmethod
+    def load(method: str) -> Union[List[dict], None]:
+        '''
+        Returns the stored monitor information for a method
+
+        Args:
+            method (str): the method to load information for. EG: 'ddcutil' or 'light'
+
+        Returns:
+            list: list of dicts
+            None: if the cache is disabled, empty, out of date or unreadable
+        '''
+        import json
+
+        if not TopologyCache.enabled:
+            return None
+        try:
+            with open(TopologyCache.path, 'r') as f:
+                data = json.load(f)
+            if data['fingerprint'] is None or data['fingerprint'] != TopologyCache.fingerprint():
+                return None
+            monitors = sorted(data['monitors'][method].values(), key=lambda i: i['index'])
+            for monitor in monitors:
+                monitor['method'] = globals()[monitor['method']]
+            return monitors
+        except Exception:
+            return None
+
+    @staticmethod
+    def save(method: str, monitors: List[dict]):
+        '''
+        Stores the monitor information for a method.
+        Nothing is stored if any of the monitors lack a unique EDID
+
+        Args:
+            method (str): the method the information belongs to. EG: 'ddcutil' or 'light'
+            monitors (list): the monitor information, as returned by that method's `get_display_info`
+        '''
+        import json
+
+        if not TopologyCache.enabled:
+            return
+        try:
+            fingerprint = TopologyCache.fingerprint()
+            if fingerprint is None:
+                return
+            entries = {}
+            for monitor in monitors:
+                if monitor['edid'] is None or monitor['edid'] in entries:
+                    return
+                entries[monitor['edid']] = dict(monitor, method=monitor['method'].__name__)
+
+            try:
+                with open(TopologyCache.path, 'r') as f:
+                    data = json.load(f)
+                if data['fingerprint'] != fingerprint:
+                    raise ValueError
+            except Exception:
+                data = {'fingerprint': fingerprint, 'monitors': {}}
+            data['monitors'][method] = entries
+            _write_json(TopologyCache.path, data)
+        except Exception:
+            pass
+
+
+def _write_json(path: str, data: Any):
+    '''
+    internal function, writes data to a JSON file. The data is written to a temporary file
+    that is then swapped in, so that other processes never see a partial file
+
+    Args:
+        path (str): the file to write to. Any missing directories are created
+        data: the data to write
+    '''
+    import json
+    import tempfile
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+
+def _run(cmd: List[str], **kwargs) -> 'subprocess.CompletedProcess':
+    '''internal function, calls `subprocess.run` and records the spawn in the stats'''
+    import subprocess
+
+    if __metrics__.enabled:
+        __metrics__.spawn(os.path.basename(cmd[0]))
+    return subprocess.run(cmd, **kwargs)
+
+
+def _check_output(cmd: List[str], **kwargs) -> bytes:
+    '''internal function, calls `subprocess.check_output` and records the spawn in the stats'''
+    import subprocess
+
+    if __metrics__.enabled:
+        __metrics__.spawn(os.path.basename(cmd[0]))
+    return subprocess.check_output(cmd, **kwargs)
+
+
+def _verify_brightness(key: str, read, written: int):
+    '''
+    Internal function. Re-reads a brightness value that was written through to the cache
+    in a background thread and corrects the cache if the monitor disagrees
+
+    Args:
+        key (str): the cache key the brightness value is stored under
+        read (callable): takes no arguments and returns the actual brightness value
+        written (int): the value that was written through to the cache
+    '''
+    def verify():
+        try:
+            value = read()
+        except Exception:
+            __cache__.expire(key)
+            return
+        try:
+            # a newer value may have been written in the meantime. Don't overwrite it
+            if __cache__.get(key) != written:
+                return
+        except Exception:
+            pass
+        __cache__.store(key, value, namespace='brightness')
+
+    threading.Thread(target=verify, daemon=True).start()
+
+
+def _read_edid(path: str) -> Union[str, None]:
+    '''
+    internal function, reads an EDID file from sysfs (EG: `/sys/class/drm/card0-DP-1/edid`)
+
+    Args:
+        path (str): the path to the EDID file
+
+    Returns:
+        str: the first 128 bytes of the EDID as a hex string (formatted as: '00ffffff00...')
+        None: if the file cannot be read or does not contain a full EDID block
+    '''
+    try:
+        with open(path, 'rb') as f:
+            edid = f.read(128)
+    except OSError:
+        return None
+    if len(edid) < 128:
+        return None
+    return edid.hex()
+
+
 class Light:
     '''collection of screen brightness related methods using the light executable'''
 
@@ -124,10 +357,21 @@ class Light:
             edp_info = sbc.linux.Light.get_display_info('edp-backlight')[0]
             ```
         '''
-        try:
-            displays = __cache__.get('light_monitors_info')
-        except Exception:
-            res = subprocess.run([Light.executable, '-L'], stdout=subprocess.PIPE).stdout.decode().split('\n')
+        displays = __cache__.fetch('light_monitors_info', Light._query_display_info, namespace='discovery')[0]
+
+        if display is not None:
+            displays = filter_monitors(display=display, haystack=displays, include=['path', 'light_path'])
+        return displays
+
+    @staticmethod
+    @__metrics__.timed('Light._query_display_info')
+    def _query_display_info() -> List[dict]:
+        '''internal function, gathers the display info without caching. Use `Light.get_display_info` instead'''
+        import subprocess
+
+        displays = TopologyCache.load('light')
+        if displays is None:
+            res = _run([Light.executable, '-L'], stdout=subprocess.PIPE).stdout.decode().split('\n')
             displays = []
             count = 0
             for r in res:
@@ -148,24 +392,16 @@ class Light:
                         }
                         count += 1
                         try:
-                            out = subprocess.check_output(
-                                ['hexdump', tmp['path'] + '/device/edid'],
-                                stderr=subprocess.DEVNULL
-                            ).decode().split('\n')
-                            # either the hexdump reports each hex char backwards (ff00 instead of 00ff)
-                            # or both xrandr and ddcutil do. So I swap these bits around
-                            edid = ''
-                            for line in out:
-                                for i in line.split(' '):
-                                    if len(i) == 4:
-                                        edid += i[2:] + i[:2]
+                            edid = _read_edid(tmp['path'] + '/device/edid')
                             tmp['edid'] = edid
                             name, serial = _EDID.parse_edid(edid)
                             if name is not None:
                                 tmp['serial'] = serial
                                 tmp['name'] = name
                             try:
-                                tmp['manufacturer_id'], tmp['manufacturer'] = _monitor_brand_lookup(name.split(' ')[0])
+                                tmp['manufacturer_id'], tmp['manufacturer'] = _monitor_brand_lookup(
+                                    name.split(' ')[0]
+                                )
                             except Exception:
                                 tmp['manufacturer'] = name.split(' ')[0]
                                 tmp['manufacturer_id'] = None
@@ -173,10 +409,7 @@ class Light:
                         except Exception:
                             pass
                         displays.append(tmp)
-            __cache__.store('light_monitors_info', displays)
-
-        if display is not None:
-            displays = filter_monitors(display=display, haystack=displays, include=['path', 'light_path'])
+            TopologyCache.save('light', displays)
         return displays
 
     @staticmethod
@@ -198,21 +431,29 @@ class Light:
         return [i['name'] for i in Light.get_display_info()]
 
     @staticmethod
+    @__metrics__.timed('Light.set_brightness')
     def set_brightness(
         value: int,
-        display: Optional[Union[int, str]] = None,
-        no_return: bool = False
+        display: Optional[Union[int, str, dict]] = None,
+        no_return: bool = False,
+        write_through: bool = False,
+        verify: bool = False
     ) -> Union[List[int], None]:
         '''
         Sets the brightness for a display using the light executable
 
         Args:
             value (int): Sets the brightness to this value
-            display (int or str): The specific display you wish to query.
+            display (int, str or dict): The specific display you wish to query.
                 Can be index, name, model, serial, path or edid string.
                 `int` is faster as it isn't passed to `filter_monitors` to be matched against.
                 `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
             no_return (bool): if True, this function returns None
+            write_through (bool): if True, successfully written values are cached as the
+                current brightness and returned without reading them back from the display
+            verify (bool): if True (and `write_through` is True), the written values are read back
+                in a background thread and the cache is corrected if the display disagrees
 
         Returns:
             list: list of ints (0 to 100) (the result of `Light.get_brightness`)
@@ -232,26 +473,50 @@ class Light:
             sbc.linux.Light.set_brightness(75, display = 'edp-backlight')
             ```
         '''
-        info = Light.get_display_info()
-        if display is not None:
-            if type(display) == int:
-                info = [info[display]]
-            else:
-                info = filter_monitors(display=display, haystack=info, include=['path', 'light_path'])
+        if isinstance(display, dict):
+            info = [display]
+        else:
+            info = Light.get_display_info()
+            if display is not None:
+                if type(display) == int:
+                    info = [info[display]]
+                else:
+                    info = filter_monitors(display=display, haystack=info, include=['path', 'light_path'])
         for i in info:
-            subprocess.call(f'{Light.executable} -S {value} -s {i["light_path"]}'.split(" "))
+            key = f'light_{i["light_path"]}_brightness'
+            __cache__.expire(key)
+            returncode = _run(f'{Light.executable} -S {value} -s {i["light_path"]}'.split(" ")).returncode
+            if write_through and returncode == 0:
+                __cache__.store(key, value, namespace='brightness')
+                if verify:
+                    _verify_brightness(key, lambda path=i['light_path']: Light._read_brightness(path), value)
         return Light.get_brightness(display=display) if not no_return else None
 
     @staticmethod
-    def get_brightness(display: Optional[Union[int, str]] = None) -> List[int]:
+    def _read_brightness(light_path: str) -> int:
+        '''internal function, reads the brightness of a display from light, bypassing the cache'''
+        return int(round(float(_check_output([Light.executable, '-G', '-s', light_path]).decode()), 0))
+
+    @staticmethod
+    @__metrics__.timed('Light.get_brightness')
+    def get_brightness(
+        display: Optional[Union[int, str, dict]] = None,
+        max_stale: float = 0,
+        with_age: bool = False
+    ) -> Union[List[int], List[Tuple[int, float]]]:
         '''
         Sets the brightness for a display using the light executable
 
         Args:
-            display (int or str): The specific display you wish to query.
+            display (int, str or dict): The specific display you wish to query.
                 Can be index, name, model, serial, path or edid string.
                 `int` is faster as it isn't passed to `filter_monitors` to be matched against.
                 `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
+            max_stale (float): if a cached reading has expired but is no more than this many seconds old,
+                it is returned immediately and refreshed in the background
+            with_age (bool): if True, each value is returned as a tuple of the brightness
+                and the age (in seconds) of that reading
 
         Returns:
             list: list of ints (0 to 100)
@@ -270,204 +535,964 @@ class Light:
             edp_brightness = sbc.linux.Light.get_brightness(display = 'edp-backlight')[0]
             ```
         '''
-        info = Light.get_display_info()
-        if display is not None:
-            if type(display) == int:
-                info = [info[display]]
-            else:
-                info = filter_monitors(display=display, haystack=info, include=['path', 'light_path'])
+        if isinstance(display, dict):
+            info = [display]
+        else:
+            info = Light.get_display_info()
+            if display is not None:
+                if type(display) == int:
+                    info = [info[display]]
+                else:
+                    info = filter_monitors(display=display, haystack=info, include=['path', 'light_path'])
         results = []
         for i in info:
-            results.append(
-                subprocess.check_output(
-                    [
-                        Light.executable, '-G', '-s', i['light_path']
-                    ]
-                )
+            value, age = __cache__.fetch(
+                f'light_{i["light_path"]}_brightness',
+                lambda path=i['light_path']: Light._read_brightness(path),
+                namespace='brightness', max_stale=max_stale
             )
-        results = [int(round(float(str(i)), 0)) for i in results]
+            results.append((value, age) if with_age else value)
         return results
 
 
-class XBacklight:
-    '''collection of screen brightness related methods using the xbacklight executable'''
+class SysFS:
+    '''collection of screen brightness related methods using the backlight files in `/sys/class/backlight`'''
 
-    executable = 'xbacklight'
-    '''the xbacklight executable to be called'''
+    backlight_dir = '/sys/class/backlight'
+    '''the directory that backlight devices are read from'''
+    _handles = {}
+    '''internal. Maps device paths to a tuple of an open brightness file descriptor,
+    whether it is writable and the device's max brightness'''
+    _handles_lock = threading.Lock()
+    _device_locks = {}
+    '''internal. Maps device paths to a lock that is held while that device's file descriptor is
+    opened, used or closed, so that one thread cannot close a descriptor that another is using'''
 
     @staticmethod
-    def set_brightness(value: int, no_return: bool = False, **kwargs) -> Union[int, None]:
+    def get_display_info(display: Optional[Union[int, str]] = None) -> List[dict]:
         '''
-        Sets the screen brightness to a supplied value
+        Returns information about the backlight devices in `SysFS.backlight_dir`
 
         Args:
-            no_return (bool): if True, this function returns None
-                Returns the result of `XBacklight.get_brightness()` otherwise
+            display (str or int): [*Optional*] The monitor to return info about.
+                Pass in the serial number, name, model, path, edid or index.
+                This is passed to `filter_monitors`
 
         Returns:
-            int: from 0 to 100
-            None: if `no_return` is set to `True`
+            list: list of dicts
 
         Example:
             ```python
             import screen_brightness_control as sbc
 
-            # set the brightness to 100%
-            sbc.linux.XBacklight.set_brightness(100)
+            # get info about all monitors
+            info = sbc.linux.SysFS.get_display_info()
+            # EG output: [{'name': 'edp-backlight', 'path': '/sys/class/backlight/edp-backlight', edid': '00ffff...'}]
+
+            # get info about the primary monitor
+            primary_info = sbc.linux.SysFS.get_display_info(0)[0]
+
+            # get info about a monitor called 'edp-backlight'
+            edp_info = sbc.linux.SysFS.get_display_info('edp-backlight')[0]
             ```
         '''
-        subprocess.call([XBacklight.executable, '-set', str(value)])
-        return XBacklight.get_brightness() if not no_return else None
+        displays = __cache__.fetch('sysfs_monitors_info', SysFS._query_display_info, namespace='discovery')[0]
+
+        if display is not None:
+            displays = filter_monitors(display=display, haystack=displays, include=['path'])
+        return displays
 
     @staticmethod
-    def get_brightness(**kwargs) -> int:
+    @__metrics__.timed('SysFS._query_display_info')
+    def _query_display_info() -> List[dict]:
+        '''internal function, gathers the display info without caching. Use `SysFS.get_display_info` instead'''
+        if not os.path.isdir(SysFS.backlight_dir):
+            return []
+        devices = []
+        for device in sorted(os.listdir(SysFS.backlight_dir)):
+            path = os.path.join(SysFS.backlight_dir, device)
+            if not all(os.path.isfile(os.path.join(path, i)) for i in ('brightness', 'max_brightness')):
+                continue
+            # devices that cannot be written to are left out so that another method (eg: light)
+            # is used for the panel instead, rather than this one shadowing it and then failing
+            if not os.access(os.path.join(path, 'brightness'), os.W_OK):
+                continue
+            try:
+                with open(os.path.join(path, 'type'), 'r') as f:
+                    device_type = f.read().strip()
+            except OSError:
+                device_type = None
+            devices.append((device, path, _read_edid(os.path.join(path, 'device', 'edid')), device_type))
+        # firmware interfaces (eg: acpi_video0) often control the same panel as the GPU's own device.
+        # Those lack an EDID, so only use them when there is nothing better
+        if any(i[2] is not None for i in devices):
+            devices = [i for i in devices if i[2] is not None]
+        else:
+            # without EDIDs there is no telling which devices control the same panel, so only keep devices of
+            # the most preferred type, as recommended by the kernel's sysfs ABI (firmware > platform > raw)
+            for device_type in ('firmware', 'platform', 'raw'):
+                if any(i[3] == device_type for i in devices):
+                    devices = [i for i in devices if i[3] == device_type]
+                    break
+
+        displays = []
+        for count, (device, path, edid, _) in enumerate(devices):
+            tmp = {
+                'name': device,
+                'path': path,
+                'method': SysFS,
+                'index': count,
+                'model': None,
+                'serial': None,
+                'manufacturer': None,
+                'manufacturer_id': None,
+                'edid': edid
+            }
+            try:
+                name, serial = _EDID.parse_edid(edid)
+                if name is not None:
+                    tmp['serial'] = serial
+                    tmp['name'] = name
+                try:
+                    tmp['manufacturer_id'], tmp['manufacturer'] = _monitor_brand_lookup(name.split(' ')[0])
+                except Exception:
+                    tmp['manufacturer'] = name.split(' ')[0]
+                    tmp['manufacturer_id'] = None
+                tmp['model'] = name.split(' ')[1]
+            except Exception:
+                pass
+            displays.append(tmp)
+
+        # close the handles of any devices that have been removed
+        with SysFS._handles_lock:
+            removed = [i for i in SysFS._handles if i not in [j['path'] for j in displays]]
+        SysFS._close_handles(removed)
+        return displays
+
+    @staticmethod
+    def get_display_names() -> List[str]:
         '''
-        Returns the screen brightness as reported by xbacklight
+        Returns the names of each display, as reported by sysfs
 
         Returns:
-            int: from 0 to 100
+            list: list of strings
 
         Example:
             ```python
             import screen_brightness_control as sbc
 
-            current_brightness = sbc.linux.XBacklight.get_brightness()
+            names = sbc.linux.SysFS.get_display_names()
+            # EG output: ['edp-backlight']
             ```
         '''
-        res = subprocess.run(
-            [XBacklight.executable, '-get'],
-            stdout=subprocess.PIPE
-        ).stdout.decode()
-        return int(round(float(str(res)), 0))
-
-
-class XRandr:
-    '''collection of screen brightness related methods using the xrandr executable'''
-
-    executable = 'xrandr'
-    '''the xrandr executable to be called'''
+        return [i['name'] for i in SysFS.get_display_info()]
 
     @staticmethod
-    def get_display_info(display: Optional[Union[int, str]] = None) -> List[dict]:
+    def _get_handle(path: str, write: bool = False) -> Tuple[int, int]:
         '''
-        Returns info about all detected monitors as reported by xrandr
+        internal function, returns an open file descriptor for a device's brightness file
+        and the device's max brightness. These are kept open between calls so that reads
+        and writes only take a single syscall.
+        The device's lock (see `SysFS._device_lock`) must be held until the descriptor is no longer in use
 
         Args:
-            display (str or int): [*Optional*] The monitor to return info about.
-                Pass in the serial number, name, model, interface, edid or index.
-                This is passed to `filter_monitors`
+            path (str): the path to the backlight device
+            write (bool): whether the file descriptor must be writable
 
         Returns:
-            list: list of dicts
+            tuple: the file descriptor and the max brightness
+        '''
+        with SysFS._handles_lock:
+            if path in SysFS._handles:
+                fd, writable, max_brightness = SysFS._handles[path]
+                if writable or not write:
+                    return fd, max_brightness
+                os.close(fd)
+                del SysFS._handles[path]
+
+            with open(os.path.join(path, 'max_brightness'), 'r') as f:
+                max_brightness = int(f.read().strip())
+            try:
+                fd, writable = os.open(os.path.join(path, 'brightness'), os.O_RDWR), True
+            except PermissionError:
+                if write:
+                    raise
+                # reading does not require root, so fall back to a read-only handle
+                fd, writable = os.open(os.path.join(path, 'brightness'), os.O_RDONLY), False
+            SysFS._handles[path] = (fd, writable, max_brightness)
+            return fd, max_brightness
 
-        Example:
-            ```python
-            import screen_brightness_control as sbc
+    @staticmethod
+    def _device_lock(path: str) -> threading.Lock:
+        '''internal function, returns the lock that guards a device's file descriptor, creating it if needed'''
+        with SysFS._handles_lock:
+            return SysFS._device_locks.setdefault(path, threading.Lock())
 
-            info = sbc.linux.XRandr.get_display_info()
-            for i in info:
-                print('================')
-                for key, value in i.items():
-                    print(key, ':', value)
+    @staticmethod
+    def _close_handle(path: str):
+        '''internal function, closes a device's file descriptor. The device's lock must be held'''
+        with SysFS._handles_lock:
+            handle = SysFS._handles.pop(path, None)
+        if handle is not None:
+            try:
+                os.close(handle[0])
+            except OSError:
+                pass
 
-            # get information about the first XRandr addressable monitor
-            primary_info = sbc.linux.XRandr.get_display_info(0)[0]
+    @staticmethod
+    def _close_handles(paths: Optional[List[str]] = None):
+        '''
+        internal function, closes the open file descriptors for some or all devices.
+        Waits for any thread that is using one of them to finish first
 
-            # get information about a monitor with a specific name
-            benq_info = sbc.linux.XRandr.get_display_info('BenQ GL2450HM')[0]
-            ```
+        Args:
+            paths (list): the device paths to close the handles of. Closes all of them if not specified
         '''
-        def check_tmp(tmp):
-            if tmp != {}:
-                if tmp['serial'] is None or '\\x' not in tmp['serial']:
-                    if 'line' in tmp:
-                        del(tmp['line'])
-                    return True
-            return False
+        if paths is None:
+            with SysFS._handles_lock:
+                paths = list(SysFS._handles)
+        for path in paths:
+            with SysFS._device_lock(path):
+                SysFS._close_handle(path)
 
-        try:
-            data = __cache__.get('xrandr_monitors_info')
-        except Exception:
-            out = subprocess.check_output([XRandr.executable, '--verbose']).decode().split('\n')
-            names = XRandr.get_display_interfaces()
-            data = []
-            tmp = {}
-            count = 0
-            for i in out:
-                if i != '':
-                    if i.startswith(tuple(names)):
-                        if check_tmp(tmp):
-                            data.append(tmp)
-                        tmp = {
-                            'interface': i.split(' ')[0],
-                            'name': i.split(' ')[0],
-                            'line': i,
-                            'method': XRandr,
-                            'index': count,
-                            'model': None,
-                            'serial': None,
-                            'manufacturer': None,
-                            'manufacturer_id': None,
-                            'edid': None
-                        }
-                        count += 1
-                    elif 'EDID:' in i:
-                        st = out[out.index(tmp['line']):]
-                        edid = []
-                        for j in range(st.index(i) + 1, st.index(i) + 9):
-                            edid.append(st[j].replace('\t', '').replace(' ', ''))
-                        edid = ''.join(edid)
-                        tmp['edid'] = edid
-                        name, serial = _EDID.parse_edid(edid)
-                        tmp['name'] = name if name is not None else tmp['interface']
-                        if name is not None:
-                            tmp['manufacturer'] = name.split(' ')[0]
-                            try:
-                                tmp['manufacturer_id'], tmp['manufacturer'] = _monitor_brand_lookup(
-                                    tmp['manufacturer']
-                                )
-                            except Exception:
-                                tmp['manufacturer_id'] = None
-                            tmp['model'] = name.split(' ')[1]
-                            tmp['serial'] = serial
-                    elif 'Brightness:' in i:
-                        tmp['brightness'] = int(
-                            float(i.replace('Brightness:', '').replace(' ', '').replace('\t', '')) * 100
-                        )
-            if check_tmp(tmp):
-                data.append(tmp)
-
-            __cache__.store('xrandr_monitors_info', data)
-        if display is not None:
-            data = filter_monitors(display=display, haystack=data, include=['interface'])
-        return data
+    @staticmethod
+    def _with_handle(path: str, func, write: bool = False):
+        '''
+        internal function, calls `func` with the file descriptor and max brightness of a device,
+        holding the device's lock so the descriptor cannot be closed while it is in use.
+        If that fails (EG: the device was unplugged and replugged) the handle is reopened and it is tried once more
+        '''
+        with SysFS._device_lock(path):
+            try:
+                return func(*SysFS._get_handle(path, write=write))
+            except OSError:
+                SysFS._close_handle(path)
+                return func(*SysFS._get_handle(path, write=write))
 
     @staticmethod
-    def get_display_interfaces() -> List[str]:
+    @__metrics__.timed('SysFS.set_brightness')
+    def set_brightness(
+        value: int,
+        display: Optional[Union[int, str, dict]] = None,
+        no_return: bool = False,
+        write_through: bool = False,
+        verify: bool = False
+    ) -> Union[List[int], None]:
         '''
-        Returns the interfaces of each display, as reported by xrandr
+        Sets the brightness for a display by writing to its backlight device in sysfs.
+        This usually requires root access or a udev rule that makes the brightness file writable
+
+        Args:
+            value (int): Sets the brightness to this value
+            display (int, str or dict): The specific display you wish to query.
+                Can be index, name, model, serial, path or edid string.
+                `int` is faster as it isn't passed to `filter_monitors` to be matched against.
+                `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
+            no_return (bool): if True, this function returns None
+            write_through (bool): if True, successfully written values are cached as the
+                current brightness and returned without reading them back from the display
+            verify (bool): if True (and `write_through` is True), the written values are read back
+                in a background thread and the cache is corrected if the display disagrees
 
         Returns:
-            list: list of strings
+            list: list of ints (0 to 100) (the result of `SysFS.get_brightness`)
+            None: if the `no_return` kwarg is True
 
         Example:
             ```python
             import screen_brightness_control as sbc
 
-            names = sbc.linux.XRandr.get_display_names()
-            # EG output: ['eDP-1', 'HDMI1', 'HDMI2']
+            # set the brightness to 50%
+            sbc.linux.SysFS.set_brightness(50)
+
+            # set the primary display brightness to 75%
+            sbc.linux.SysFS.set_brightness(75, display = 0)
             ```
         '''
-        out = subprocess.check_output(['xrandr', '-q']).decode().split('\n')
-        return [i.split(' ')[0] for i in out if 'connected' in i and 'disconnected' not in i]
+        if isinstance(display, dict):
+            info = [display]
+        else:
+            info = SysFS.get_display_info()
+            if display is not None:
+                if type(display) == int:
+                    info = [info[display]]
+                else:
+                    info = filter_monitors(display=display, haystack=info, include=['path'])
+        for i in info:
+            key = f'sysfs_{i["path"]}_brightness'
+            __cache__.expire(key)
+            SysFS._with_handle(
+                i['path'],
+                lambda fd, max_brightness: os.pwrite(fd, str(int(round(value * max_brightness / 100, 0))).encode(), 0),
+                write=True
+            )
+            if write_through:
+                __cache__.store(key, value, namespace='brightness')
+                if verify:
+                    _verify_brightness(key, lambda path=i['path']: SysFS._read_brightness(path), value)
+        return SysFS.get_brightness(display=display) if not no_return else None
 
     @staticmethod
-    def get_display_names() -> List[str]:
+    def _read_brightness(path: str) -> int:
+        '''internal function, reads the brightness of a backlight device as a percentage, bypassing the cache'''
+        return SysFS._with_handle(
+            path, lambda fd, max_brightness: int(round(int(os.pread(fd, 32, 0)) / max_brightness * 100, 0))
+        )
+
+    @staticmethod
+    @__metrics__.timed('SysFS.get_brightness')
+    def get_brightness(
+        display: Optional[Union[int, str, dict]] = None,
+        max_stale: float = 0,
+        with_age: bool = False
+    ) -> Union[List[int], List[Tuple[int, float]]]:
         '''
-        Returns the names of each display, as reported by xrandr
+        Returns the brightness for a display by reading its backlight device in sysfs
+
+        Args:
+            display (int, str or dict): The specific display you wish to query.
+                Can be index, name, model, serial, path or edid string.
+                `int` is faster as it isn't passed to `filter_monitors` to be matched against.
+                `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
+            max_stale (float): if a cached reading has expired but is no more than this many seconds old,
+                it is returned immediately and refreshed in the background
+            with_age (bool): if True, each value is returned as a tuple of the brightness
+                and the age (in seconds) of that reading
 
         Returns:
-            list: list of strings
+            list: list of ints (0 to 100)
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            # get the current display brightness
+            current_brightness = sbc.linux.SysFS.get_brightness()
+
+            # get the brightness of the primary display
+            primary_brightness = sbc.linux.SysFS.get_brightness(display = 0)[0]
+            ```
+        '''
+        if isinstance(display, dict):
+            info = [display]
+        else:
+            info = SysFS.get_display_info()
+            if display is not None:
+                if type(display) == int:
+                    info = [info[display]]
+                else:
+                    info = filter_monitors(display=display, haystack=info, include=['path'])
+        results = []
+        for i in info:
+            value, age = __cache__.fetch(
+                f'sysfs_{i["path"]}_brightness',
+                lambda path=i['path']: SysFS._read_brightness(path),
+                namespace='brightness', max_stale=max_stale
+            )
+            results.append((value, age) if with_age else value)
+        return results
+
+
+class XBacklight:
+    '''collection of screen brightness related methods using the xbacklight executable'''
+
+    executable = 'xbacklight'
+    '''the xbacklight executable to be called'''
+
+    @staticmethod
+    @__metrics__.timed('XBacklight.set_brightness')
+    def set_brightness(value: int, no_return: bool = False, **kwargs) -> Union[int, None]:
+        '''
+        Sets the screen brightness to a supplied value
+
+        Args:
+            no_return (bool): if True, this function returns None
+                Returns the result of `XBacklight.get_brightness()` otherwise
+
+        Returns:
+            int: from 0 to 100
+            None: if `no_return` is set to `True`
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            # set the brightness to 100%
+            sbc.linux.XBacklight.set_brightness(100)
+            ```
+        '''
+        _run([XBacklight.executable, '-set', str(value)])
+        return XBacklight.get_brightness() if not no_return else None
+
+    @staticmethod
+    @__metrics__.timed('XBacklight.get_brightness')
+    def get_brightness(**kwargs) -> int:
+        '''
+        Returns the screen brightness as reported by xbacklight
+
+        Returns:
+            int: from 0 to 100
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            current_brightness = sbc.linux.XBacklight.get_brightness()
+            ```
+        '''
+        import subprocess
+
+        res = _run(
+            [XBacklight.executable, '-get'],
+            stdout=subprocess.PIPE
+        ).stdout.decode()
+        return int(round(float(str(res)), 0))
+
+
+_xrr_structures = None
+
+
+def _get_xrr_structures() -> tuple:
+    '''
+    internal function, returns the XRRScreenResources, XRROutputInfo and XRRCrtcGamma structures used by
+    `LibXrandr`. They are defined on first use so that ctypes is only imported when libXrandr is
+    '''
+    global _xrr_structures
+    if _xrr_structures is None:
+        import ctypes
+
+        class XRRScreenResources(ctypes.Structure):
+            _fields_ = [
+                ('timestamp', ctypes.c_ulong),
+                ('configTimestamp', ctypes.c_ulong),
+                ('ncrtc', ctypes.c_int),
+                ('crtcs', ctypes.POINTER(ctypes.c_ulong)),
+                ('noutput', ctypes.c_int),
+                ('outputs', ctypes.POINTER(ctypes.c_ulong)),
+                ('nmode', ctypes.c_int),
+                ('modes', ctypes.c_void_p)
+            ]
+
+        class XRROutputInfo(ctypes.Structure):
+            _fields_ = [
+                ('timestamp', ctypes.c_ulong),
+                ('crtc', ctypes.c_ulong),
+                ('name', ctypes.c_char_p),
+                ('nameLen', ctypes.c_int),
+                ('mm_width', ctypes.c_ulong),
+                ('mm_height', ctypes.c_ulong),
+                ('connection', ctypes.c_ushort),
+                ('subpixel_order', ctypes.c_ushort),
+                ('ncrtc', ctypes.c_int),
+                ('crtcs', ctypes.POINTER(ctypes.c_ulong)),
+                ('nclone', ctypes.c_int),
+                ('clones', ctypes.POINTER(ctypes.c_ulong)),
+                ('nmode', ctypes.c_int),
+                ('npreferred', ctypes.c_int),
+                ('modes', ctypes.POINTER(ctypes.c_ulong))
+            ]
+
+        class XRRCrtcGamma(ctypes.Structure):
+            _fields_ = [
+                ('size', ctypes.c_int),
+                ('red', ctypes.POINTER(ctypes.c_ushort)),
+                ('green', ctypes.POINTER(ctypes.c_ushort)),
+                ('blue', ctypes.POINTER(ctypes.c_ushort))
+            ]
+
+        _xrr_structures = (XRRScreenResources, XRROutputInfo, XRRCrtcGamma)
+    return _xrr_structures
+
+
+class LibXrandr:
+    '''
+    In-process access to the X RandR extension through libX11 and libXrandr (using ctypes).
+    One connection to the X server is kept open until `close` is called, so reading
+    and setting the brightness costs a few X requests instead of spawning a process.
+
+    Brightness is set the same way as `xrandr --brightness`, by scaling the gamma ramp of the output's CRTC.
+
+    Example:
+        ```python
+        import screen_brightness_control as sbc
+
+        lib = sbc.linux.LibXrandr()
+        for output in lib.outputs():
+            if output['crtc']:
+                print(output['name'], lib.get_brightness(output['crtc']))
+        lib.close()
+        ```
+    '''
+
+    RR_CONNECTED = 0
+    '''the connection state of a connected output'''
+
+    # The error handler is process wide, so it is only installed while requests are being made (see `_trap_errors`)
+    # and the ctypes callback is kept for the lifetime of the process in case Xlib holds on to it
+    _error_handler = None
+    _error_lock = threading.Lock()
+    # the displays that reported an error while the handler was installed
+    _errors = set()
+    # libX11 and libXrandr, shared by every instance once they have both been loaded
+    _libraries = None
+
+    def __init__(self, display: Optional[str] = None):
+        '''
+        Args:
+            display (str): the X display to connect to. Defaults to the `DISPLAY` environment variable
+
+        Raises:
+            OSError: if libX11 or libXrandr cannot be loaded or the display cannot be opened
+        '''
+        import ctypes
+
+        self.x11, self.xrandr = LibXrandr._load_libraries()
+        self._set_signatures()
+
+        self.lock = threading.Lock()
+        '''held while talking to the X server because Xlib connections are not thread safe'''
+        self._crtcs = {}
+
+        self.display = self.x11.XOpenDisplay(display.encode() if display else None)
+        if not self.display:
+            raise OSError(f'cannot open display {display or os.environ.get("DISPLAY")!r}')
+
+        with LibXrandr._error_lock:
+            if LibXrandr._error_handler is None:
+                LibXrandr._error_handler = ctypes.CFUNCTYPE(
+                    ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p
+                )(LibXrandr._on_error)
+
+        try:
+            with self._trap_errors():
+                self.root = self.x11.XDefaultRootWindow(self.display)
+                self.edid_atom = self.x11.XInternAtom(self.display, b'EDID', True)
+        except Exception:
+            self.close()
+            raise
+
+    @staticmethod
+    def _load_libraries() -> tuple:
+        '''
+        internal function, loads libX11 and libXrandr the first time they are needed.
+        A failure is not remembered, so the next call tries again
+
+        Raises:
+            OSError: if either library cannot be found or loaded
+        '''
+        import ctypes
+        import ctypes.util
+
+        with LibXrandr._error_lock:
+            if LibXrandr._libraries is None:
+                x11, xrandr = ctypes.util.find_library('X11'), ctypes.util.find_library('Xrandr')
+                if x11 is None or xrandr is None:
+                    raise OSError('libX11 and libXrandr are required')
+                LibXrandr._libraries = (ctypes.CDLL(x11), ctypes.CDLL(xrandr))
+            return LibXrandr._libraries
+
+    def _set_signatures(self):
+        '''internal function, declares the argument and return types of the library functions that are used'''
+        import ctypes as c
+
+        screen_resources, output_info, crtc_gamma = _get_xrr_structures()
+        self.x11.XOpenDisplay.argtypes = [c.c_char_p]
+        self.x11.XOpenDisplay.restype = c.c_void_p
+        self.x11.XCloseDisplay.argtypes = [c.c_void_p]
+        self.x11.XDefaultRootWindow.argtypes = [c.c_void_p]
+        self.x11.XDefaultRootWindow.restype = c.c_ulong
+        self.x11.XInternAtom.argtypes = [c.c_void_p, c.c_char_p, c.c_int]
+        self.x11.XInternAtom.restype = c.c_ulong
+        self.x11.XFree.argtypes = [c.c_void_p]
+        self.x11.XSync.argtypes = [c.c_void_p, c.c_int]
+        self.x11.XSetErrorHandler.argtypes = [c.c_void_p]
+        self.x11.XSetErrorHandler.restype = c.c_void_p
+
+        self.xrandr.XRRGetScreenResourcesCurrent.argtypes = [c.c_void_p, c.c_ulong]
+        self.xrandr.XRRGetScreenResourcesCurrent.restype = c.POINTER(screen_resources)
+        self.xrandr.XRRFreeScreenResources.argtypes = [c.POINTER(screen_resources)]
+        self.xrandr.XRRGetOutputInfo.argtypes = [c.c_void_p, c.POINTER(screen_resources), c.c_ulong]
+        self.xrandr.XRRGetOutputInfo.restype = c.POINTER(output_info)
+        self.xrandr.XRRFreeOutputInfo.argtypes = [c.POINTER(output_info)]
+        self.xrandr.XRRGetOutputProperty.argtypes = [
+            c.c_void_p, c.c_ulong, c.c_ulong, c.c_long, c.c_long, c.c_int, c.c_int, c.c_ulong,
+            c.POINTER(c.c_ulong), c.POINTER(c.c_int), c.POINTER(c.c_ulong), c.POINTER(c.c_ulong),
+            c.POINTER(c.POINTER(c.c_ubyte))
+        ]
+        self.xrandr.XRRGetOutputProperty.restype = c.c_int
+        self.xrandr.XRRGetCrtcGammaSize.argtypes = [c.c_void_p, c.c_ulong]
+        self.xrandr.XRRGetCrtcGammaSize.restype = c.c_int
+        self.xrandr.XRRGetCrtcGamma.argtypes = [c.c_void_p, c.c_ulong]
+        self.xrandr.XRRGetCrtcGamma.restype = c.POINTER(crtc_gamma)
+        self.xrandr.XRRAllocGamma.argtypes = [c.c_int]
+        self.xrandr.XRRAllocGamma.restype = c.POINTER(crtc_gamma)
+        self.xrandr.XRRSetCrtcGamma.argtypes = [c.c_void_p, c.c_ulong, c.POINTER(crtc_gamma)]
+        self.xrandr.XRRFreeGamma.argtypes = [c.POINTER(crtc_gamma)]
+
+    @staticmethod
+    def _on_error(display, event) -> int:
+        '''internal function, called by Xlib when the X server reports an error'''
+        LibXrandr._errors.add(display)
+        return 0
+
+    @contextlib.contextmanager
+    def _trap_errors(self):
+        '''
+        internal context manager for making requests to the X server.
+        The default Xlib error handler exits the process, so errors are recorded instead while
+        the requests are made. Once the server has processed them the previous handler is restored
+
+        Raises:
+            OSError: if the X server reported an error for any of the requests
+        '''
+        with LibXrandr._error_lock:
+            previous = self.x11.XSetErrorHandler(LibXrandr._error_handler)
+            try:
+                yield
+            finally:
+                # wait for the server to process every request so that any errors are reported to our handler
+                self.x11.XSync(self.display, 0)
+                self.x11.XSetErrorHandler(previous)
+                failed = self.display in LibXrandr._errors
+                LibXrandr._errors.discard(self.display)
+        if failed:
+            raise OSError('the X server reported an error')
+
+    def _read_edid(self, output: int) -> Union[str, None]:
+        '''internal function, reads the EDID property of an output'''
+        import ctypes
+
+        if not self.edid_atom:
+            return None
+        actual_type, actual_format = ctypes.c_ulong(), ctypes.c_int()
+        nitems, bytes_after = ctypes.c_ulong(), ctypes.c_ulong()
+        prop = ctypes.POINTER(ctypes.c_ubyte)()
+        status = self.xrandr.XRRGetOutputProperty(
+            self.display, output, self.edid_atom, 0, 128, False, False, 0,
+            ctypes.byref(actual_type), ctypes.byref(actual_format),
+            ctypes.byref(nitems), ctypes.byref(bytes_after), ctypes.byref(prop)
+        )
+        try:
+            if status != 0 or actual_format.value != 8 or nitems.value < 128:
+                return None
+            return bytes(prop[:128]).hex()
+        finally:
+            if prop:
+                self.x11.XFree(prop)
+
+    def outputs(self) -> List[dict]:
+        '''
+        Lists the connected outputs, in the same order as the xrandr executable
+
+        Returns:
+            list: list of dicts containing the 'name' of the output, its 'crtc'
+                (0 if the output is disabled) and its 'edid' (None if it has none)
+        '''
+        with self.lock, self._trap_errors():
+            resources = self.xrandr.XRRGetScreenResourcesCurrent(self.display, self.root)
+            if not resources:
+                raise OSError('failed to get the screen resources')
+            try:
+                outputs = []
+                for i in range(resources.contents.noutput):
+                    output = resources.contents.outputs[i]
+                    info = self.xrandr.XRRGetOutputInfo(self.display, resources, output)
+                    if not info:
+                        continue
+                    try:
+                        if info.contents.connection == LibXrandr.RR_CONNECTED:
+                            outputs.append({
+                                'name': info.contents.name.decode(),
+                                'crtc': info.contents.crtc,
+                                'edid': self._read_edid(output)
+                            })
+                    finally:
+                        self.xrandr.XRRFreeOutputInfo(info)
+            finally:
+                self.xrandr.XRRFreeScreenResources(resources)
+            self._crtcs = {i['name']: i['crtc'] for i in outputs}
+        return outputs
+
+    def get_crtc(self, name: str) -> int:
+        '''
+        Returns the CRTC that an output is being displayed on
+
+        Args:
+            name (str): the name of the output. EG: 'HDMI-1'
+
+        Returns:
+            int
+
+        Raises:
+            LookupError: if the output is not connected or is disabled
+        '''
+        if not self._crtcs.get(name):
+            self.outputs()
+        if not self._crtcs.get(name):
+            raise LookupError(f'output {name!r} is not connected or is disabled')
+        return self._crtcs[name]
+
+    def get_brightness(self, crtc: int) -> float:
+        '''
+        Returns the software brightness of a CRTC, worked out from its gamma ramp
+
+        Args:
+            crtc (int): the CRTC to query
+
+        Returns:
+            float: from 0 to 1
+        '''
+        with self.lock, self._trap_errors():
+            gamma = self.xrandr.XRRGetCrtcGamma(self.display, crtc)
+            try:
+                if not gamma or gamma.contents.size == 0:
+                    raise OSError(f'failed to get the gamma ramp of CRTC {crtc}')
+                last = gamma.contents.size - 1
+                value = max(gamma.contents.red[last], gamma.contents.green[last], gamma.contents.blue[last]) / 65535
+            finally:
+                if gamma:
+                    self.xrandr.XRRFreeGamma(gamma)
+        return value
+
+    def set_brightness(self, crtc: int, value: float):
+        '''
+        Sets the software brightness of a CRTC by replacing its gamma ramp with a linear one scaled by `value`
+
+        Args:
+            crtc (int): the CRTC to adjust
+            value (float): from 0 to 1
+        '''
+        with self.lock, self._trap_errors():
+            size = self.xrandr.XRRGetCrtcGammaSize(self.display, crtc)
+            if size <= 0:
+                raise OSError(f'failed to get the gamma ramp size of CRTC {crtc}')
+            gamma = self.xrandr.XRRAllocGamma(size)
+            try:
+                for i in range(size):
+                    level = min(65535, int(65535 * value * i / max(size - 1, 1)))
+                    gamma.contents.red[i] = gamma.contents.green[i] = gamma.contents.blue[i] = level
+                self.xrandr.XRRSetCrtcGamma(self.display, crtc, gamma)
+            finally:
+                self.xrandr.XRRFreeGamma(gamma)
+
+    def close(self):
+        '''closes the connection to the X server'''
+        with self.lock:
+            if self.display:
+                self.x11.XCloseDisplay(self.display)
+                self.display = None
+
+
+class XRandr:
+    '''
+    collection of screen brightness related methods using the xrandr executable.
+    Where libXrandr is available the X server is queried directly instead (see `LibXrandr`)
+    '''
+
+    executable = 'xrandr'
+    '''the xrandr executable to be called'''
+    use_xlib = True
+    '''whether to talk to the X server directly through libXrandr (see `LibXrandr`)
+    before falling back to the xrandr executable'''
+    xlib_retry_interval = 5
+    '''how long (in seconds) to wait before trying to create a `LibXrandr` instance again after it failed
+    (EG: because the `DISPLAY` environment variable was not set yet)'''
+    _xlib = None
+    '''internal. The shared `LibXrandr` instance, or None if one has not been created yet'''
+    _xlib_lock = threading.Lock()
+
+    @staticmethod
+    def get_display_info(display: Optional[Union[int, str]] = None) -> List[dict]:
+        '''
+        Returns info about all detected monitors as reported by xrandr
+
+        Args:
+            display (str or int): [*Optional*] The monitor to return info about.
+                Pass in the serial number, name, model, interface, edid or index.
+                This is passed to `filter_monitors`
+
+        Returns:
+            list: list of dicts
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            info = sbc.linux.XRandr.get_display_info()
+            for i in info:
+                print('================')
+                for key, value in i.items():
+                    print(key, ':', value)
+
+            # get information about the first XRandr addressable monitor
+            primary_info = sbc.linux.XRandr.get_display_info(0)[0]
+
+            # get information about a monitor with a specific name
+            benq_info = sbc.linux.XRandr.get_display_info('BenQ GL2450HM')[0]
+            ```
+        '''
+        data = __cache__.fetch('xrandr_monitors_info', XRandr._query_display_info, namespace='discovery')[0]
+        if display is not None:
+            data = filter_monitors(display=display, haystack=data, include=['interface'])
+        return data
+
+    @staticmethod
+    @__metrics__.timed('XRandr._query_display_info')
+    def _query_display_info() -> List[dict]:
+        '''
+        internal function, queries the X server (or runs xrandr and parses its output).
+        Use `XRandr.get_display_info` instead
+        '''
+        lib = XRandr._get_xlib()
+        if lib is not None:
+            try:
+                data = []
+                for output in lib.outputs():
+                    tmp = XRandr._new_info(output['name'])
+                    if output['crtc']:
+                        tmp['brightness'] = int(round(lib.get_brightness(output['crtc']) * 100))
+                    XRandr._add_info(data, tmp, output['edid'])
+                return data
+            except Exception:
+                pass
+        return XRandr._parse_verbose(_check_output([XRandr.executable, '--verbose']).decode())
+
+    @staticmethod
+    def _get_xlib() -> Union[LibXrandr, None]:
+        '''internal function, returns the shared `LibXrandr` instance or None if it is disabled or unavailable'''
+        if not XRandr.use_xlib:
+            return None
+        with XRandr._xlib_lock:
+            if XRandr._xlib is None and 'xrandr_xlib_unavailable' not in __cache__:
+                try:
+                    XRandr._xlib = LibXrandr()
+                except Exception:
+                    # only the failure is cached, and only briefly, so a display that appears later is still used
+                    __cache__.store(
+                        'xrandr_xlib_unavailable', True, namespace='discovery', expires=XRandr.xlib_retry_interval
+                    )
+            return XRandr._xlib
+
+    @staticmethod
+    def _new_info(interface: str) -> dict:
+        '''internal function, returns the display info of an output before anything is known about it'''
+        return {
+            'interface': interface,
+            'name': interface,
+            'method': XRandr,
+            'index': None,
+            'model': None,
+            'serial': None,
+            'manufacturer': None,
+            'manufacturer_id': None,
+            'edid': None
+        }
+
+    @staticmethod
+    def _add_info(data: List[dict], tmp: dict, edid: Union[str, None]):
+        '''
+        internal function, fills in the display info of an output from its EDID and adds it to `data`
+
+        Args:
+            data (list): the display info of the outputs found so far
+            tmp (dict): the display info of the output, from `XRandr._new_info`
+            edid (str): the EDID of the output as a hex string, or None
+        '''
+        if edid:
+            # only the base EDID block (the first 128 bytes) is used, like every other method
+            edid = edid[:256]
+            tmp['edid'] = edid
+            name, serial = _EDID.parse_edid(edid)
+            tmp['name'] = name if name is not None else tmp['interface']
+            if name is not None:
+                tmp['manufacturer'] = name.split(' ')[0]
+                try:
+                    tmp['manufacturer_id'], tmp['manufacturer'] = _monitor_brand_lookup(tmp['manufacturer'])
+                except Exception:
+                    tmp['manufacturer_id'] = None
+                tmp['model'] = name.split(' ')[1]
+                tmp['serial'] = serial
+        if tmp['serial'] is None or '\\x' not in tmp['serial']:
+            tmp['index'] = len(data)
+            data.append(tmp)
+
+    @staticmethod
+    def _parse_verbose(output: str) -> List[dict]:
+        '''
+        internal function, parses the output of `xrandr --verbose` in a single pass
+
+        Args:
+            output (str): the output of the command
+
+        Returns:
+            list: list of dicts, one for each connected output
+        '''
+        def add(tmp, edid):
+            if tmp is not None:
+                XRandr._add_info(data, tmp, ''.join(edid) if edid else None)
+
+        data = []
+        tmp = None
+        edid = None
+        # whether the lines being read are part of an EDID block
+        in_edid = False
+        for line in output.split('\n'):
+            if not line:
+                continue
+            if not line[0].isspace():
+                # a new output (EG: 'HDMI-1 connected 1920x1080+0+0 ...') or the 'Screen 0: ...' header
+                add(tmp, edid)
+                tmp, edid, in_edid = None, None, False
+                parts = line.split(' ', 2)
+                if len(parts) > 1 and parts[1] == 'connected':
+                    tmp = XRandr._new_info(parts[0])
+                continue
+            if tmp is None:
+                continue
+
+            line = line.strip()
+            if in_edid:
+                try:
+                    bytes.fromhex(line)
+                    edid.append(line)
+                    continue
+                except ValueError:
+                    in_edid = False
+            if line.startswith('EDID:'):
+                in_edid, edid = True, []
+            elif line.startswith('Brightness:'):
+                tmp['brightness'] = int(float(line[11:].strip()) * 100)
+        add(tmp, edid)
+        return data
+
+    @staticmethod
+    def get_display_interfaces() -> List[str]:
+        '''
+        Returns the interfaces of each display, as reported by xrandr
+
+        Returns:
+            list: list of strings
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            names = sbc.linux.XRandr.get_display_names()
+            # EG output: ['eDP-1', 'HDMI1', 'HDMI2']
+            ```
+        '''
+        out = _check_output(['xrandr', '-q']).decode().split('\n')
+        return [i.split(' ')[0] for i in out if 'connected' in i and 'disconnected' not in i]
+
+    @staticmethod
+    def get_display_names() -> List[str]:
+        '''
+        Returns the names of each display, as reported by xrandr
+
+        Returns:
+            list: list of strings
 
         Example:
             ```python
@@ -477,310 +1502,1229 @@ class XRandr:
             # EG output: ['BenQ GL2450HM', 'Dell U2211H']
             ```
         '''
-        return [i['name'] for i in XRandr.get_display_info()]
+        return [i['name'] for i in XRandr.get_display_info()]
+
+    @staticmethod
+    @__metrics__.timed('XRandr.get_brightness')
+    def get_brightness(
+        display: Optional[Union[int, str, dict]] = None,
+        max_stale: float = 0,
+        with_age: bool = False
+    ) -> Union[List[int], List[Tuple[int, float]]]:
+        '''
+        Returns the brightness for a display using the xrandr executable
+
+        Args:
+            display (int, str or dict): The specific display you wish to query.
+                Can be index, name, model, serial, interface or edid string.
+                `int` is faster as it isn't passed to `filter_monitors` to be matched against.
+                `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is matched to the current output by its interface.
+            max_stale (float): if a cached reading has expired but is no more than this many seconds old,
+                it is returned immediately and refreshed in the background
+            with_age (bool): if True, each value is returned as a tuple of the brightness
+                and the age (in seconds) of that reading
+
+        Returns:
+            list: list of integers (from 0 to 100)
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            # get the current brightness
+            current_brightness = sbc.linux.XRandr.get_brightness()
+
+            # get the current brightness for the primary display
+            primary_brightness = sbc.linux.XRandr.get_brightness(display=0)[0]
+            ```
+        '''
+        # brightness values are part of the display info, so that is what gets revalidated
+        monitors, age = __cache__.fetch(
+            'xrandr_monitors_info', XRandr._query_display_info, namespace='discovery', max_stale=max_stale
+        )
+        if isinstance(display, dict):
+            # the given info may be out of date, so pick the current reading of the same output
+            monitors = [i for i in monitors if i['interface'] == display['interface']]
+            if not monitors:
+                raise LookupError(f'output {display["interface"]!r} is not connected')
+        elif display is not None:
+            if type(display) == int:
+                monitors = [monitors[display]]
+            else:
+                monitors = filter_monitors(display=display, haystack=monitors, include=['interface'])
+        brightness = [(i['brightness'], age) if with_age else i['brightness'] for i in monitors]
+
+        return brightness
+
+    @staticmethod
+    @__metrics__.timed('XRandr.set_brightness')
+    def set_brightness(
+        value: int,
+        display: Optional[Union[int, str, dict]] = None,
+        no_return: bool = False,
+        write_through: bool = False,
+        verify: bool = False
+    ) -> Union[List[int], None]:
+        '''
+        Sets the brightness for a display using the xrandr executable
+
+        Args:
+            value (int): Sets the brightness to this value
+            display (int, str or dict): The specific display you wish to query.
+                Can be index, name, model, serial, interface or edid string.
+                `int` is faster as it isn't passed to `filter_monitors` to be matched against.
+                `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
+            no_return (bool): if True, this function returns None
+                Returns the result of `XRandr.get_brightness()` otherwise
+            write_through (bool): if True, successfully written values are cached as the
+                current brightness and returned without reading them back from the display
+            verify (bool): if True (and `write_through` is True), the written values are read back
+                in a background thread and the cache is corrected if the display disagrees
+
+        Returns:
+            list: list of ints (0 to 100) (the result of `XRandr.get_brightness`)
+            None: if the `no_return` kwarg is True
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            # set the brightness to 50
+            sbc.linux.XRandr.set_brightness(50)
+
+            # set the brightness of the primary display to 75
+            sbc.linux.XRandr.set_brightness(75, display=0)
+            ```
+        '''
+        if isinstance(display, dict):
+            info = [display]
+        else:
+            info = XRandr.get_display_info()
+            if display is not None:
+                if type(display) == int:
+                    info = [info[display]]
+                else:
+                    info = filter_monitors(
+                        display=display,
+                        haystack=info,
+                        include=['interface']
+                    )
+
+        XRandr._write([(i, value) for i in info], write_through=write_through, verify=verify)
+        return XRandr.get_brightness(display=display) if not no_return else None
+
+    @staticmethod
+    @__metrics__.timed('XRandr.set_brightness_multi')
+    def set_brightness_multi(
+        values: Dict[Union[int, str], int],
+        no_return: bool = False,
+        write_through: bool = False,
+        verify: bool = False
+    ) -> Union[List[int], None]:
+        '''
+        Sets the brightness of several displays, each to its own value, using a single xrandr invocation
+
+        Args:
+            values (dict): the displays mapped to the value to set them to.
+                Displays can be anything accepted by the `display` kwarg of `XRandr.set_brightness`
+            no_return (bool): if True, this function returns None
+            write_through (bool): if True, successfully written values are cached as the
+                current brightness and returned without reading them back from the display
+            verify (bool): if True (and `write_through` is True), the written values are read back
+                in a background thread and the cache is corrected if the display disagrees
+
+        Returns:
+            list: list of ints (0 to 100), the brightness of each targeted display in the order they were given
+            None: if the `no_return` kwarg is True
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            # set the primary display to 50% and the display on HDMI-1 to 75%
+            sbc.linux.XRandr.set_brightness_multi({0: 50, 'HDMI-1': 75})
+            ```
+        '''
+        info = XRandr.get_display_info()
+        targets = []
+        for display, value in values.items():
+            if type(display) == int:
+                targets.append((info[display], value))
+            else:
+                targets += [(i, value) for i in filter_monitors(display=display, haystack=info, include=['interface'])]
+
+        XRandr._write(targets, write_through=write_through, verify=verify)
+        if no_return:
+            return None
+        brightness = {i['interface']: i['brightness'] for i in XRandr.get_display_info()}
+        return [brightness[i['interface']] for i, _ in targets]
+
+    @staticmethod
+    def _write(targets: List[Tuple[dict, int]], write_through: bool = False, verify: bool = False):
+        '''
+        internal function, sets the brightness of several outputs in a single xrandr invocation
+
+        Args:
+            targets (list): tuples of the display info of an output and the value to set it to
+            write_through (bool): see `XRandr.set_brightness`
+            verify (bool): see `XRandr.set_brightness`
+        '''
+        if not targets:
+            return
+        returncode = None
+        lib = XRandr._get_xlib()
+        if lib is not None:
+            try:
+                for i, value in targets:
+                    lib.set_brightness(lib.get_crtc(i['interface']), float(value) / 100)
+                returncode = 0
+            except Exception:
+                pass
+        if returncode is None:
+            cmd = [XRandr.executable]
+            for i, value in targets:
+                cmd += ['--output', i['interface'], '--brightness', str(float(value) / 100)]
+            returncode = _run(cmd).returncode
+
+        if not write_through or returncode != 0:
+            # The get_brightness method takes the brightness value from get_display_info
+            # The problem is that that display info is cached, meaning that the brightness
+            # value is also cached. We must expire it here.
+            __cache__.expire('xrandr_monitors_info')
+            return
+
+        # the brightness values are part of the (cached) display info so update them in place.
+        # Targets may come from older discovery results (eg: those held by a `Monitor`) so update the cache too.
+        # The cached info is peeked at so that an expired entry is updated rather than dropped,
+        # which keeps it available to `get_brightness(max_stale=...)`
+        written = {i['interface']: int(value) for i, value in targets}
+        try:
+            cached = __cache__.peek('xrandr_monitors_info')
+        except Exception:
+            cached = []
+        for i in [i for i, _ in targets] + cached:
+            if i['interface'] in written:
+                i['brightness'] = written[i['interface']]
+        if verify:
+            def verify_xrandr():
+                __cache__.expire('xrandr_monitors_info')
+                try:
+                    XRandr.get_display_info()
+                except Exception:
+                    pass
+            threading.Thread(target=verify_xrandr, daemon=True).start()
+
+
+class VCPValue(NamedTuple):
+    '''The value of a VCP feature, as returned by `DDCUtil.get_vcp`'''
+    code: int
+    '''the VCP code of the feature. EG: 0x10 for brightness'''
+    current: int
+    '''the current value of the feature'''
+    maximum: Optional[int]
+    '''the maximum value of the feature. None for non-continuous features'''
+
+
+class I2C:
+    '''
+    In-process implementation of the DDC/CI protocol over the Linux I2C device nodes (`/dev/i2c-*`).
+    Requires the `i2c-dev` kernel module and read/write access to the device node.
+
+    Example:
+        ```python
+        import screen_brightness_control as sbc
+
+        bus = sbc.linux.I2C('/dev/i2c-4')
+        current, maximum = bus.get_vcp(0x10)
+        bus.set_vcp(0x10, 50)
+        bus.close()
+        ```
+    '''
+
+    I2C_SLAVE = 0x0703
+    '''the ioctl request that sets the address of the I2C device to talk to'''
+    DDCCI_ADDR = 0x37
+    '''the I2C address that monitors accept DDC/CI commands on'''
+    EDID_ADDR = 0x50
+    '''the I2C address that monitors serve their EDID on'''
+    HOST_ADDR_R = 0x50
+    '''the virtual host address that the checksums of replies are calculated with'''
+    HOST_ADDR_W = 0x51
+    '''the source address the host puts at the start of every message'''
+    DESTINATION_ADDR_W = 0x6e
+    '''the write address of the monitor (`DDCCI_ADDR` shifted left), used to calculate the checksums of messages'''
+    GET_VCP_CMD = 0x01
+    '''the opcode of a VCP feature request'''
+    GET_VCP_REPLY = 0x02
+    '''the opcode of a VCP feature reply'''
+    SET_VCP_CMD = 0x03
+    '''the opcode of a set VCP feature command'''
+    WAIT_TIME = 0.05
+    '''how long (in seconds) to wait between messages to the same monitor, as required by the DDC/CI spec'''
+
+    class Device:
+        '''Thin wrapper around a Linux I2C device node. `I2C` also accepts any object with the same methods'''
+
+        def __init__(self, path: str):
+            '''
+            Args:
+                path (str): the path to the device node. EG: '/dev/i2c-4'
+            '''
+            self.fd = os.open(path, os.O_RDWR)
+
+        def set_address(self, address: int):
+            '''sets the address of the I2C device that subsequent reads and writes are sent to'''
+            import fcntl
+            fcntl.ioctl(self.fd, I2C.I2C_SLAVE, address)
+
+        def read(self, length: int) -> bytes:
+            '''reads `length` bytes from the current address'''
+            return os.read(self.fd, length)
+
+        def write(self, data: bytes) -> int:
+            '''writes `data` to the current address'''
+            return os.write(self.fd, data)
+
+        def close(self):
+            '''closes the device node'''
+            os.close(self.fd)
+
+    def __init__(self, device: Union[str, 'I2C.Device']):
+        '''
+        Args:
+            device (str or I2C.Device): the path to an I2C device node or an object with
+                the same methods as `I2C.Device` (EG: one that simulates a monitor)
+        '''
+        self.device = I2C.Device(device) if isinstance(device, str) else device
+        self.lock = threading.Lock()
+        '''held while talking to the device so messages from different threads do not interleave'''
+        self.wait_time = I2C.WAIT_TIME
+        '''how long (in seconds) to wait between messages to this device'''
+        self._last_message = 0
+
+    @staticmethod
+    def checksum(data: bytes, initial: int) -> int:
+        '''
+        Calculates a DDC/CI checksum
+
+        Args:
+            data (bytes): the message, excluding the checksum
+            initial (int): the address the checksum starts from.
+                `I2C.DESTINATION_ADDR_W` for messages and `I2C.HOST_ADDR_R` for replies
+
+        Returns:
+            int: the checksum, which is every byte XORed together
+        '''
+        for byte in data:
+            initial ^= byte
+        return initial
+
+    def _wait(self):
+        '''internal function, blocks until enough time has passed since the last message'''
+        delay = self._last_message + self.wait_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _write_ddcci(self, payload: bytes):
+        '''internal function, wraps a payload in a DDC/CI message and sends it to the monitor'''
+        data = bytes([I2C.HOST_ADDR_W, 0x80 | len(payload)]) + payload
+        data += bytes([I2C.checksum(data, I2C.DESTINATION_ADDR_W)])
+        self._wait()
+        self.device.set_address(I2C.DDCCI_ADDR)
+        self.device.write(data)
+        self._last_message = time.monotonic()
+
+    def get_vcp(self, code: int) -> Tuple[int, int]:
+        '''
+        Reads a VCP feature from the monitor
+
+        Args:
+            code (int): the VCP code of the feature. EG: 0x10 for brightness
+
+        Returns:
+            tuple: the current value and the maximum value of the feature
+
+        Raises:
+            ValueError: if the monitor sent an invalid reply
+            LookupError: if the monitor does not support the feature
+        '''
+        with self.lock:
+            self._write_ddcci(bytes([I2C.GET_VCP_CMD, code]))
+            # the monitor needs time to prepare its reply
+            self._wait()
+            reply = self.device.read(11)
+            self._last_message = time.monotonic()
+
+        if len(reply) != 11 or reply[1] & 0x7f != 8 or reply[2] != I2C.GET_VCP_REPLY:
+            raise ValueError(f'invalid reply to VCP request: {reply.hex()}')
+        if I2C.checksum(reply[:-1], I2C.HOST_ADDR_R) != reply[-1]:
+            raise ValueError(f'invalid checksum in reply to VCP request: {reply.hex()}')
+        if reply[3] != 0:
+            raise LookupError(f'VCP code {code:#04x} is not supported by the monitor')
+        if reply[4] != code:
+            raise ValueError(f'reply is for VCP code {reply[4]:#04x} instead of {code:#04x}')
+        return (reply[8] << 8) | reply[9], (reply[6] << 8) | reply[7]
+
+    def set_vcp(self, code: int, value: int):
+        '''
+        Writes a VCP feature to the monitor. The monitor does not reply, so success cannot be confirmed
+
+        Args:
+            code (int): the VCP code of the feature. EG: 0x10 for brightness
+            value (int): the value to set the feature to
+        '''
+        with self.lock:
+            self._write_ddcci(bytes([I2C.SET_VCP_CMD, code, (value >> 8) & 0xff, value & 0xff]))
+
+    def read_edid(self) -> str:
+        '''
+        Reads the EDID of the monitor
+
+        Returns:
+            str: the first 128 bytes of the EDID as a hex string (formatted as: '00ffffff00...')
+
+        Raises:
+            ValueError: if the data read does not have a valid EDID header
+        '''
+        with self.lock:
+            self.device.set_address(I2C.EDID_ADDR)
+            self.device.write(b'\x00')
+            edid = self.device.read(128)
+        if len(edid) != 128 or edid[:8] != bytes.fromhex('00ffffffffffff00'):
+            raise ValueError('invalid EDID header')
+        return edid.hex()
+
+    def close(self):
+        '''closes the underlying device'''
+        self.device.close()
+
+
+class DDCUtil:
+    '''collection of screen brightness related methods using the ddcutil executable'''
+
+    executable = 'ddcutil'
+    '''the ddcutil executable to be called'''
+    sleep_multiplier = 0.5
+    '''how long ddcutil should sleep between each DDC request (lower is shorter).
+    See [the ddcutil docs](https://www.ddcutil.com/performance_options/) for more info.
+    When `adaptive_sleep` is enabled this is the value each monitor starts from.'''
+    adaptive_sleep = True
+    '''whether to tune the sleep multiplier for each monitor individually. It is lowered while a monitor
+    keeps answering reads and verified writes and raised when it fails. Raw I2C messages are never sent
+    closer together than `I2C.WAIT_TIME`, so a lowered multiplier only speeds up calls to `ddcutil`.
+    Learned values are stored in `sleep_multipliers_path`'''
+    sleep_multipliers_path = os.path.join(os.path.dirname(TopologyCache.path), 'sleep_multipliers.json')
+    '''the file that learned sleep multipliers are stored in. Set to None to keep them in memory only'''
+    _sleep_multipliers = None
+    '''internal. Maps EDIDs to a list of the learned sleep multiplier and the number of consecutive successes'''
+    _sleep_multipliers_lock = threading.Lock()
+    use_sysfs = True
+    '''whether to discover monitors by reading the DRM connectors in sysfs before falling back to `ddcutil detect`'''
+    sysfs_root = '/sys/class/drm'
+    '''the directory that DRM connectors are read from'''
+    concurrent_detection = True
+    '''whether to probe each I2C bus in parallel before falling back to a single `ddcutil detect`,
+    which probes every bus one after another'''
+    max_workers = 8
+    '''the maximum number of I2C buses that are probed at the same time when `concurrent_detection` is enabled'''
+    use_i2c = True
+    '''whether to talk to monitors directly over `/dev/i2c-*` (see `I2C`) before falling back to ddcutil'''
+    _buses = {}
+    '''internal. Maps I2C bus paths to open `I2C` instances'''
+    _buses_lock = threading.Lock()
+
+    @staticmethod
+    def get_display_info(display: Optional[Union[int, str]] = None) -> List[dict]:
+        '''
+        Returns information about all DDC compatible monitors shown by DDCUtil
+        Works by reading the EDID and DDC bus of each connector in `/sys/class/drm`.
+        If that finds nothing, each I2C bus is probed in parallel and, failing that,
+        it falls back to calling the command 'ddcutil detect' and parsing the output.
+
+        Args:
+            display (int or str): [*Optional*] The monitor to return info about.
+                Pass in the serial number, name, model, i2c bus, edid or index.
+                This is passed to `filter_monitors`
+
+        Returns:
+            list: list of dicts
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            info = sbc.linux.DDCUtil.get_display_info()
+            for i in info:
+                print('================')
+                for key, value in i.items():
+                    print(key, ':', value)
+
+            # get information about the first DDCUtil addressable monitor
+            primary_info = sbc.linux.DDCUtil.get_display_info(0)[0]
+
+            # get information about a monitor with a specific name
+            benq_info = sbc.linux.DDCUtil.get_display_info('BenQ GL2450HM')[0]
+            ```
+        '''
+        # DDC monitor info is slow to gather but rarely changes
+        data = __cache__.fetch('ddcutil_monitors_info', DDCUtil._query_display_info, namespace='capabilities')[0]
+
+        if display is not None:
+            data = filter_monitors(display=display, haystack=data, include=['i2c_bus'])
+        return data
+
+    @staticmethod
+    @__metrics__.timed('DDCUtil._query_display_info')
+    def _query_display_info() -> List[dict]:
+        '''internal function, gathers the display info without caching. Use `DDCUtil.get_display_info` instead'''
+        import subprocess
+
+        data = TopologyCache.load('ddcutil')
+        if data is not None:
+            return data
+        if DDCUtil.use_sysfs:
+            data = DDCUtil._query_sysfs() or None
+        if data is None and DDCUtil.concurrent_detection:
+            data = DDCUtil._query_buses() or None
+        if data is None:
+            data = DDCUtil._parse_detect(
+                _check_output(
+                    [
+                        DDCUtil.executable,
+                        'detect', '-v',
+                        f'--sleep-multiplier={DDCUtil.sleep_multiplier}'
+                    ], stderr=subprocess.DEVNULL
+                )
+            )
+        # whichever way the monitors were found, the next process can skip finding them again
+        TopologyCache.save('ddcutil', data)
+        return data
+
+    @staticmethod
+    def _parse_detect(output: bytes) -> List[dict]:
+        '''
+        internal function, parses the output of `ddcutil detect -v` in a single pass.
+        Works on the raw bytes so that non UTF-8 text in EDIDs does not cause problems, and
+        handles the output formats of ddcutil 0.9 through 2.x (EG: 'Mfg id: GSM' and 'Mfg id: GSM - LG Electronics').
+        Invalid and phantom displays, as well as displays that are not on an I2C bus, are left out
+
+        Args:
+            output (bytes): the output of the command
+
+        Returns:
+            list: list of dicts
+        '''
+        def add(tmp, edid):
+            if tmp is None or 'i2c_bus' not in tmp:
+                return
+            if len(edid) >= 128:
+                tmp['edid'] = edid[:128].hex()
+            if tmp['name'] is None:
+                tmp['name'] = os.path.basename(tmp['i2c_bus'])
+            tmp['index'] = len(data)
+            data.append(tmp)
+
+        data = []
+        tmp = None
+        edid = b''
+        for line in output.split(b'\n'):
+            if not line.strip():
+                continue
+            if not line[:1].isspace():
+                add(tmp, edid)
+                tmp, edid = None, b''
+                if line.startswith(b'Display '):
+                    tmp = {
+                        'name': None,
+                        'method': DDCUtil,
+                        'index': None,
+                        'model': None,
+                        'serial': None,
+                        'manufacturer': None,
+                        'manufacturer_id': None,
+                        'edid': None
+                    }
+                continue
+            if tmp is None:
+                continue
+
+            line = line.strip()
+            if line.startswith(b'+0'):
+                # EDID hex dump rows look like '+0000   00 ff ff ff ff ff ff 00 1e 6d ...   .........m..'
+                row = line.split()[1:17]
+                try:
+                    edid += bytes.fromhex(b''.join(row).decode('ascii'))
+                except ValueError:
+                    pass
+                continue
+
+            key, _, value = line.partition(b':')
+            key = key.strip()
+            value = value.strip().decode('utf-8', errors='replace')
+            if key == b'I2C bus' and '/dev/i2c-' in value:
+                tmp['i2c_bus'] = value.split()[0]
+                tmp['bus_number'] = int(tmp['i2c_bus'][9:])
+            elif key == b'Mfg id' and value:
+                tmp['manufacturer_id'] = value.split()[0]
+                try:
+                    tmp['manufacturer_id'], tmp['manufacturer'] = _monitor_brand_lookup(tmp['manufacturer_id'])
+                except Exception:
+                    pass
+            elif key == b'Model' and value:
+                name = value.split()
+                name[0] = name[0].lower().capitalize()
+                tmp['name'] = ' '.join(name)
+                if len(name) > 1:
+                    tmp['model'] = name[1]
+            elif key == b'Serial number' and value:
+                tmp['serial'] = value.replace(' ', '')
+        add(tmp, edid)
+        return data
+
+    @staticmethod
+    def _connectors() -> List[Tuple[str, str]]:
+        '''
+        internal function, lists the connected DRM connectors in `DDCUtil.sysfs_root` that have a DDC bus.
+        Internal panels (eDP, LVDS and DSI) are skipped because they are not controlled over DDC/CI
+
+        Returns:
+            list: list of tuples of the connector's path and the name of its bus (EG: 'i2c-4')
+        '''
+        connectors = []
+        for connector in glob.glob(os.path.join(DDCUtil.sysfs_root, 'card*-*')):
+            # connectors are named like 'card0-DP-1'
+            if os.path.basename(connector).split('-', 1)[1].startswith(('eDP', 'LVDS', 'DSI')):
+                continue
+            try:
+                with open(os.path.join(connector, 'status'), 'r') as f:
+                    if f.read().strip() != 'connected':
+                        continue
+            except OSError:
+                continue
+
+            # most drivers link the DDC adapter as 'ddc' but some nest it in the connector as 'i2c-N'
+            if os.path.exists(os.path.join(connector, 'ddc')):
+                bus = os.path.basename(os.path.realpath(os.path.join(connector, 'ddc')))
+            else:
+                bus = [os.path.basename(i) for i in glob.glob(os.path.join(connector, 'i2c-*'))]
+                bus = bus[0] if bus else ''
+            if bus.startswith('i2c-') and bus[4:].isdigit():
+                connectors.append((connector, bus))
+        return connectors
+
+    @staticmethod
+    def _info_from_edid(edid: str, bus_number: int, name: str) -> dict:
+        '''
+        internal function, builds the display info for a monitor from its EDID
+
+        Args:
+            edid (str): the EDID of the monitor
+            bus_number (int): the number of the I2C bus the monitor is attached to
+            name (str): the name to use if one cannot be found in the EDID
+
+        Returns:
+            dict
+        '''
+        tmp = {
+            'name': name,
+            'method': DDCUtil,
+            'index': None,
+            'model': None,
+            'serial': None,
+            'manufacturer': None,
+            'manufacturer_id': None,
+            'edid': edid,
+            'i2c_bus': f'/dev/i2c-{bus_number}',
+            'bus_number': bus_number
+        }
+        try:
+            # the manufacturer id is 3 letters packed into 5 bits each
+            mfg = struct.unpack('>H', bytes.fromhex(edid[16:20]))[0]
+            tmp['manufacturer_id'] = ''.join(chr(((mfg >> i) & 0x1f) + 64) for i in (10, 5, 0))
+            tmp['manufacturer_id'], tmp['manufacturer'] = _monitor_brand_lookup(tmp['manufacturer_id'])
+        except Exception:
+            pass
+        try:
+            name, serial = _EDID.parse_edid(edid)
+            tmp['serial'] = serial
+            if name is not None:
+                tmp['name'] = name
+                tmp['model'] = name.split(' ')[1]
+        except Exception:
+            pass
+        return tmp
+
+    @staticmethod
+    def _sort_by_bus(data: List[dict]) -> List[dict]:
+        '''internal function, sorts display info by bus number and indexes it in that order, like `ddcutil detect`'''
+        data.sort(key=lambda i: i['bus_number'])
+        for index, monitor in enumerate(data):
+            monitor['index'] = index
+        return data
+
+    @staticmethod
+    def _query_sysfs() -> List[dict]:
+        '''
+        internal function, gathers the display info from the DRM connectors in `DDCUtil.sysfs_root`.
+        Only connected connectors with an EDID and a DDC bus are included, and only once the monitor
+        on that bus has answered a DDC/CI request (see `DDCUtil._supports_ddc`), since having an EDID
+        does not mean that a monitor supports DDC/CI
+
+        Returns:
+            list: list of dicts, sorted by I2C bus number. Empty if nothing was found
+        '''
+        from concurrent.futures import ThreadPoolExecutor
+
+        data = []
+        for connector, bus in DDCUtil._connectors():
+            edid = _read_edid(os.path.join(connector, 'edid'))
+            if edid is not None:
+                interface = os.path.basename(connector).split('-', 1)[1]
+                data.append(DDCUtil._info_from_edid(edid, int(bus[4:]), interface))
+        if not data:
+            return []
+        with ThreadPoolExecutor(max_workers=min(DDCUtil.max_workers, len(data))) as executor:
+            supported = list(executor.map(DDCUtil._supports_ddc, [i['bus_number'] for i in data]))
+        return DDCUtil._sort_by_bus([i for i, ok in zip(data, supported) if ok])
+
+    @staticmethod
+    def _supports_ddc(bus_number: int) -> bool:
+        '''
+        internal function, checks that the monitor on an I2C bus answers DDC/CI brightness requests.
+        Uses `I2C` if `DDCUtil.use_i2c` is enabled, falling back to `ddcutil getvcp --bus`
+
+        Args:
+            bus_number (int): the number of the bus to check
+
+        Returns:
+            bool
+        '''
+        import subprocess
+
+        if DDCUtil.use_i2c:
+            monitor = {'i2c_bus': f'/dev/i2c-{bus_number}'}
+            try:
+                bus = DDCUtil._get_bus(monitor)
+            except Exception:
+                # the bus cannot be opened (EG: permission denied), so let ddcutil try
+                pass
+            else:
+                try:
+                    bus.get_vcp(0x10)
+                except Exception:
+                    DDCUtil._close_bus(monitor)
+                    return False
+                return True
+
+        try:
+            return _run(
+                [
+                    DDCUtil.executable,
+                    'getvcp', '10',
+                    '--bus', str(bus_number),
+                    f'--sleep-multiplier={DDCUtil.sleep_multiplier}'
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            ).returncode == 0
+        except Exception:
+            return False
+
+    @staticmethod
+    def _candidate_buses() -> List[int]:
+        '''
+        internal function, lists the numbers of the I2C buses that may have a monitor attached.
+        These are the DDC buses of connected DRM connectors or, if there are none,
+        every bus in `/dev` apart from SMBus adapters
+
+        Returns:
+            list: list of ints
+        '''
+        buses = set(int(bus[4:]) for _, bus in DDCUtil._connectors())
+        if not buses:
+            for device in glob.glob('/dev/i2c-*'):
+                number = device[9:]
+                if not number.isdigit():
+                    continue
+                try:
+                    with open(f'/sys/bus/i2c/devices/i2c-{number}/name', 'r') as f:
+                        if 'smbus' in f.read().lower():
+                            continue
+                except OSError:
+                    pass
+                buses.add(int(number))
+        return sorted(buses)
+
+    @staticmethod
+    def _probe_bus(bus_number: int) -> List[dict]:
+        '''
+        internal function, checks a single I2C bus for a DDC/CI capable monitor.
+        Uses `I2C` if `DDCUtil.use_i2c` is enabled, only falling back to `ddcutil detect --bus`
+        if the bus cannot be opened (EG: permission denied)
+
+        Args:
+            bus_number (int): the number of the bus to probe
+
+        Returns:
+            list: a list containing the display info of the monitor. Empty if there is no DDC/CI capable monitor
+        '''
+        import subprocess
+
+        if DDCUtil.use_i2c:
+            monitor = {'i2c_bus': f'/dev/i2c-{bus_number}'}
+            try:
+                bus = DDCUtil._get_bus(monitor)
+            except Exception:
+                # ddcutil may be able to open the bus if this process cannot
+                pass
+            else:
+                try:
+                    edid = bus.read_edid()
+                    bus.get_vcp(0x10)
+                except Exception:
+                    # the bus works but nothing on it answers (EG: an idle aux channel) so
+                    # asking ddcutil would only cost a process to get the same answer
+                    DDCUtil._close_bus(monitor)
+                    return []
+                return [DDCUtil._info_from_edid(edid, bus_number, f'i2c-{bus_number}')]
+
+        try:
+            data = DDCUtil._parse_detect(
+                _check_output(
+                    [
+                        DDCUtil.executable,
+                        'detect', '-v',
+                        '--bus', str(bus_number),
+                        f'--sleep-multiplier={DDCUtil.sleep_multiplier}'
+                    ], stderr=subprocess.DEVNULL
+                )
+            )
+        except Exception:
+            return []
+        return [i for i in data if i.get('bus_number') == bus_number]
+
+    @staticmethod
+    def _query_buses() -> List[dict]:
+        '''
+        internal function, gathers the display info by probing every candidate I2C bus in parallel,
+        using at most `DDCUtil.max_workers` threads
+
+        Returns:
+            list: list of dicts, sorted by I2C bus number. Empty if nothing was found
+        '''
+        from concurrent.futures import ThreadPoolExecutor
+
+        buses = DDCUtil._candidate_buses()
+        if not buses:
+            return []
+        with ThreadPoolExecutor(max_workers=min(DDCUtil.max_workers, len(buses))) as executor:
+            data = flatten_list(list(executor.map(DDCUtil._probe_bus, buses)))
+        return DDCUtil._sort_by_bus(data)
+
+    @staticmethod
+    def get_display_names() -> List[str]:
+        '''
+        Returns the names of each display, as reported by ddcutil
+
+        Returns:
+            list: list of strings
+
+        Example:
+            ```python
+            import screen_brightness_control as sbc
+
+            names = sbc.linux.DDCUtil.get_display_names()
+            # EG output: ['Dell U2211H', 'BenQ GL2450H']
+            ```
+        '''
+        return [i['name'] for i in DDCUtil.get_display_info()]
 
     @staticmethod
-    def get_brightness(display: Optional[Union[int, str]] = None) -> List[int]:
+    @__metrics__.timed('DDCUtil.get_brightness')
+    def get_brightness(
+        display: Optional[Union[int, str, dict]] = None,
+        max_stale: float = 0,
+        with_age: bool = False
+    ) -> Union[List[int], List[Tuple[int, float]]]:
         '''
-        Returns the brightness for a display using the xrandr executable
+        Returns the brightness for a display using the ddcutil executable
 
         Args:
-            display (int or str): The specific display you wish to query.
-                Can be index, name, model, serial, interface or edid string.
+            display (int, str or dict): The specific display you wish to query.
+                Can be index, name, model, serial, i2c bus or edid string.
                 `int` is faster as it isn't passed to `filter_monitors` to be matched against.
                 `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
+            max_stale (float): if a cached reading has expired but is no more than this many seconds old,
+                it is returned immediately and refreshed in the background
+            with_age (bool): if True, each value is returned as a tuple of the brightness
+                and the age (in seconds) of that reading
 
         Returns:
-            list: list of integers (from 0 to 100)
+            list: list of ints (0 to 100)
 
         Example:
             ```python
             import screen_brightness_control as sbc
 
             # get the current brightness
-            current_brightness = sbc.linux.XRandr.get_brightness()
+            current_brightness = sbc.linux.DDCUtil.get_brightness()
 
             # get the current brightness for the primary display
-            primary_brightness = sbc.linux.XRandr.get_brightness(display=0)[0]
+            primary_brightness = sbc.linux.DDCUtil.get_brightness(display=0)[0]
             ```
         '''
-        monitors = XRandr.get_display_info()
-        if display is not None:
-            if type(display) == int:
-                monitors = [monitors[display]]
-            else:
-                monitors = filter_monitors(display=display, haystack=monitors, include=['interface'])
-        brightness = [i['brightness'] for i in monitors]
-
-        return brightness
+        if isinstance(display, dict):
+            monitors = [display]
+        else:
+            monitors = DDCUtil.get_display_info()
+            if display is not None:
+                if type(display) == int:
+                    monitors = [monitors[display]]
+                else:
+                    monitors = filter_monitors(display=display, haystack=monitors, include=['i2c_bus'])
+        res = []
+        for m in monitors:
+            out, age = __cache__.fetch(
+                'ddcutil_' + m['edid'] + '_brightness',
+                lambda m=m: DDCUtil._read_brightness(m),
+                namespace='brightness', max_stale=max_stale
+            )
+            try:
+                res.append((int(out), age) if with_age else int(out))
+            except Exception:
+                pass
+        return res
 
     @staticmethod
-    def set_brightness(
-        value: int,
-        display: Optional[Union[int, str]] = None,
-        no_return: bool = False
-    ) -> Union[List[int], None]:
+    def get_sleep_multiplier(monitor: dict) -> float:
         '''
-        Sets the brightness for a display using the xrandr executable
+        Returns the sleep multiplier to use for a monitor
 
         Args:
-            value (int): Sets the brightness to this value
-            display (int): The specific display you wish to query.
-                Can be index, name, model, serial, interface or edid string.
-                `int` is faster as it isn't passed to `filter_monitors` to be matched against.
-                `str` is slower as it is passed to `filter_monitors` to match to a display.
-            no_return (bool): if True, this function returns None
-                Returns the result of `XRandr.get_brightness()` otherwise
+            monitor (dict): the display info of the monitor, as returned by `DDCUtil.get_display_info`
 
         Returns:
-            list: list of ints (0 to 100) (the result of `XRandr.get_brightness`)
-            None: if the `no_return` kwarg is True
+            float: the learned value if `adaptive_sleep` is enabled, otherwise `DDCUtil.sleep_multiplier`
 
         Example:
             ```python
             import screen_brightness_control as sbc
 
-            # set the brightness to 50
-            sbc.linux.XRandr.set_brightness(50)
-
-            # set the brightness of the primary display to 75
-            sbc.linux.XRandr.set_brightness(75, display=0)
+            for monitor in sbc.linux.DDCUtil.get_display_info():
+                print(monitor['name'], sbc.linux.DDCUtil.get_sleep_multiplier(monitor))
             ```
         '''
-        value = str(float(value) / 100)
-        info = XRandr.get_display_info()
-        if display is not None:
-            if type(display) == int:
-                info = [info[display]]
-            else:
-                info = filter_monitors(
-                    display=display,
-                    haystack=info,
-                    include=['interface']
-                )
-
-        for i in info:
-            subprocess.run([XRandr.executable, '--output', i['interface'], '--brightness', value])
-
-        # The get_brightness method takes the brightness value from get_display_info
-        # The problem is that that display info is cached, meaning that the brightness
-        # value is also cached. We must expire it here.
-        __cache__.expire('xrandr_monitors_info')
-        return XRandr.get_brightness(display=display) if not no_return else None
+        if not DDCUtil.adaptive_sleep:
+            return DDCUtil.sleep_multiplier
+        with DDCUtil._sleep_multipliers_lock:
+            DDCUtil._load_sleep_multipliers()
+            entry = DDCUtil._sleep_multipliers.get(str(monitor['edid'] or monitor['i2c_bus']))
+        return DDCUtil.sleep_multiplier if entry is None else entry[0]
 
+    @staticmethod
+    def _load_sleep_multipliers():
+        '''internal function, loads the learned sleep multipliers from disk the first time they are needed'''
+        import json
+
+        if DDCUtil._sleep_multipliers is not None:
+            return
+        DDCUtil._sleep_multipliers = {}
+        if DDCUtil.sleep_multipliers_path is None:
+            return
+        try:
+            with open(DDCUtil.sleep_multipliers_path, 'r') as f:
+                data = json.load(f)
+            DDCUtil._sleep_multipliers = {key: [float(value), 0] for key, value in data.items()}
+        except Exception:
+            pass
 
-class DDCUtil:
-    '''collection of screen brightness related methods using the ddcutil executable'''
+    @staticmethod
+    def _record_result(monitor: dict, success: bool):
+        '''
+        internal function, adjusts the sleep multiplier of a monitor after talking to it.
+        The multiplier is lowered by a fifth after every 3 consecutive successes and doubled after a failure.
+        Only a reply from the monitor (or a write that ddcutil verified) counts as a success, since an
+        unanswered write can go through even when the monitor ignored it
 
-    executable = 'ddcutil'
-    '''the ddcutil executable to be called'''
-    sleep_multiplier = 0.5
-    '''how long ddcutil should sleep between each DDC request (lower is shorter).
-    See [the ddcutil docs](https://www.ddcutil.com/performance_options/) for more info.'''
+        Args:
+            monitor (dict): the display info of the monitor
+            success (bool): whether the monitor responded correctly
+        '''
+        if not DDCUtil.adaptive_sleep:
+            return
+        key = str(monitor['edid'] or monitor['i2c_bus'])
+        with DDCUtil._sleep_multipliers_lock:
+            DDCUtil._load_sleep_multipliers()
+            entry = DDCUtil._sleep_multipliers.setdefault(key, [DDCUtil.sleep_multiplier, 0])
+            old = entry[0]
+            if success:
+                entry[1] += 1
+                if entry[1] >= 3:
+                    entry[0], entry[1] = max(0.1, round(entry[0] * 0.8, 3)), 0
+            else:
+                entry[0], entry[1] = min(2.0, max(entry[0] * 2, DDCUtil.sleep_multiplier)), 0
+            if entry[0] != old and DDCUtil.sleep_multipliers_path is not None:
+                try:
+                    _write_json(
+                        DDCUtil.sleep_multipliers_path,
+                        {key: value[0] for key, value in DDCUtil._sleep_multipliers.items()}
+                    )
+                except Exception:
+                    pass
 
     @staticmethod
-    def get_display_info(display: Optional[Union[int, str]] = None) -> List[dict]:
+    def _with_bus(monitor: dict, func, confirmed: bool = True) -> Tuple[bool, Any]:
         '''
-        Returns information about all DDC compatible monitors shown by DDCUtil
-        Works by calling the command 'ddcutil detect' and parsing the output.
+        internal function, calls `func` with the monitor's `I2C` instance, timed using the monitor's sleep multiplier
 
         Args:
-            display (int or str): [*Optional*] The monitor to return info about.
-                Pass in the serial number, name, model, i2c bus, edid or index.
-                This is passed to `filter_monitors`
+            monitor (dict): the display info of the monitor
+            func: called with the `I2C` instance
+            confirmed (bool): whether `func` succeeding means the monitor replied. When False (EG: for writes)
+                only failures are used to tune the sleep multiplier
 
         Returns:
-            list: list of dicts
+            tuple: whether the call succeeded and what `func` returned
+        '''
+        try:
+            bus = DDCUtil._get_bus(monitor)
+        except Exception:
+            # the bus cannot be opened (EG: permission denied) which says nothing about the monitor's timing
+            return False, None
+        # the DDC/CI spec requires at least `I2C.WAIT_TIME` between messages, so the multiplier can only lengthen it
+        bus.wait_time = I2C.WAIT_TIME * max(1, DDCUtil.get_sleep_multiplier(monitor))
+        try:
+            result = func(bus)
+        except Exception:
+            DDCUtil._record_result(monitor, False)
+            DDCUtil._close_bus(monitor)
+            return False, None
+        if confirmed:
+            DDCUtil._record_result(monitor, True)
+        return True, result
 
-        Example:
-            ```python
-            import screen_brightness_control as sbc
+    @staticmethod
+    def _get_bus(monitor: dict) -> I2C:
+        '''internal function, returns an open `I2C` instance for a monitor's bus, reusing it between calls'''
+        with DDCUtil._buses_lock:
+            if monitor['i2c_bus'] not in DDCUtil._buses:
+                DDCUtil._buses[monitor['i2c_bus']] = I2C(monitor['i2c_bus'])
+            return DDCUtil._buses[monitor['i2c_bus']]
 
-            info = sbc.linux.DDCUtil.get_display_info()
-            for i in info:
-                print('================')
-                for key, value in i.items():
-                    print(key, ':', value)
+    @staticmethod
+    def _close_bus(monitor: dict):
+        '''internal function, closes a monitor's `I2C` instance so it is reopened on the next call'''
+        with DDCUtil._buses_lock:
+            bus = DDCUtil._buses.pop(monitor['i2c_bus'], None)
+        if bus is not None:
+            try:
+                bus.close()
+            except OSError:
+                pass
 
-            # get information about the first DDCUtil addressable monitor
-            primary_info = sbc.linux.DDCUtil.get_display_info(0)[0]
+    @staticmethod
+    def _parse_getvcp(output: str) -> Dict[int, VCPValue]:
+        '''
+        internal function, parses the terse output of `ddcutil getvcp -t`.
+        Continuous features look like 'VCP 10 C 50 100' and non-continuous ones like 'VCP 14 SNC x05'.
+        Unsupported features ('VCP 12 ERR') are left out
 
-            # get information about a monitor with a specific name
-            benq_info = sbc.linux.DDCUtil.get_display_info('BenQ GL2450HM')[0]
-            ```
+        Returns:
+            dict: VCP codes mapped to their values
         '''
-        def check_tmp(tmp):
-            if tmp != {} and 'Invalid display' not in tmp['tmp']:
-                if 'tmp' in tmp:
-                    del(tmp['tmp'])
-                return True
-            return False
+        values = {}
+        for line in output.splitlines():
+            parts = line.split()
+            if len(parts) < 4 or parts[0] != 'VCP':
+                continue
+            try:
+                code = int(parts[1], 16)
+                if parts[2] == 'C':
+                    values[code] = VCPValue(code, int(parts[3]), int(parts[4]))
+                elif parts[2] == 'SNC':
+                    values[code] = VCPValue(code, int(parts[3].lstrip('x'), 16), None)
+            except (ValueError, IndexError):
+                pass
+        return values
+
+    @staticmethod
+    def _read_vcp(monitor: dict, codes: List[int]) -> Dict[int, VCPValue]:
+        '''
+        internal function, reads several VCP features from a monitor in one round trip, bypassing the cache
+
+        Args:
+            monitor (dict): the display info of the monitor
+            codes (list): the VCP codes to read
 
+        Returns:
+            dict: VCP codes mapped to their values. Unsupported codes are left out
+        '''
+        if DDCUtil.use_i2c:
+            def read(bus):
+                values = {}
+                for code in codes:
+                    try:
+                        values[code] = VCPValue(code, *bus.get_vcp(code))
+                    except LookupError:
+                        pass
+                return values
+
+            success, result = DDCUtil._with_bus(monitor, read)
+            if success:
+                return result
         try:
-            data = __cache__.get('ddcutil_monitors_info')
+            result = DDCUtil._parse_getvcp(
+                _check_output(
+                    [DDCUtil.executable, 'getvcp']
+                    + [f'{code:02x}' for code in codes]
+                    + [
+                        '-t',
+                        '-b', str(monitor['bus_number']),
+                        f'--sleep-multiplier={DDCUtil.get_sleep_multiplier(monitor)}'
+                    ]
+                ).decode()
+            )
         except Exception:
-            out = []
-            # Use -v to get EDID string but this means output cannot be decoded.
-            # Or maybe it can. I don't know the encoding though, so let's assume it cannot be decoded.
-            # Use str()[2:-1] workaround
-            cmd_out = str(
-                subprocess.check_output(
-                    [
-                        DDCUtil.executable,
-                        'detect', '-v',
-                        f'--sleep-multiplier={DDCUtil.sleep_multiplier}'
-                    ], stderr=subprocess.DEVNULL
-                )
-            )[2:-1].split('\\n')
+            DDCUtil._record_result(monitor, False)
+            raise
+        DDCUtil._record_result(monitor, True)
+        return result
 
-            for line in cmd_out:
-                if line != '' and line.startswith(('Invalid display', 'Display', '\t', ' ')):
-                    out.append(line)
-            data = []
-            tmp = {}
-            count = 0
-            for i in range(len(out)):
-                line = out[i]
-                if not line.startswith(('\t', ' ')):
-                    if check_tmp(tmp):
-                        data.append(tmp)
-                    tmp = {
-                        'tmp': line,
-                        'method': DDCUtil,
-                        'index': count,
-                        'model': None,
-                        'serial': None,
-                        'manufacturer': None,
-                        'manufacturer_id': None,
-                        'edid': None
-                    }
-                    count += 1
-                else:
-                    if 'I2C bus' in line:
-                        tmp['i2c_bus'] = line[line.index('/'):]
-                        tmp['bus_number'] = int(tmp['i2c_bus'].replace('/dev/i2c-', ''))
-                    elif 'Mfg id' in line:
-                        tmp['manufacturer_id'] = line.replace('Mfg id:', '').replace('\t', '').replace(' ', '')
-                        try:
-                            tmp['manufacturer_id'], tmp['manufacturer'] = _monitor_brand_lookup(tmp['manufacturer_id'])
-                        except Exception:
-                            pass
-                    elif 'Model' in line:
-                        name = [i for i in line.replace('Model:', '').replace('\t', '').split(' ') if i != '']
-                        try:
-                            name[0] = name[0].lower().capitalize()
-                        except IndexError:
-                            pass
-                        tmp['name'] = ' '.join(name)
-                        try:
-                            tmp['model'] = name[1]
-                        except IndexError:
-                            pass
-                    elif 'Serial number' in line:
-                        tmp['serial'] = line.replace('Serial number:', '').replace('\t', '').replace(' ', '')
-                    elif 'EDID hex dump:' in line:
-                        try:
-                            tmp['edid'] = ''.join(
-                                j[j.index('+0') + 8: j.index('+0') + 55].replace(' ', '') for j in out[i + 2: i + 10]
-                            )
-                        except Exception:
-                            pass
-            if check_tmp(tmp):
-                data.append(tmp)
-            __cache__.store('ddcutil_monitors_info', data)
+    @staticmethod
+    def _write_vcp(monitor: dict, values: Dict[int, int]) -> bool:
+        '''
+        internal function, writes several VCP features to a monitor in one round trip
 
-        if display is not None:
-            data = filter_monitors(display=display, haystack=data, include=['i2c_bus'])
-        return data
+        Args:
+            monitor (dict): the display info of the monitor
+            values (dict): VCP codes mapped to the values to set them to
+
+        Returns:
+            bool: whether the values were written successfully
+        '''
+        if DDCUtil.use_i2c:
+            def write(bus):
+                for code, value in values.items():
+                    bus.set_vcp(code, value)
+
+            # the monitor does not reply to a set VCP command, so a write is not proof that it is keeping up
+            if DDCUtil._with_bus(monitor, write, confirmed=False)[0]:
+                return True
+        cmd = [DDCUtil.executable, 'setvcp']
+        for code, value in values.items():
+            cmd += [f'{code:02x}', str(value)]
+        cmd += ['-b', str(monitor['bus_number']), f'--sleep-multiplier={DDCUtil.get_sleep_multiplier(monitor)}']
+        # ddcutil reads each value back after setting it (`--verify` is the default), so success is confirmed
+        success = _run(cmd).returncode == 0
+        DDCUtil._record_result(monitor, success)
+        return success
 
     @staticmethod
-    def get_display_names() -> List[str]:
+    @__metrics__.timed('DDCUtil.get_vcp')
+    def get_vcp(codes: List[int], display: Optional[Union[int, str, dict]] = None) -> List[Dict[int, VCPValue]]:
         '''
-        Returns the names of each display, as reported by ddcutil
+        Reads several VCP features from each display, using one round trip per display
+
+        Args:
+            codes (list): the VCP codes to read. EG: `[0x10, 0x12]` for brightness and contrast
+            display (int, str or dict): The specific display you wish to query.
+                Can be index, name, model, serial, i2c bus, edid string or
+                an entry from `get_display_info`.
 
         Returns:
-            list: list of strings
+            list: a dict for each display, mapping the VCP codes to `VCPValue` tuples.
+                Codes that a display does not support are left out
 
         Example:
             ```python
             import screen_brightness_control as sbc
 
-            names = sbc.linux.DDCUtil.get_display_names()
-            # EG output: ['Dell U2211H', 'BenQ GL2450H']
+            for values in sbc.linux.DDCUtil.get_vcp([0x10, 0x12]):
+                if 0x12 in values:
+                    print('Contrast:', values[0x12].current, 'out of', values[0x12].maximum)
             ```
         '''
-        return [i['name'] for i in DDCUtil.get_display_info()]
+        if isinstance(display, dict):
+            monitors = [display]
+        else:
+            monitors = DDCUtil.get_display_info()
+            if display is not None:
+                if type(display) == int:
+                    monitors = [monitors[display]]
+                else:
+                    monitors = filter_monitors(display=display, haystack=monitors, include=['i2c_bus'])
+        return [DDCUtil._read_vcp(m, codes) for m in monitors]
 
     @staticmethod
-    def get_brightness(display: Optional[Union[int, str]] = None) -> List[int]:
+    @__metrics__.timed('DDCUtil.set_vcp')
+    def set_vcp(values: Dict[int, int], display: Optional[Union[int, str, dict]] = None) -> List[bool]:
         '''
-        Returns the brightness for a display using the ddcutil executable
+        Writes several VCP features to each display, using one round trip per display
 
         Args:
-            display (int or str): The specific display you wish to query.
-                Can be index, name, model, serial, i2c bus or edid string.
-                `int` is faster as it isn't passed to `filter_monitors` to be matched against.
-                `str` is slower as it is passed to `filter_monitors` to match to a display.
+            values (dict): VCP codes mapped to the values to set them to. EG: `{0x10: 50, 0x12: 75}`
+            display (int, str or dict): The specific display you wish to adjust.
+                Can be index, name, model, serial, i2c bus, edid string or
+                an entry from `get_display_info`.
 
         Returns:
-            list: list of ints (0 to 100)
+            list: whether the values were written successfully, for each display
 
         Example:
             ```python
             import screen_brightness_control as sbc
 
-            # get the current brightness
-            current_brightness = sbc.linux.DDCUtil.get_brightness()
-
-            # get the current brightness for the primary display
-            primary_brightness = sbc.linux.DDCUtil.get_brightness(display=0)[0]
+            # set the brightness to 50 and the contrast to 75 on the primary display
+            sbc.linux.DDCUtil.set_vcp({0x10: 50, 0x12: 75}, display=0)
             ```
         '''
-        monitors = DDCUtil.get_display_info()
-        if display is not None:
-            if type(display) == int:
-                monitors = [monitors[display]]
-            else:
-                monitors = filter_monitors(display=display, haystack=monitors, include=['i2c_bus'])
-        res = []
+        if isinstance(display, dict):
+            monitors = [display]
+        else:
+            monitors = DDCUtil.get_display_info()
+            if display is not None:
+                if type(display) == int:
+                    monitors = [monitors[display]]
+                else:
+                    monitors = filter_monitors(display=display, haystack=monitors, include=['i2c_bus'])
+        results = []
         for m in monitors:
-            try:
-                out = __cache__.get('ddcutil_' + m['edid'] + '_brightness')
-                if out is None:
-                    raise Exception
-            except Exception:
-                out = subprocess.check_output(
-                    [
-                        DDCUtil.executable,
-                        'getvcp', '10', '-t',
-                        '-b', str(m['bus_number']),
-                        f'--sleep-multiplier={DDCUtil.sleep_multiplier}'
-                    ]
-                ).decode().split(' ')[-2]
-                __cache__.store('ddcutil_' + m['edid'] + '_brightness', out, expires=0.5)
-            try:
-                res.append(int(out))
-            except Exception:
-                pass
-        return res
+            if 0x10 in values:
+                __cache__.expire('ddcutil_' + str(m['edid']) + '_brightness')
+            results.append(DDCUtil._write_vcp(m, values))
+        return results
 
     @staticmethod
+    def _read_brightness(monitor: dict) -> int:
+        '''internal function, reads the brightness of a monitor, bypassing the cache'''
+        return DDCUtil._read_vcp(monitor, [0x10])[0x10].current
+
+    @staticmethod
+    @__metrics__.timed('DDCUtil.set_brightness')
     def set_brightness(
         value: int,
-        display: Optional[Union[int, str]] = None,
-        no_return: bool = False
+        display: Optional[Union[int, str, dict]] = None,
+        no_return: bool = False,
+        write_through: bool = False,
+        verify: bool = False
     ) -> Union[List[int], None]:
         '''
         Sets the brightness for a display using the ddcutil executable
 
         Args:
             value (int): Sets the brightness to this value
-            display (int or str): The specific display you wish to query.
+            display (int, str or dict): The specific display you wish to query.
                 Can be index, name, model, serial, i2c bus or edid string.
                 `int` is faster as it isn't passed to `filter_monitors` to be matched against.
                 `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
             no_return (bool): if True, this function returns None.
                 Returns the result of `DDCUtil.get_brightness()` otherwise
+            write_through (bool): if True, successfully written values are cached as the
+                current brightness and returned without reading them back from the display
+            verify (bool): if True (and `write_through` is True), the written values are read back
+                in a background thread and the cache is corrected if the display disagrees
 
         Returns:
             list: list of ints (0 to 100)
@@ -797,26 +2741,23 @@ class DDCUtil:
             sbc.linux.DDCUtil.set_brightness(75, display=0)
             ```
         '''
-        monitors = DDCUtil.get_display_info()
-        if display is not None:
-            if type(display) == int:
-                monitors = [monitors[display]]
-            else:
-                monitors = filter_monitors(display=display, haystack=monitors, include=['i2c_bus'])
+        if isinstance(display, dict):
+            monitors = [display]
+        else:
+            monitors = DDCUtil.get_display_info()
+            if display is not None:
+                if type(display) == int:
+                    monitors = [monitors[display]]
+                else:
+                    monitors = filter_monitors(display=display, haystack=monitors, include=['i2c_bus'])
 
-        __cache__.expire(startswith='ddcutil_', endswith='_brightness')
         for m in monitors:
-            subprocess.run(
-                [
-                    DDCUtil.executable,
-                    'setvcp',
-                    '10',
-                    str(value),
-                    '-b',
-                    str(m['bus_number']),
-                    f'--sleep-multiplier={DDCUtil.sleep_multiplier}'
-                ]
-            )
+            key = 'ddcutil_' + str(m['edid']) + '_brightness'
+            __cache__.expire(key)
+            if DDCUtil._write_vcp(m, {0x10: value}) and write_through:
+                __cache__.store(key, value, namespace='brightness')
+                if verify:
+                    _verify_brightness(key, lambda m=m: int(DDCUtil._read_brightness(m)), value)
 
         return DDCUtil.get_brightness(display=display) if not no_return else None
 
@@ -826,7 +2767,7 @@ def list_monitors_info(method: Optional[str] = None, allow_duplicates: bool = Fa
     Lists detailed information about all detected monitors
 
     Args:
-        method (str): the method the monitor can be addressed by. Can be 'xrandr' or 'ddcutil' or 'light'
+        method (str): the method the monitor can be addressed by. Can be 'xrandr', 'ddcutil', 'sysfs' or 'light'
         allow_duplicates (bool): whether to filter out duplicate displays (displays with the same EDID) or not
 
     Returns:
@@ -865,34 +2806,144 @@ def list_monitors_info(method: Optional[str] = None, allow_duplicates: bool = Fa
             print('Method:', monitor['method'])
         ```
     '''
-    try:
-        return __cache__.get('linux_monitors_info', method=method, allow_duplicates=allow_duplicates)
-    except Exception:
-        methods = [XRandr, DDCUtil, Light]
-        if method is not None:
-            method = method.lower()
-            if method not in ('xrandr', 'ddcutil', 'light'):
-                raise ValueError('method must be \'xrandr\' or \'ddcutil\' or \'light\' to get monitor information')
+    methods = [XRandr, DDCUtil, SysFS, Light]
+    if method is not None:
+        method = method.lower()
+        if method not in ('xrandr', 'ddcutil', 'sysfs', 'light'):
+            raise ValueError(
+                'method must be \'xrandr\' or \'ddcutil\' or \'sysfs\' or \'light\' to get monitor information'
+            )
+
+    # discovery is run once for every method and cached. The method-filtered and
+    # de-duplicated views are derived from that so they never trigger a rediscovery
+    def discover():
+        from concurrent.futures import ThreadPoolExecutor
 
+        # each method is probed in its own thread so discovery takes as long as the
+        # slowest method (usually ddcutil) rather than the sum of them all
+        with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+            futures = [executor.submit(m.get_display_info) for m in methods]
         info = []
-        edids = []
-        for m in methods:
-            if method is None or method == m.__name__.lower():
-                # to make sure each display (with unique edid) is only reported once
-                for i in m.get_display_info():
-                    if allow_duplicates or i['edid'] not in edids:
-                        edids.append(i['edid'])
-                        info.append(i)
-        __cache__.store('linux_monitors_info', info, method=method, allow_duplicates=allow_duplicates)
+        errors = []
+        # collect the results in the same order as the methods for deterministic indexes
+        for future in futures:
+            try:
+                info += future.result()
+            except Exception as e:
+                # one missing program (eg: xrandr) should not hide the monitors found by the other methods
+                errors.append(e)
+        if len(errors) == len(methods):
+            raise errors[0]
+        return info
+
+    if method is not None and 'linux_monitors_info' not in __cache__:
+        # only the requested method has to be probed when the full result isn't to hand
+        info = [m for m in methods if m.__name__.lower() == method][0].get_display_info()
+    else:
+        info = __cache__.fetch('linux_monitors_info', discover, namespace='discovery')[0]
+
+    if method is None and allow_duplicates:
         return info
 
+    filtered = []
+    edids = set()
+    for i in info:
+        if method is None or method == i['method'].__name__.lower():
+            # to make sure each display (with unique edid) is only reported once
+            if allow_duplicates or i['edid'] not in edids:
+                edids.add(i['edid'])
+                filtered.append(i)
+    return filtered
+
+
+def iter_monitors_info(method: Optional[str] = None, allow_duplicates: bool = False) -> Generator[dict, None, None]:
+    '''
+    Yields detailed information about each detected monitor as soon as the method that
+    found it has finished probing, rather than waiting for every method like `list_monitors_info`.
+
+    Monitors are yielded in the order their methods finish. Once all methods have finished
+    the full result is cached, so subsequent calls to either function will not rediscover.
+
+    Args:
+        method (str): the method the monitor can be addressed by. Can be 'xrandr', 'ddcutil', 'sysfs' or 'light'
+        allow_duplicates (bool): whether to skip duplicate displays (displays with the same EDID) or not
+
+    Yields:
+        dict
+
+    Raises:
+        ValueError: if the method kwarg is invalid
+
+    Example:
+        ```python
+        import screen_brightness_control as sbc
+
+        for monitor in sbc.linux.iter_monitors_info():
+            # a laptop display found by `light` is yielded before `ddcutil` finishes
+            print(monitor['name'], monitor['method'])
+        ```
+    '''
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    methods = [XRandr, DDCUtil, SysFS, Light]
+    if method is not None:
+        method = method.lower()
+        if method not in ('xrandr', 'ddcutil', 'sysfs', 'light'):
+            raise ValueError(
+                'method must be \'xrandr\' or \'ddcutil\' or \'sysfs\' or \'light\' to get monitor information'
+            )
+
+    if 'linux_monitors_info' in __cache__:
+        yield from list_monitors_info(method=method, allow_duplicates=allow_duplicates)
+        return
+    if method is not None:
+        methods = [i for i in methods if i.__name__.lower() == method]
+
+    edids = set()
+    results = {}
+    errors = []
+    # not used as a context manager so that a consumer breaking out of the loop
+    # does not have to wait for the slower methods to finish
+    executor = ThreadPoolExecutor(max_workers=len(methods))
+    try:
+        futures = {executor.submit(m.get_display_info): m for m in methods}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                # as with `list_monitors_info`, one failing method does not stop the others being yielded
+                errors.append(e)
+                results[futures[future]] = []
+                if len(errors) == len(methods):
+                    raise
+                continue
+            for i in results[futures[future]]:
+                if allow_duplicates or i['edid'] not in edids:
+                    edids.add(i['edid'])
+                    yield i
+    finally:
+        executor.shutdown(wait=False)
+
+    if method is None:
+        # every method has finished, so cache the results in the same order `list_monitors_info` would.
+        # Results from methods that failed are left out, the same as they are by `list_monitors_info`
+        __cache__.store('linux_monitors_info', flatten_list([results[m] for m in methods]), namespace='discovery')
+
+
+def _cached_monitors_info() -> Union[List[dict], None]:
+    '''internal function, returns the last discovery result if it is still cached, without running discovery'''
+    try:
+        return __cache__.get('linux_monitors_info')
+    except Exception:
+        return None
+
 
 def list_monitors(method: Optional[str] = None) -> List[str]:
     '''
     Returns the names of all detected monitors
 
     Args:
-        method (str): the method the monitor can be addressed by. Can be 'xrandr' or 'ddcutil' or 'light'
+        method (str): the method the monitor can be addressed by. Can be 'xrandr', 'ddcutil', 'sysfs' or 'light'
 
     Returns:
         list: list of strings
@@ -978,8 +3029,23 @@ def __set_and_get_brightness(*args, display=None, method=None, meta_method='get'
     except Exception as e:
         errors.append(['', type(e).__name__, e])
     else:
+        batched = {}
+        if meta_method == 'set':
+            # xrandr can set every output in one invocation, which is much cheaper than one per monitor
+            xrandr = [m['index'] for m in monitors if m['method'] == XRandr]
+            if len(xrandr) > 1:
+                try:
+                    result = XRandr.set_brightness_multi({i: args[0] for i in xrandr}, **kwargs)
+                    batched = {i: None if result is None else [result[n]] for n, i in enumerate(xrandr)}
+                except Exception:
+                    # fall back to setting each monitor individually
+                    pass
+
         output = []
         for m in monitors:  # add the output of each brightness method to the output list
+            if m['method'] == XRandr and m['index'] in batched:
+                output.append(batched[m['index']])
+                continue
             try:
                 output.append(
                     getattr(m['method'], meta_method + '_brightness')(*args, display=m['index'], **kwargs)
@@ -1023,14 +3089,15 @@ def set_brightness(
     **kwargs
 ) -> Union[List[int], int, None]:
     '''
-    Sets the brightness for a display, cycles through Light, XRandr, DDCUtil and XBacklight methods until one works
+    Sets the brightness for a display,
+    cycles through XRandr, DDCUtil, SysFS, Light and XBacklight methods until one works
 
     Args:
         value (int): Sets the brightness to this value
         display (int or str): The specific display you wish to adjust.
             Can be index, model, name or serial of the display.
-            Can also be i2c bus (ddcutil), interface (xrandr) or path (light)
-        method (str): the method to use ('light', 'xrandr', 'ddcutil' or 'xbacklight')
+            Can also be i2c bus (ddcutil), interface (xrandr) or path (sysfs and light)
+        method (str): the method to use ('xrandr', 'ddcutil', 'sysfs', 'light' or 'xbacklight')
         kwargs (dict): passed directly to the chosen brightness method
 
     Returns:
@@ -1070,13 +3137,14 @@ def get_brightness(
     **kwargs
 ) -> Union[List[int], int]:
     '''
-    Returns the brightness for a display, cycles through Light, XRandr, DDCUtil and XBacklight methods until one works
+    Returns the brightness for a display,
+    cycles through XRandr, DDCUtil, SysFS, Light and XBacklight methods until one works
 
     Args:
         display (int or str): The specific display you wish to adjust.
             Can be index, model, name or serial of the display.
-            Can also be i2c bus (ddcutil), interface (xrandr) or path (light)
-        method (str): the method to use ('light', 'xrandr', 'ddcutil' or 'xbacklight')
+            Can also be i2c bus (ddcutil), interface (xrandr) or path (sysfs and light)
+        method (str): the method to use ('xrandr', 'ddcutil', 'sysfs', 'light' or 'xbacklight')
         kwargs (dict): passed directly to chosen brightness method
 
     Returns:
@@ -1,16 +1,14 @@
-import wmi
+import sys
 import threading
-import pythoncom
-import win32api
 import time
 import ctypes
 from ctypes import windll, byref, Structure, WinError, POINTER, WINFUNCTYPE
 from ctypes.wintypes import BOOL, HMONITOR, HDC, RECT, LPARAM, DWORD, BYTE, WCHAR, HANDLE
-from . import flatten_list, _monitor_brand_lookup, filter_monitors, __cache__, platform
-from typing import List, Union, Optional
+from . import flatten_list, _monitor_brand_lookup, filter_monitors, __cache__, __metrics__
+from typing import List, Union, Optional, Generator
 # a bunch of typing classes were deprecated in Python 3.9
 # in favour of collections.abc (https://www.python.org/dev/peps/pep-0585/)
-if int(platform.python_version_tuple()[1]) < 9:
+if sys.version_info < (3, 9):
     from typing import Iterable
 else:
     from collections.abc import Iterable
@@ -18,6 +16,10 @@ else:
 
 def _wmi_init():
     '''internal function to create and return a wmi instance'''
+    # wmi and pythoncom are slow to import so they are only imported once they are needed
+    import pythoncom
+    import wmi
+
     # WMI calls don't work in new threads so we have to run this check
     if threading.current_thread() != threading.main_thread():
         pythoncom.CoInitialize()
@@ -41,138 +43,141 @@ def get_display_info() -> List[dict]:
             print(display['name'])
         ```
     '''
+    return __cache__.fetch('windows_monitors_info_raw', _query_display_info, namespace='discovery')[0]
+
+
+@__metrics__.timed('windows._query_display_info')
+def _query_display_info() -> List[dict]:
+    '''internal function, gathers the display info without caching. Use `get_display_info` instead'''
+    import win32api
+
+    info = []
     try:
-        info = __cache__.get('windows_monitors_info_raw')
-    except Exception:
-        info = []
-        try:
-            # collect all monitor UIDs (derived from DeviceID)
-            monitor_uids = {}
-            last_good = 0
-            for i in win32api.EnumDisplayMonitors():
-                tmp = win32api.GetMonitorInfo(i[0])
-                try:
-                    # If a user has all displays plugged into display adapter 4 then
-                    # this statement would be tried for each adapter (0-4) per monitor
-                    # meaning 4 tries per monitor, 12 tries total.
-                    # By trying the "last good" adapter first, only the first display will
-                    # be tried 4 times. All the others will be tried once
-                    device = win32api.EnumDisplayDevices(tmp['Device'], last_good, 1)
-                    monitor_uids[device.DeviceID.split('#')[2]] = device
-                except Exception:
-                    # iterate up to 4 display adapters
-                    for j in range(5):
-                        try:
-                            # last_good is tried just above here. No point trying it again
-                            if j != last_good:
-                                # i have no idea what this 3rd parameter does but the code doesn't work without it
-                                device = win32api.EnumDisplayDevices(tmp['Device'], j, 1)
-                                monitor_uids[device.DeviceID.split('#')[2]] = device
-                                last_good = j
-                                break
-                        except Exception:
-                            continue
-
-            # gather list of laptop displays to check against later
-            wmi = _wmi_init()
+        # collect all monitor UIDs (derived from DeviceID)
+        monitor_uids = {}
+        last_good = 0
+        for i in win32api.EnumDisplayMonitors():
+            tmp = win32api.GetMonitorInfo(i[0])
             try:
-                laptop_displays = []
-                for i in wmi.WmiMonitorBrightness():
-                    laptop_displays.append(
-                        i.InstanceName.replace('_0', '', 1).split('\\')[2]
-                    )
+                # If a user has all displays plugged into display adapter 4 then
+                # this statement would be tried for each adapter (0-4) per monitor
+                # meaning 4 tries per monitor, 12 tries total.
+                # By trying the "last good" adapter first, only the first display will
+                # be tried 4 times. All the others will be tried once
+                device = win32api.EnumDisplayDevices(tmp['Device'], last_good, 1)
+                monitor_uids[device.DeviceID.split('#')[2]] = device
             except Exception:
-                pass
-            monitors = []
-            extras = []
-            uid_keys = list(monitor_uids.keys())
-            for m in wmi.WmiMonitorID():
-                name = m.InstanceName.replace('_0', '', 1).split('\\')[2]
-                if name in uid_keys:
-                    monitors.append(m)
-                else:
-                    extras.append(m)
+                # iterate up to 4 display adapters
+                for j in range(5):
+                    try:
+                        # last_good is tried just above here. No point trying it again
+                        if j != last_good:
+                            # i have no idea what this 3rd parameter does but the code doesn't work without it
+                            device = win32api.EnumDisplayDevices(tmp['Device'], j, 1)
+                            monitor_uids[device.DeviceID.split('#')[2]] = device
+                            last_good = j
+                            break
+                    except Exception:
+                        continue
+
+        # gather list of laptop displays to check against later
+        wmi = _wmi_init()
+        try:
+            laptop_displays = []
+            for i in wmi.WmiMonitorBrightness():
+                laptop_displays.append(
+                    i.InstanceName.replace('_0', '', 1).split('\\')[2]
+                )
+        except Exception:
+            pass
+        monitors = []
+        extras = []
+        uid_keys = list(monitor_uids.keys())
+        for m in wmi.WmiMonitorID():
+            name = m.InstanceName.replace('_0', '', 1).split('\\')[2]
+            if name in uid_keys:
+                monitors.append(m)
+            else:
+                extras.append(m)
+
+        # sort the monitors in the same order as win32api reports them
+        # because the first item in win32api's list is usually the primary display
+        monitors = sorted(
+            monitors,
+            key=lambda x: uid_keys.index(x.InstanceName.replace('_0', '', 1).split('\\')[2])
+        )
 
-            # sort the monitors in the same order as win32api reports them
-            # because the first item in win32api's list is usually the primary display
-            monitors = sorted(
-                monitors,
-                key=lambda x: uid_keys.index(x.InstanceName.replace('_0', '', 1).split('\\')[2])
-            )
+        monitors += extras
 
-            monitors += extras
+        # get all available edid strings
+        try:
+            descriptors = {
+                i.InstanceName: i.WmiGetMonitorRawEEdidV1Block(0) for i in wmi.WmiMonitorDescriptorMethods()
+            }
+        except Exception:
+            pass
+        laptop = 0
+        desktop = 0
+        for monitor in monitors:
+            model, serial, manufacturer, man_id, edid = None, None, None, None, None
+            instance_name = monitor.InstanceName.replace('_0', '', 1).split('\\')[2]
+            pydevice = monitor_uids[instance_name]
 
-            # get all available edid strings
             try:
-                descriptors = {
-                    i.InstanceName: i.WmiGetMonitorRawEEdidV1Block(0) for i in wmi.WmiMonitorDescriptorMethods()
-                }
+                serial = bytes(monitor.SerialNumberID).decode().replace('\x00', '')
+                manufacturer, model = bytes(monitor.UserFriendlyName).decode().replace('\x00', '').split(' ')
+                manufacturer = manufacturer.lower().capitalize()
+                try:
+                    man_id, manufacturer = _monitor_brand_lookup(manufacturer)
+                except Exception:
+                    man_id = None
             except Exception:
-                pass
-            laptop = 0
-            desktop = 0
-            for monitor in monitors:
-                model, serial, manufacturer, man_id, edid = None, None, None, None, None
-                instance_name = monitor.InstanceName.replace('_0', '', 1).split('\\')[2]
-                pydevice = monitor_uids[instance_name]
-
+                devid = pydevice.DeviceID.split('#')
+                serial = devid[2]
+                man_id = devid[1][:3]
+                model = devid[3:]
+                del(devid)
                 try:
-                    serial = bytes(monitor.SerialNumberID).decode().replace('\x00', '')
-                    manufacturer, model = bytes(monitor.UserFriendlyName).decode().replace('\x00', '').split(' ')
-                    manufacturer = manufacturer.lower().capitalize()
-                    try:
-                        man_id, manufacturer = _monitor_brand_lookup(manufacturer)
-                    except Exception:
-                        man_id = None
+                    man_id, manufacturer = _monitor_brand_lookup(man_id)
                 except Exception:
-                    devid = pydevice.DeviceID.split('#')
-                    serial = devid[2]
-                    man_id = devid[1][:3]
-                    model = devid[3:]
-                    del(devid)
-                    try:
-                        man_id, manufacturer = _monitor_brand_lookup(man_id)
-                    except Exception:
-                        manufacturer = None
+                    manufacturer = None
+            try:
                 try:
-                    try:
-                        chars = descriptors[monitor.InstanceName][0]
-                    except Exception:
-                        chars = descriptors[pydevice.InstanceName][0]
-                    finally:
-                        edid = ''
-                        for char in chars:
-                            char = str(hex(char)).replace('0x', '')
-                            if len(char) == 1:
-                                char = '0' + char
-                            edid += char
-                        del(chars)
+                    chars = descriptors[monitor.InstanceName][0]
                 except Exception:
-                    edid = None
-
-                if (serial, model) != (None, None):
-                    info.append(
-                        {
-                            'name': f'{manufacturer} {model}',
-                            'model': model,
-                            'serial': serial,
-                            'manufacturer': manufacturer,
-                            'manufacturer_id': man_id,
-                            'edid': edid
-                        }
-                    )
-                    if instance_name in laptop_displays:
-                        info[-1]['index'] = laptop
-                        info[-1]['method'] = WMI
-                        laptop += 1
-                    else:
-                        info[-1]['index'] = desktop
-                        info[-1]['method'] = VCP
-                        desktop += 1
-        except Exception:
-            pass
-        __cache__.store('windows_monitors_info_raw', info)
-
+                    chars = descriptors[pydevice.InstanceName][0]
+                finally:
+                    edid = ''
+                    for char in chars:
+                        char = str(hex(char)).replace('0x', '')
+                        if len(char) == 1:
+                            char = '0' + char
+                        edid += char
+                    del(chars)
+            except Exception:
+                edid = None
+
+            if (serial, model) != (None, None):
+                info.append(
+                    {
+                        'name': f'{manufacturer} {model}',
+                        'model': model,
+                        'serial': serial,
+                        'manufacturer': manufacturer,
+                        'manufacturer_id': man_id,
+                        'edid': edid
+                    }
+                )
+                if instance_name in laptop_displays:
+                    info[-1]['index'] = laptop
+                    info[-1]['method'] = WMI
+                    laptop += 1
+                else:
+                    info[-1]['index'] = desktop
+                    info[-1]['method'] = VCP
+                    desktop += 1
+    except Exception:
+        pass
     return info
 
 
@@ -210,11 +215,9 @@ class WMI:
             benq_info = sbc.windows.WMI.get_display_info('BenQ GL2450H')
             ```
         '''
-        try:
-            info = __cache__.get('wmi_monitor_info')
-        except Exception:
-            info = [i for i in get_display_info() if i['method'] == WMI]
-            __cache__.store('wmi_monitor_info', info)
+        info = __cache__.fetch(
+            'wmi_monitor_info', lambda: [i for i in get_display_info() if i['method'] == WMI], namespace='discovery'
+        )[0]
         if display is not None:
             info = filter_monitors(display=display, haystack=info)
         return info
@@ -238,9 +241,10 @@ class WMI:
         return [i['name'] for i in WMI.get_display_info()]
 
     @staticmethod
+    @__metrics__.timed('WMI.set_brightness')
     def set_brightness(
         value: int,
-        display: Optional[Union[int, str]] = None,
+        display: Optional[Union[int, str, dict]] = None,
         no_return: bool = False
     ) -> Union[List[int], None]:
         '''
@@ -248,10 +252,11 @@ class WMI:
 
         Args:
             value (int): The percentage to set the brightness to
-            display (int or str): The specific display you wish to query.
+            display (int, str or dict): The specific display you wish to query.
                 Can be index, name, model, serial or edid string.
                 `int` is faster as it isn't passed to `filter_monitors` to be matched against.
                 `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
             no_return (bool): if True, this function returns None
                 Otherwise it returns the result of `WMI.get_brightness()`
 
@@ -276,6 +281,8 @@ class WMI:
             sbc.windows.WMI.set_brightness(25, display = 'BenQ GL2450H')
             ```
         '''
+        if isinstance(display, dict):
+            display = display['index']
         brightness_method = _wmi_init().WmiMonitorBrightnessMethods()
         if display is not None:
             if type(display) == int:
@@ -288,15 +295,17 @@ class WMI:
         return WMI.get_brightness(display=display) if not no_return else None
 
     @staticmethod
-    def get_brightness(display: Optional[Union[int, str]] = None) -> List[int]:
+    @__metrics__.timed('WMI.get_brightness')
+    def get_brightness(display: Optional[Union[int, str, dict]] = None) -> List[int]:
         '''
         Returns the current display brightness using WMI
 
         Args:
-            display (int or str): The specific display you wish to query.
+            display (int, str or dict): The specific display you wish to query.
                 Can be index, name, model, serial or edid string.
                 `int` is faster as it isn't passed to `filter_monitors` to be matched against.
                 `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
 
         Returns:
             list: list of integers (0 to 100)
@@ -322,6 +331,8 @@ class WMI:
             benq_brightness = sbc.windows.WMI.get_brightness(display = 'BenQ GL2450H')
             ```
         '''
+        if isinstance(display, dict):
+            display = display['index']
         brightness_method = _wmi_init().WmiMonitorBrightness()
         if display is not None:
             if type(display) == int:
@@ -411,11 +422,9 @@ class VCP:
             # EG output: {'name': 'BenQ GL2450H', 'model': 'GL2450H', ... }
             ```
         '''
-        try:
-            info = __cache__.get('vcp_monitor_info')
-        except Exception:
-            info = [i for i in get_display_info() if i['method'] == VCP]
-            __cache__.store('vcp_monitor_info', info)
+        info = __cache__.fetch(
+            'vcp_monitor_info', lambda: [i for i in get_display_info() if i['method'] == VCP], namespace='discovery'
+        )[0]
         if display is not None:
             info = filter_monitors(display=display, haystack=info)
         return info
@@ -469,15 +478,17 @@ class VCP:
         return [i['name'] for i in VCP.get_display_info()]
 
     @staticmethod
-    def get_brightness(display: Optional[Union[int, str]] = None) -> List[int]:
+    @__metrics__.timed('VCP.get_brightness')
+    def get_brightness(display: Optional[Union[int, str, dict]] = None) -> List[int]:
         '''
         Retrieve the brightness of all connected displays using the `ctypes.windll` API
 
         Args:
-            display (int or str): The specific display you wish to query.
+            display (int, str or dict): The specific display you wish to query.
                 Can be index, name, model, serial or edid string.
                 `int` is faster as it isn't passed to `filter_monitors` to be matched against.
                 `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
 
         Returns:
             list: list of ints (0 to 100)
@@ -509,6 +520,8 @@ class VCP:
         # (determined by VCP.get_display_info)
         # yes, it does add an unnecessary function call but that's only if you're using this module low-level.
         # Top-level functions always end up specifying the display kwarg anyway
+        if isinstance(display, dict):
+            display = display['index']
         if type(display) == int:
             indexes = [display]
         else:
@@ -532,7 +545,7 @@ class VCP:
             if v is not None:
                 if count in indexes:
                     try:
-                        __cache__.store(f'vcp_brightness_{count}', v, expires=0.1)
+                        __cache__.store(f'vcp_brightness_{count}', v, namespace='brightness', expires=0.1)
                     except IndexError:
                         pass
                     values.append(v)
@@ -543,19 +556,21 @@ class VCP:
         return values
 
     @staticmethod
+    @__metrics__.timed('VCP.set_brightness')
     def set_brightness(
         value: int,
-        display: Optional[Union[int, str]] = None,
+        display: Optional[Union[int, str, dict]] = None,
         no_return: bool = False
     ) -> Union[List[int], None]:
         '''
         Sets the brightness for all connected displays using the `ctypes.windll` API
 
         Args:
-            display (int or str): The specific display you wish to query.
+            display (int, str or dict): The specific display you wish to query.
                 Can be index, name, model, serial or edid string.
                 `int` is faster as it isn't passed to `filter_monitors` to be matched against.
                 `str` is slower as it is passed to `filter_monitors` to match to a display.
+                `dict` (an entry from `get_display_info`) is fastest as it skips discovery entirely.
             no_return (bool): if set to `True` this function will return `None`
 
         Returns:
@@ -579,13 +594,15 @@ class VCP:
             sbc.windows.VCP.set_brightness(100, display = 'GL2450H')
             ```
         '''
+        if isinstance(display, dict):
+            display = display['index']
         if type(display) == int:
             indexes = [display]
         else:
             # see VCP.set_brightness for the explanation for why we always gather this list
             indexes = [i['index'] for i in filter_monitors(display=display, haystack=VCP.get_display_info())]
 
-        __cache__.expire(startswith='vcp_brightness_')
+        __cache__.expire(namespace='brightness')
 
         count = 0
         for m in VCP.iter_physical_monitors():
@@ -646,26 +663,51 @@ def list_monitors_info(method: Optional[str] = None, allow_duplicates: bool = Fa
             print('EDID:', info['edid'])
         ```
     '''
+    if method is not None:
+        method = method.lower()
+        if method not in ('wmi', 'vcp'):
+            raise ValueError('method kwarg must be \'wmi\' or \'vcp\'')
+
+    # `get_display_info` caches the discovery result. Filtered views are derived from it
+    info = get_display_info()
+    if method is None and allow_duplicates:
+        return info
+
+    info_final = []
+    serials = set()
+    # to make sure each display (with unique edid) is only reported once
+    for i in info:
+        if allow_duplicates or i['serial'] not in serials:
+            if method is None or method == i['method'].__name__.lower():
+                serials.add(i['serial'])
+                info_final.append(i)
+    return info_final
+
+
+def iter_monitors_info(method: Optional[str] = None, allow_duplicates: bool = False) -> Generator[dict, None, None]:
+    '''
+    Yields detailed information about each detected monitor.
+    On Windows both methods are discovered by one query so this simply iterates over `list_monitors_info`
+
+    Args:
+        method (str): the method the monitor can be addressed by. Can be 'wmi' or 'vcp'
+        allow_duplicates (bool): whether to skip duplicate displays (displays with the same EDID) or not
+
+    Yields:
+        dict
+
+    Raises:
+        ValueError: if the method kwarg is invalid
+    '''
+    yield from list_monitors_info(method=method, allow_duplicates=allow_duplicates)
+
+
+def _cached_monitors_info() -> Union[List[dict], None]:
+    '''internal function, returns the last discovery result if it is still cached, without running discovery'''
     try:
-        return __cache__.get(f'windows_monitors_info_{method}_{allow_duplicates}')
+        return __cache__.get('windows_monitors_info_raw')
     except Exception:
-        info = get_display_info()
-
-        if method is not None:
-            method = method.lower()
-            if method not in ('wmi', 'vcp'):
-                raise ValueError('method kwarg must be \'wmi\' or \'vcp\'')
-
-        info_final = []
-        serials = []
-        # to make sure each display (with unique edid) is only reported once
-        for i in info:
-            if allow_duplicates or i['serial'] not in serials:
-                if method is None or method == i['method'].__name__.lower():
-                    serials.append(i['serial'])
-                    info_final.append(i)
-        __cache__.store(f'windows_monitors_info_{method}_{allow_duplicates}', info_final)
-        return info_final
+        return None
 
 
 def list_monitors(method: Optional[str] = None) -> List[str]:
@@ -12,6 +12,7 @@ setup(
     author='Crozzers',
     author_email='captaincrozzers@gmail.com',
     packages=['screen_brightness_control'],
+    package_data={'screen_brightness_control': ['pnp.ids.gz']},
     install_requires=['wmi ; platform_system=="Windows"'],
     description='A Python tool to control monitor brightness on Windows and Linux',
     long_description=open('README.md').read(),
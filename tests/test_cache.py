@@ -0,0 +1,70 @@
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import screen_brightness_control as sbc
+
+
+class TestStaleEntries(unittest.TestCase):
+    def setUp(self):
+        sbc.__cache__.clear()
+        self.addCleanup(sbc.__cache__.clear)
+
+    def test_get_keeps_expired_entries_for_fetch(self):
+        sbc.__cache__.store('key', 'old', expires=0)
+        with self.assertRaises(KeyError):
+            sbc.__cache__.get('key')
+        self.assertEqual(sbc.__cache__.peek('key'), 'old')
+        refreshed = threading.Event()
+
+        def refresh():
+            refreshed.set()
+            return 'new'
+
+        # the expired value is served while it is refreshed in the background
+        self.assertEqual(sbc.__cache__.fetch('key', refresh, max_stale=10)[0], 'old')
+        self.assertTrue(refreshed.wait(5))
+
+    def test_expired_namespaces_are_not_peeked(self):
+        sbc.__cache__.store('key', 'old', namespace='discovery')
+        sbc.__cache__.expire(namespace='discovery')
+        with self.assertRaises(KeyError):
+            sbc.__cache__.peek('key')
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), 'linux only')
+class TestXRandrWriteThrough(unittest.TestCase):
+    def setUp(self):
+        from screen_brightness_control import linux
+        self.linux = linux
+        sbc.__cache__.clear()
+        self.addCleanup(sbc.__cache__.clear)
+        patcher = mock.patch.object(linux.XRandr, 'use_xlib', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_write_through_keeps_the_stale_reading(self):
+        info = self.linux.XRandr._new_info('DP-1')
+        info['brightness'] = 80
+        sbc.__cache__.store('xrandr_monitors_info', [info], namespace='discovery', expires=0)
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def slow_query():
+            release.wait(5)
+            return [dict(info, brightness=30)]
+
+        with mock.patch.object(self.linux, '_run') as run, \
+                mock.patch.object(self.linux.XRandr, '_query_display_info', side_effect=slow_query):
+            run.return_value.returncode = 0
+            self.linux.XRandr._write([(info, 30)], write_through=True)
+            start = time.monotonic()
+            # served from the stale (but written through) entry without waiting for xrandr
+            self.assertEqual(self.linux.XRandr.get_brightness(max_stale=10), [30])
+            self.assertLess(time.monotonic() - start, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import unittest
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('linux only')
+from screen_brightness_control import linux  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def parse(fixture):
+    with open(os.path.join(FIXTURES, fixture), 'rb') as f:
+        return linux.DDCUtil._parse_detect(f.read())
+
+
+def summary(monitor):
+    return {key: value for key, value in monitor.items() if key not in ('edid', 'method')}
+
+
+class TestParseDetect(unittest.TestCase):
+    def test_ddcutil_1x(self):
+        data = parse('ddcutil_detect_1x.txt')
+        self.assertEqual([summary(i) for i in data], [
+            {
+                'name': 'Lg ULTRAWIDE', 'index': 0, 'model': 'ULTRAWIDE', 'serial': '708NTPC1B123',
+                'manufacturer': 'LG Electronics', 'manufacturer_id': 'GSM', 'i2c_bus': '/dev/i2c-4', 'bus_number': 4
+            },
+            {
+                'name': 'Benq GL2450H', 'index': 1, 'model': 'GL2450H', 'serial': 'X5E01234SL0',
+                'manufacturer': 'BenQ', 'manufacturer_id': 'BNQ', 'i2c_bus': '/dev/i2c-6', 'bus_number': 6
+            }
+        ])
+        self.assertTrue(all(i['method'] is linux.DDCUtil for i in data))
+
+    def test_ddcutil_2x_mfg_id_with_name(self):
+        data = parse('ddcutil_detect_2x.txt')
+        self.assertEqual([summary(i) for i in data], [
+            {
+                'name': 'Dell U2719D', 'index': 0, 'model': 'U2719D', 'serial': 'ABC1234',
+                'manufacturer': 'Dell', 'manufacturer_id': 'DEL', 'i2c_bus': '/dev/i2c-5', 'bus_number': 5
+            }
+        ])
+
+    def test_edid_hex_dump(self):
+        edid = parse('ddcutil_detect_2x.txt')[0]['edid']
+        self.assertEqual(len(edid), 256)
+        self.assertTrue(edid.startswith('00ffffffffffff0010aceca0'))
+        # every row was read, including the checksum in the last byte
+        self.assertEqual(sum(bytes.fromhex(edid)) % 256, 0)
+        self.assertIn(b'DELL U2719D'.hex(), edid)
+
+    def test_invalid_phantom_and_usb_displays_are_skipped(self):
+        data = parse('ddcutil_detect_invalid.txt')
+        self.assertEqual([i['i2c_bus'] for i in data], ['/dev/i2c-5'])
+        self.assertEqual(data[0]['index'], 0)
+        self.assertEqual(data[0]['edid'], parse('ddcutil_detect_2x.txt')[0]['edid'])
+
+    def test_non_utf8_text(self):
+        data = linux.DDCUtil._parse_detect(
+            b'Display 1\n   I2C bus:  /dev/i2c-4\n      EDID synopsis:\n         Model:   ACME \xff\xfe\n'
+        )
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['model'], '\ufffd\ufffd')
+
+    def test_empty_output(self):
+        self.assertEqual(linux.DDCUtil._parse_detect(b''), [])
+        self.assertEqual(linux.DDCUtil._parse_detect(b'No displays found.\n'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import sys
+import unittest
+from unittest import mock
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('linux only')
+from screen_brightness_control import linux  # noqa: E402
+
+
+class TestAdaptiveSleep(unittest.TestCase):
+    def setUp(self):
+        self.monitor = {'edid': '00ff' * 64, 'i2c_bus': '/dev/i2c-4', 'bus_number': 4}
+        self.bus = mock.MagicMock()
+        self.bus.get_vcp.return_value = (50, 100)
+        for attr, value in (
+            ('adaptive_sleep', True), ('sleep_multipliers_path', None),
+            ('_sleep_multipliers', None), ('use_i2c', True)
+        ):
+            patcher = mock.patch.object(linux.DDCUtil, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(linux.DDCUtil, '_get_bus', return_value=self.bus)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @property
+    def multiplier(self):
+        return linux.DDCUtil.get_sleep_multiplier(self.monitor)
+
+    def test_raw_writes_do_not_lower_the_multiplier(self):
+        for _ in range(30):
+            self.assertTrue(linux.DDCUtil._write_vcp(self.monitor, {0x10: 50}))
+        self.assertEqual(self.multiplier, linux.DDCUtil.sleep_multiplier)
+
+    def test_failed_raw_writes_raise_the_multiplier(self):
+        self.bus.set_vcp.side_effect = OSError
+        with mock.patch.object(linux, '_run') as run:
+            run.return_value.returncode = 1
+            self.assertFalse(linux.DDCUtil._write_vcp(self.monitor, {0x10: 50}))
+        self.assertGreater(self.multiplier, linux.DDCUtil.sleep_multiplier)
+
+    def test_reads_lower_the_multiplier_but_not_the_i2c_gap(self):
+        for _ in range(30):
+            linux.DDCUtil._read_vcp(self.monitor, [0x10])
+        self.assertLess(self.multiplier, linux.DDCUtil.sleep_multiplier)
+        self.assertGreaterEqual(self.bus.wait_time, linux.I2C.WAIT_TIME)
+
+
+if __name__ == '__main__':
+    unittest.main()
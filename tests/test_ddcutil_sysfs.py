@@ -0,0 +1,83 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('linux only')
+from screen_brightness_control import linux  # noqa: E402
+
+
+def edid(serial):
+    return bytes.fromhex('00ffffffffffff00' + f'{serial:02x}' * 120)
+
+
+class FakeBus:
+    def __init__(self, ddc):
+        self.ddc = ddc
+
+    def get_vcp(self, code):
+        if not self.ddc:
+            raise OSError('no reply')
+        return 50, 100
+
+    def close(self):
+        pass
+
+
+class TestSysfsDiscovery(unittest.TestCase):
+    '''creates a fake `/sys/class/drm` tree and I2C buses for each test'''
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.buses = {}
+        for attr, value in (('sysfs_root', self.root), ('use_i2c', True), ('_buses', {})):
+            patcher = mock.patch.object(linux.DDCUtil, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(linux.DDCUtil, '_get_bus', lambda monitor: self.buses[monitor['i2c_bus']])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def add_connector(self, name, bus_number, ddc=True, status='connected'):
+        connector = os.path.join(self.root, name)
+        os.makedirs(connector)
+        os.makedirs(os.path.join(self.root, f'i2c-{bus_number}'))
+        os.symlink(os.path.join(self.root, f'i2c-{bus_number}'), os.path.join(connector, 'ddc'))
+        with open(os.path.join(connector, 'status'), 'w') as f:
+            f.write(f'{status}\n')
+        with open(os.path.join(connector, 'edid'), 'wb') as f:
+            f.write(edid(bus_number))
+        self.buses[f'/dev/i2c-{bus_number}'] = FakeBus(ddc)
+
+    def test_monitors_with_ddc_are_listed(self):
+        self.add_connector('card0-DP-1', 4)
+        self.add_connector('card0-HDMI-A-1', 5)
+        info = linux.DDCUtil._query_sysfs()
+        self.assertEqual([(i['bus_number'], i['index']) for i in info], [(4, 0), (5, 1)])
+        self.assertEqual(info[0]['edid'], edid(4).hex())
+
+    def test_monitors_without_ddc_are_dropped(self):
+        self.add_connector('card0-DP-1', 4, ddc=False)
+        self.add_connector('card0-HDMI-A-1', 5)
+        self.assertEqual([i['bus_number'] for i in linux.DDCUtil._query_sysfs()], [5])
+
+    def test_internal_and_disconnected_connectors_are_skipped(self):
+        self.add_connector('card0-eDP-1', 3)
+        self.add_connector('card0-DP-1', 4, status='disconnected')
+        self.assertEqual(linux.DDCUtil._query_sysfs(), [])
+
+    def test_falls_back_to_ddcutil_when_the_bus_cannot_be_opened(self):
+        self.add_connector('card0-DP-1', 4)
+        del self.buses['/dev/i2c-4']
+        with mock.patch.object(linux, '_run') as run:
+            run.return_value.returncode = 1
+            self.assertEqual(linux.DDCUtil._query_sysfs(), [])
+            run.return_value.returncode = 0
+            self.assertEqual([i['bus_number'] for i in linux.DDCUtil._query_sysfs()], [4])
+
+
+if __name__ == '__main__':
+    unittest.main()
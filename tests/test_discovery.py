@@ -0,0 +1,80 @@
+import sys
+import unittest
+from unittest import mock
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('linux only')
+import screen_brightness_control as sbc  # noqa: E402
+from screen_brightness_control import linux  # noqa: E402
+
+
+def fake_display(method, edid):
+    return {
+        'name': method.__name__, 'path': None, 'method': method, 'index': 0, 'model': None,
+        'serial': None, 'manufacturer': None, 'manufacturer_id': None, 'edid': edid
+    }
+
+
+class TestMissingPrograms(unittest.TestCase):
+    '''one method failing (eg: xrandr not being installed) should not hide the others'''
+    def setUp(self):
+        sbc.__cache__.clear()
+        self.addCleanup(sbc.__cache__.clear)
+        self.ddc = fake_display(linux.DDCUtil, '00ff' * 64)
+        for method, result in (
+            (linux.XRandr, FileNotFoundError('xrandr')), (linux.DDCUtil, [self.ddc]),
+            (linux.SysFS, []), (linux.Light, FileNotFoundError('light'))
+        ):
+            kwargs = {'side_effect': result} if isinstance(result, Exception) else {'return_value': result}
+            patcher = mock.patch.object(method, 'get_display_info', **kwargs)
+            self.addCleanup(patcher.stop)
+            setattr(self, method.__name__.lower(), patcher.start())
+
+    def test_list_monitors_info(self):
+        self.assertEqual(linux.list_monitors_info(), [self.ddc])
+
+    def test_list_monitors_info_only_probes_the_requested_method(self):
+        self.assertEqual(linux.list_monitors_info(method='ddcutil'), [self.ddc])
+        self.xrandr.assert_not_called()
+        self.light.assert_not_called()
+
+    def test_requested_method_still_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            linux.list_monitors_info(method='xrandr')
+
+    def test_iter_monitors_info(self):
+        self.assertEqual(list(linux.iter_monitors_info()), [self.ddc])
+        # the successful results are still cached
+        self.assertEqual(linux._cached_monitors_info(), [self.ddc])
+
+    def test_every_method_failing_raises(self):
+        self.ddcutil.side_effect = FileNotFoundError('ddcutil')
+        self.sysfs.side_effect = PermissionError('sysfs')
+        # every failure here is an `OSError`, whichever method happens to finish last
+        with self.assertRaises(OSError):
+            linux.list_monitors_info()
+        with self.assertRaises(OSError):
+            list(linux.iter_monitors_info())
+
+
+class TestResolve(unittest.TestCase):
+    def setUp(self):
+        sbc.__cache__.clear()
+        self.addCleanup(sbc.__cache__.clear)
+
+    def test_resolve_rediscovers_ddcutil_monitors(self):
+        old = fake_display(linux.DDCUtil, '00ff' * 64)
+        old['i2c_bus'] = '/dev/i2c-4'
+        new = dict(old, i2c_bus='/dev/i2c-7')
+        sbc.__cache__.store('ddcutil_monitors_info', [old], namespace='capabilities')
+        monitor = sbc.Monitor(old)
+        with mock.patch.object(linux.DDCUtil, '_query_display_info', return_value=[new]), \
+                mock.patch.object(linux.XRandr, 'get_display_info', return_value=[]), \
+                mock.patch.object(linux.SysFS, 'get_display_info', return_value=[]), \
+                mock.patch.object(linux.Light, 'get_display_info', return_value=[]):
+            monitor._resolve()
+        self.assertEqual(monitor._info['i2c_bus'], '/dev/i2c-7')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import timeit
+import unittest
+from unittest import mock
+
+import screen_brightness_control as sbc
+
+
+class XRandr:
+    pass
+
+
+class DDCUtil:
+    pass
+
+
+def fake_monitors(count):
+    '''every monitor is found by both methods, like a desktop monitor would be by xrandr and ddcutil'''
+    monitors = []
+    for method in (XRandr, DDCUtil):
+        for i in range(count):
+            monitors.append({
+                'name': f'Monitor {i}', 'model': f'M{i}', 'serial': f'S{i}', 'edid': f'{i:0256x}',
+                'method': method, 'index': i
+            })
+    return monitors
+
+
+class TestFilterMonitors(unittest.TestCase):
+    def setUp(self):
+        sbc._monitor_indexes.clear()
+        self.addCleanup(sbc._monitor_indexes.clear)
+        self.monitors = fake_monitors(300)
+
+    def test_lookups(self):
+        self.assertIs(sbc.filter_monitors('Monitor 7', haystack=self.monitors)[0], self.monitors[7])
+        self.assertIs(sbc.filter_monitors('S7', haystack=self.monitors, method='ddcutil')[0], self.monitors[307])
+        self.assertIs(sbc.filter_monitors(299, haystack=self.monitors, method='DDCUtil')[0], self.monitors[599])
+        self.assertEqual(len(sbc.filter_monitors(haystack=self.monitors)), 300)
+        with self.assertRaises(LookupError):
+            sbc.filter_monitors(300, haystack=self.monitors, method='xrandr')
+
+    def test_method_views_are_indexed_once(self):
+        with mock.patch.object(sbc, '_MonitorIndex', wraps=sbc._MonitorIndex) as index:
+            for _ in range(10):
+                sbc.filter_monitors('Monitor 7', haystack=self.monitors, method='ddcutil')
+                sbc.filter_monitors('Monitor 7', haystack=self.monitors, method='xrandr')
+        self.assertEqual(index.call_count, 2)
+
+    def test_cached_discovery_result_is_indexed_by_method(self):
+        platform = mock.Mock()
+        platform._cached_monitors_info.return_value = self.monitors
+        with mock.patch.object(sbc, '_get_method', return_value=platform), \
+                mock.patch.object(sbc, '_MonitorIndex', wraps=sbc._MonitorIndex) as index:
+            for _ in range(10):
+                self.assertIs(sbc.filter_monitors('M7', method='ddcutil')[0], self.monitors[307])
+        platform.list_monitors_info.assert_not_called()
+        self.assertEqual(index.call_count, 1)
+
+    def test_lookups_take_constant_time(self):
+        def time_lookups(count):
+            monitors = fake_monitors(count)
+            display = f'Monitor {count - 1}'
+            sbc.filter_monitors(display, haystack=monitors, method='ddcutil')
+            return min(timeit.repeat(
+                lambda: sbc.filter_monitors(display, haystack=monitors, method='ddcutil'), number=200, repeat=5
+            ))
+
+        small, large = time_lookups(10), time_lookups(1000)
+        # a linear search would be around 100 times slower with 100 times as many monitors
+        self.assertLess(large, small * 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
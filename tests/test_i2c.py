@@ -0,0 +1,126 @@
+import sys
+import time
+import unittest
+from unittest import mock
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('linux only')
+from screen_brightness_control import linux  # noqa: E402
+
+
+class FakeDevice:
+    '''stands in for `I2C.Device`, recording what is written and replying with scripted reads'''
+    def __init__(self, replies=()):
+        self.replies = list(replies)
+        self.address = None
+        self.written = []
+        self.closed = False
+
+    def set_address(self, address):
+        self.address = address
+
+    def read(self, length):
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def write(self, data):
+        self.written.append((self.address, data))
+        return len(data)
+
+    def close(self):
+        self.closed = True
+
+
+def reply(code, current, maximum, result=0):
+    '''builds a VCP feature reply the way a monitor would, including its checksum'''
+    data = bytes([0x6e, 0x88, 0x02, result, code, 0x00, maximum >> 8, maximum & 0xff, current >> 8, current & 0xff])
+    return data + bytes([linux.I2C.checksum(data, linux.I2C.HOST_ADDR_R)])
+
+
+class TestI2C(unittest.TestCase):
+    def bus(self, replies=()):
+        self.device = FakeDevice(replies)
+        bus = linux.I2C(self.device)
+        bus.wait_time = 0.01
+        return bus
+
+    def test_get_vcp(self):
+        bus = self.bus([reply(0x10, 50, 100)])
+        self.assertEqual(bus.get_vcp(0x10), (50, 100))
+        # the well known 'get brightness' request, checksum included
+        self.assertEqual(self.device.written, [(0x37, bytes.fromhex('51 82 01 10 ac'))])
+
+    def test_get_vcp_16_bit_values(self):
+        bus = self.bus([reply(0x10, 0x0102, 0x0304)])
+        self.assertEqual(bus.get_vcp(0x10), (0x0102, 0x0304))
+
+    def test_set_vcp(self):
+        bus = self.bus()
+        bus.set_vcp(0x10, 50)
+        self.assertEqual(self.device.written, [(0x37, bytes.fromhex('51 84 03 10 00 32 9a'))])
+
+    def test_bad_checksum(self):
+        data = bytearray(reply(0x10, 50, 100))
+        data[-1] ^= 0xff
+        with self.assertRaises(ValueError):
+            self.bus([bytes(data)]).get_vcp(0x10)
+
+    def test_invalid_replies(self):
+        for data in (
+            b'', reply(0x10, 50, 100)[:-1],
+            # the wrong opcode and a reply for a different code
+            reply(0x10, 50, 100)[:2] + b'\x03' + reply(0x10, 50, 100)[3:], reply(0x12, 50, 100)
+        ):
+            with self.subTest(data=data.hex()), self.assertRaises(ValueError):
+                self.bus([data]).get_vcp(0x10)
+
+    def test_unsupported_code(self):
+        with self.assertRaises(LookupError):
+            self.bus([reply(0x10, 0, 0, result=1)]).get_vcp(0x10)
+
+    def test_messages_are_spaced_out(self):
+        bus = self.bus([reply(0x10, 50, 100), reply(0x10, 50, 100)])
+        start = time.monotonic()
+        bus.get_vcp(0x10)
+        bus.get_vcp(0x10)
+        # request, wait, reply, wait, request, wait, reply
+        self.assertGreaterEqual(time.monotonic() - start, bus.wait_time * 3)
+
+    def test_read_edid(self):
+        edid = bytes.fromhex('00ffffffffffff00') + bytes(range(120))
+        self.assertEqual(self.bus([edid]).read_edid(), edid.hex())
+        self.assertEqual(self.device.written, [(0x50, b'\x00')])
+        with self.assertRaises(ValueError):
+            self.bus([bytes(128)]).read_edid()
+
+
+class TestProbeBus(unittest.TestCase):
+    def setUp(self):
+        for attr, value in (('use_i2c', True), ('_buses', {})):
+            patcher = mock.patch.object(linux.DDCUtil, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(linux, '_check_output')
+        self.check_output = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_idle_bus_does_not_spawn_ddcutil(self):
+        # the bus opens but nothing answers, like a GPU aux channel with no monitor attached
+        device = FakeDevice([OSError(6, 'No such device or address')])
+        with mock.patch.object(linux.I2C, 'Device', return_value=device):
+            self.assertEqual(linux.DDCUtil._probe_bus(4), [])
+        self.check_output.assert_not_called()
+        self.assertTrue(device.closed)
+
+    def test_unopenable_bus_falls_back_to_ddcutil(self):
+        self.check_output.return_value = b''
+        with mock.patch.object(linux.I2C, 'Device', side_effect=PermissionError):
+            self.assertEqual(linux.DDCUtil._probe_bus(4), [])
+        self.check_output.assert_called_once()
+        self.assertIn('--bus', self.check_output.call_args[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# generous enough for slow CI machines, but far below what importing the platform backend costs
+IMPORT_BUDGET = 0.1
+'''the maximum cumulative time (in seconds) that importing the package may take'''
+LAZY_MODULES = (
+    'subprocess', 'ctypes', 'json', 'concurrent.futures',
+    'screen_brightness_control.linux', 'screen_brightness_control.windows'
+)
+'''modules that are only imported once they are needed'''
+
+
+def run(code):
+    # run from the root of the repo so that this copy of the package is the one imported
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+
+
+class TestImport(unittest.TestCase):
+    def test_heavy_modules_are_not_imported(self):
+        result = run(
+            'import sys\n'
+            'before = set(sys.modules)\n'
+            'import screen_brightness_control\n'
+            'print(\'\\n\'.join(set(sys.modules) - before))'
+        )
+        loaded = set(result.stdout.split())
+        self.assertIn('screen_brightness_control', loaded)
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, loaded)
+
+    def test_import_time_budget(self):
+        # each line of `-X importtime` looks like 'import time:  self [us] | cumulative | imported package'
+        cumulative = None
+        for line in run('import screen_brightness_control').stderr.splitlines():
+            parts = line.split('|')
+            if len(parts) == 3 and parts[2].strip() == 'screen_brightness_control':
+                cumulative = int(parts[1]) / 1e6
+        self.assertIsNotNone(cumulative)
+        self.assertLess(cumulative, IMPORT_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import ctypes
+import ctypes.util
+import os
+import shutil
+import subprocess
+import sys
+import time
+import unittest
+from unittest import mock
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('linux only')
+import screen_brightness_control as sbc  # noqa: E402
+from screen_brightness_control import linux  # noqa: E402
+from screen_brightness_control.linux import LibXrandr  # noqa: E402
+
+
+def fake_libs(display=1):
+    '''returns mocked libX11 and libXrandr objects, where `display` is what `XOpenDisplay` returns'''
+    x11, xrandr = mock.MagicMock(), mock.MagicMock()
+    x11.XOpenDisplay.return_value = display
+    x11.XSetErrorHandler.return_value = 'previous handler'
+    return x11, xrandr
+
+
+def make_lib(x11, xrandr, display=None) -> LibXrandr:
+    with mock.patch('ctypes.util.find_library', return_value='lib'), \
+            mock.patch('ctypes.CDLL', side_effect=[x11, xrandr]), \
+            mock.patch.object(LibXrandr, '_libraries', None):
+        return LibXrandr(display)
+
+
+class TestErrorHandler(unittest.TestCase):
+    def test_failed_open_leaves_handler_alone(self):
+        x11, xrandr = fake_libs(display=None)
+        with self.assertRaises(OSError):
+            make_lib(x11, xrandr, ':99')
+        x11.XSetErrorHandler.assert_not_called()
+
+    def test_handler_is_restored_after_requests(self):
+        x11, xrandr = fake_libs()
+        lib = make_lib(x11, xrandr)
+        x11.XSetErrorHandler.reset_mock()
+        with lib._trap_errors():
+            pass
+        installed, restored = x11.XSetErrorHandler.call_args_list
+        self.assertIs(installed[0][0], LibXrandr._error_handler)
+        self.assertEqual(restored[0][0], 'previous handler')
+
+    def test_errors_raise_and_restore_handler(self):
+        x11, xrandr = fake_libs()
+        lib = make_lib(x11, xrandr)
+        x11.XSetErrorHandler.reset_mock()
+        with self.assertRaises(OSError):
+            with lib._trap_errors():
+                LibXrandr._on_error(lib.display, None)
+        self.assertEqual(x11.XSetErrorHandler.call_args_list[-1][0][0], 'previous handler')
+        self.assertNotIn(lib.display, LibXrandr._errors)
+        # the next request is not affected by the earlier error
+        with lib._trap_errors():
+            pass
+
+    def test_handler_outlives_instances(self):
+        x11, xrandr = fake_libs()
+        make_lib(x11, xrandr).close()
+        handler = LibXrandr._error_handler
+        self.assertIsNotNone(handler)
+        make_lib(*fake_libs())
+        self.assertIs(LibXrandr._error_handler, handler)
+
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        sbc.__cache__.clear()
+        self.addCleanup(sbc.__cache__.clear)
+        for attr, value in (('_xlib', None), ('use_xlib', True)):
+            patcher = mock.patch.object(linux.XRandr, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_missing_libraries_are_not_remembered(self):
+        with mock.patch.object(LibXrandr, '_libraries', None), \
+                mock.patch('ctypes.util.find_library', return_value=None) as find_library:
+            for _ in range(2):
+                with self.assertRaises(OSError):
+                    LibXrandr._load_libraries()
+            self.assertEqual(find_library.call_count, 4)
+            self.assertIsNone(LibXrandr._libraries)
+
+    def test_display_is_retried(self):
+        lib = mock.Mock()
+        with mock.patch.object(linux, 'LibXrandr', side_effect=[OSError('cannot open display'), lib]) as create:
+            self.assertIsNone(linux.XRandr._get_xlib())
+            # failures are only remembered briefly
+            self.assertIsNone(linux.XRandr._get_xlib())
+            self.assertEqual(create.call_count, 1)
+            sbc.__cache__.expire('xrandr_xlib_unavailable')
+            self.assertIs(linux.XRandr._get_xlib(), lib)
+            self.assertIs(linux.XRandr._get_xlib(), lib)
+            self.assertEqual(create.call_count, 2)
+
+
+@unittest.skipUnless(
+    shutil.which('Xvfb') and ctypes.util.find_library('X11') and ctypes.util.find_library('Xrandr'),
+    'requires Xvfb, libX11 and libXrandr'
+)
+class TestXvfb(unittest.TestCase):
+    display = ':97'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = subprocess.Popen(
+            ['Xvfb', cls.display, '-screen', '0', '1024x768x24', '+extension', 'RANDR'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        socket = f'/tmp/.X11-unix/X{cls.display[1:]}'
+        for _ in range(100):
+            if os.path.exists(socket):
+                break
+            time.sleep(0.05)
+        cls.lib = LibXrandr(cls.display)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.lib.close()
+        cls.server.terminate()
+        cls.server.wait()
+
+    def test_outputs(self):
+        outputs = self.lib.outputs()
+        self.assertTrue(outputs)
+        for output in outputs:
+            self.assertIsInstance(output['name'], str)
+
+    def test_brightness_round_trip(self):
+        crtc = next((i['crtc'] for i in self.lib.outputs() if i['crtc']), None)
+        if crtc is None:
+            self.skipTest('no active CRTC')
+        self.lib.set_brightness(crtc, 0.5)
+        self.assertAlmostEqual(self.lib.get_brightness(crtc), 0.5, places=2)
+        self.lib.set_brightness(crtc, 1)
+
+    def test_errors_are_trapped(self):
+        sentinel = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)(lambda d, e: 0)
+        self.lib.x11.XSetErrorHandler(sentinel)
+        with self.assertRaises(OSError):
+            self.lib.get_brightness(0x7fffffff)
+        # the handler that was in place before the request must be back
+        previous = self.lib.x11.XSetErrorHandler(None)
+        self.assertEqual(previous, ctypes.cast(sentinel, ctypes.c_void_p).value)
+
+
+if __name__ == '__main__':
+    unittest.main()
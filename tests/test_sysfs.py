@@ -0,0 +1,125 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('linux only')
+import screen_brightness_control as sbc  # noqa: E402
+from screen_brightness_control import linux  # noqa: E402
+
+EDID = '00ffffffffffff00' + '00' * 120
+
+
+class FakeSysFS(unittest.TestCase):
+    '''creates a fake `/sys/class/backlight` tree for each test'''
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        patcher = mock.patch.object(linux.SysFS, 'backlight_dir', self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sbc.__cache__.clear()
+        self.addCleanup(sbc.__cache__.clear)
+        self.addCleanup(linux.SysFS._close_handles)
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def add_device(self, name, brightness=50, max_brightness=100, device_type='raw', edid=None):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.join(path, 'device'))
+        for file, value in (('brightness', brightness), ('max_brightness', max_brightness), ('type', device_type)):
+            with open(os.path.join(path, file), 'w') as f:
+                f.write(f'{value}\n')
+        if edid is not None:
+            with open(os.path.join(path, 'device', 'edid'), 'wb') as f:
+                f.write(bytes.fromhex(edid))
+        return path
+
+    def read_brightness(self, path):
+        with open(os.path.join(path, 'brightness')) as f:
+            return int(f.read())
+
+
+class TestDiscovery(FakeSysFS):
+    def test_devices_are_listed(self):
+        path = self.add_device('intel_backlight', edid=EDID)
+        info = linux.SysFS.get_display_info()
+        self.assertEqual([i['path'] for i in info], [path])
+        self.assertEqual(info[0]['edid'], EDID)
+
+    def test_devices_without_edid_are_dropped_when_others_have_one(self):
+        path = self.add_device('amdgpu_bl0', edid=EDID)
+        self.add_device('acpi_video0', device_type='firmware')
+        self.assertEqual([i['path'] for i in linux.SysFS.get_display_info()], [path])
+
+    def test_only_the_preferred_type_is_listed_without_edids(self):
+        self.add_device('amdgpu_bl0', device_type='raw')
+        path = self.add_device('acpi_video0', device_type='firmware')
+        self.assertEqual([i['path'] for i in linux.SysFS.get_display_info()], [path])
+
+    def test_unwritable_devices_are_not_listed(self):
+        path = self.add_device('intel_backlight', edid=EDID)
+        brightness = os.path.join(path, 'brightness')
+        real_access = os.access
+        with mock.patch.object(linux.os, 'access', lambda p, m: False if p == brightness else real_access(p, m)):
+            self.assertEqual(linux.SysFS.get_display_info(), [])
+
+    def test_unwritable_devices_do_not_shadow_light(self):
+        path = self.add_device('intel_backlight', edid=EDID)
+        light = {
+            'name': 'intel_backlight', 'path': path, 'light_path': 'sysfs/backlight/intel_backlight',
+            'method': linux.Light, 'index': 0, 'model': None, 'serial': None,
+            'manufacturer': None, 'manufacturer_id': None, 'edid': EDID
+        }
+        brightness = os.path.join(path, 'brightness')
+        real_access = os.access
+        with mock.patch.object(linux.os, 'access', lambda p, m: False if p == brightness else real_access(p, m)), \
+                mock.patch.object(linux.XRandr, 'get_display_info', return_value=[]), \
+                mock.patch.object(linux.DDCUtil, 'get_display_info', return_value=[]), \
+                mock.patch.object(linux.Light, 'get_display_info', return_value=[light]):
+            self.assertEqual([i['method'] for i in linux.list_monitors_info()], [linux.Light])
+
+
+class TestBrightness(FakeSysFS):
+    def test_get_brightness(self):
+        self.add_device('intel_backlight', brightness=120, max_brightness=240)
+        self.assertEqual(linux.SysFS.get_brightness(), [50])
+
+    def test_set_brightness(self):
+        # a sysfs attribute is replaced as a whole when written to, but these fake files are
+        # overwritten in place, so the old and new values have the same number of digits
+        path = self.add_device('intel_backlight', brightness=240, max_brightness=480)
+        self.assertEqual(linux.SysFS.set_brightness(25, display=0), [25])
+        self.assertEqual(self.read_brightness(path), 120)
+
+
+class TestHandles(FakeSysFS):
+    def test_handles_are_not_closed_while_in_use(self):
+        path = self.add_device('intel_backlight')
+        in_use, release = threading.Event(), threading.Event()
+        results = []
+
+        def read(fd, max_brightness):
+            in_use.set()
+            release.wait(5)
+            return os.pread(fd, 32, 0)
+
+        reader = threading.Thread(target=lambda: results.append(linux.SysFS._with_handle(path, read)))
+        reader.start()
+        in_use.wait(5)
+        closer = threading.Thread(target=linux.SysFS._close_handles)
+        closer.start()
+        closer.join(0.1)
+        # the closing thread has to wait for the read to finish
+        self.assertTrue(closer.is_alive())
+        release.set()
+        reader.join(5)
+        closer.join(5)
+        self.assertEqual(results, [b'50\n'])
+        self.assertEqual(linux.SysFS._handles, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
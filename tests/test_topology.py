@@ -0,0 +1,89 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('linux only')
+from screen_brightness_control import linux  # noqa: E402
+
+
+class FakeDRM(unittest.TestCase):
+    '''creates a fake `/sys/class/drm` tree for each test'''
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        patcher = mock.patch.object(linux.TopologyCache, 'drm_dir', self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.connector = os.path.join(self.root, 'card0-DP-1')
+        os.makedirs(self.connector)
+        with open(os.path.join(self.connector, 'status'), 'w') as f:
+            f.write('connected\n')
+        with open(os.path.join(self.connector, 'edid'), 'wb') as f:
+            f.write(bytes.fromhex('00ffffffffffff00') + bytes(120))
+        self.set_bus(4)
+
+    def set_bus(self, bus_number):
+        link = os.path.join(self.connector, 'ddc')
+        if os.path.islink(link):
+            os.remove(link)
+        os.symlink(f'../../../i2c-{bus_number}', link)
+
+
+class TestFingerprint(FakeDRM):
+    def test_fingerprint_is_stable(self):
+        self.assertEqual(linux.TopologyCache.fingerprint(), linux.TopologyCache.fingerprint())
+
+    def test_ddc_bus_changes_the_fingerprint(self):
+        before = linux.TopologyCache.fingerprint()
+        self.set_bus(5)
+        self.assertNotEqual(linux.TopologyCache.fingerprint(), before)
+        self.set_bus(4)
+        self.assertEqual(linux.TopologyCache.fingerprint(), before)
+
+    def test_status_changes_the_fingerprint(self):
+        before = linux.TopologyCache.fingerprint()
+        with open(os.path.join(self.connector, 'status'), 'w') as f:
+            f.write('disconnected\n')
+        self.assertNotEqual(linux.TopologyCache.fingerprint(), before)
+
+    def test_no_drm(self):
+        with mock.patch.object(linux.TopologyCache, 'drm_dir', os.path.join(self.root, 'missing')):
+            self.assertIsNone(linux.TopologyCache.fingerprint())
+
+
+class TestDDCUtilCache(FakeDRM):
+    def setUp(self):
+        super().setUp()
+        for attr, value in (('enabled', True), ('path', os.path.join(self.root, 'topology.json'))):
+            patcher = mock.patch.object(linux.TopologyCache, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.monitor = {
+            'name': 'Dell U2719D', 'method': linux.DDCUtil, 'index': 0, 'model': 'U2719D', 'serial': 'ABC1234',
+            'manufacturer': 'Dell', 'manufacturer_id': 'DEL', 'edid': '00ffffffffffff00' + '00' * 120,
+            'i2c_bus': '/dev/i2c-4', 'bus_number': 4
+        }
+
+    def test_sysfs_results_are_cached(self):
+        with mock.patch.object(linux.DDCUtil, '_query_sysfs', return_value=[self.monitor]) as sysfs, \
+                mock.patch.object(linux.DDCUtil, '_query_buses', return_value=[]) as buses:
+            self.assertEqual(linux.DDCUtil._query_display_info(), [self.monitor])
+            self.assertEqual(linux.DDCUtil._query_display_info(), [self.monitor])
+        sysfs.assert_called_once()
+        buses.assert_not_called()
+
+    def test_probed_results_are_cached(self):
+        with mock.patch.object(linux.DDCUtil, '_query_sysfs', return_value=[]) as sysfs, \
+                mock.patch.object(linux.DDCUtil, '_query_buses', return_value=[self.monitor]) as buses:
+            linux.DDCUtil._query_display_info()
+            self.assertEqual(linux.DDCUtil._query_display_info(), [self.monitor])
+        sysfs.assert_called_once()
+        buses.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import os
+import re
+import sys
+import timeit
+import unittest
+
+if not sys.platform.startswith('linux'):
+    raise unittest.SkipTest('linux only')
+from screen_brightness_control import linux  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_fixture():
+    with open(os.path.join(FIXTURES, 'xrandr_verbose.txt'), 'r') as f:
+        return f.read()
+
+
+def large_output(copies, disconnected=True):
+    '''
+    repeats every output in the fixture, renaming them so that no interface is a prefix of another.
+    Disconnected outputs can be left out, because the legacy parser gives their properties to the output before them
+    '''
+    header, *outputs = re.split(r'\n(?=\S)', load_fixture().rstrip('\n'))
+    if not disconnected:
+        outputs = [i for i in outputs if i.split(' ', 2)[1] != 'disconnected']
+    lines = [header]
+    for count in range(copies):
+        for output in outputs:
+            interface = output.split(' ', 1)[0]
+            lines.append(f'{interface}-{count:03d}' + output[len(interface):])
+    return '\n'.join(lines) + '\n'
+
+
+def legacy_parse(output):
+    '''
+    the parser that `XRandr._parse_verbose` replaced, taking the output of `xrandr --verbose` as a string.
+    The connected interfaces it needs (which it got from a second call to xrandr) are read from the output
+    '''
+    def check_tmp(tmp):
+        if tmp != {}:
+            if tmp['serial'] is None or '\\x' not in tmp['serial']:
+                if 'line' in tmp:
+                    del tmp['line']
+                return True
+        return False
+
+    out = output.split('\n')
+    names = [i.split(' ')[0] for i in out if 'connected' in i and 'disconnected' not in i]
+    data = []
+    tmp = {}
+    count = 0
+    for i in out:
+        if i != '':
+            if i.startswith(tuple(names)):
+                if check_tmp(tmp):
+                    data.append(tmp)
+                tmp = {
+                    'interface': i.split(' ')[0],
+                    'name': i.split(' ')[0],
+                    'line': i,
+                    'method': linux.XRandr,
+                    'index': count,
+                    'model': None,
+                    'serial': None,
+                    'manufacturer': None,
+                    'manufacturer_id': None,
+                    'edid': None
+                }
+                count += 1
+            elif 'EDID:' in i:
+                st = out[out.index(tmp['line']):]
+                edid = []
+                for j in range(st.index(i) + 1, st.index(i) + 9):
+                    edid.append(st[j].replace('\t', '').replace(' ', ''))
+                edid = ''.join(edid)
+                tmp['edid'] = edid
+                name, serial = linux._EDID.parse_edid(edid)
+                tmp['name'] = name if name is not None else tmp['interface']
+                if name is not None:
+                    tmp['manufacturer'] = name.split(' ')[0]
+                    try:
+                        tmp['manufacturer_id'], tmp['manufacturer'] = linux._monitor_brand_lookup(tmp['manufacturer'])
+                    except Exception:
+                        tmp['manufacturer_id'] = None
+                    tmp['model'] = name.split(' ')[1]
+                    tmp['serial'] = serial
+            elif 'Brightness:' in i:
+                tmp['brightness'] = int(float(i.replace('Brightness:', '').replace(' ', '').replace('\t', '')) * 100)
+    if check_tmp(tmp):
+        data.append(tmp)
+    return data
+
+
+class TestParseVerbose(unittest.TestCase):
+    def test_fixture(self):
+        data = linux.XRandr._parse_verbose(load_fixture())
+        self.assertEqual([i['interface'] for i in data], ['eDP-1', 'DP-1', 'DP-2'])
+        self.assertEqual([i['brightness'] for i in data], [80, 100, 100])
+        self.assertEqual(data[1]['name'], 'Dell U2719D')
+        self.assertEqual(data[1]['manufacturer_id'], 'DEL')
+        # only the base block of an EDID with an extension is kept
+        self.assertEqual(len(data[1]['edid']), 256)
+        self.assertIsNone(data[2]['edid'])
+
+    def test_matches_legacy_parser(self):
+        for output in (large_output(1, disconnected=False), large_output(50, disconnected=False)):
+            self.assertEqual(linux.XRandr._parse_verbose(output), legacy_parse(output))
+
+    def test_large_output_benchmark(self):
+        output = large_output(100)
+        self.assertEqual(len(linux.XRandr._parse_verbose(output)), 300)
+        new = min(timeit.repeat(lambda: linux.XRandr._parse_verbose(output), number=3, repeat=3))
+        old = min(timeit.repeat(lambda: legacy_parse(output), number=3, repeat=3))
+        # the legacy parser re-scans the output for every EDID, so it falls further behind as the output grows
+        self.assertLess(new, old)
+
+
+if __name__ == '__main__':
+    unittest.main()